@@ -33,21 +33,25 @@ from .sdk.contracts.dtos.entities.fauna.fish import EntityFish
 from .sdk.contracts.dtos.entities.flora.grass import EntityGrass
 from .sdk.contracts.dtos.entities.flora.tree import EntityTree
 from .sdk.contracts.dtos.entities.funga.fungi import EntityFungi
+from .sdk.contracts.dtos.entities.partial import EntityPartial
 from .sdk.contracts.dtos.sdk.command_options import CommandOptions
 from .sdk.contracts.dtos.sdk.request_status_codes import RequestStatusCodes
 from .sdk.contracts.dtos.sdk.requests.chunk.chunk import ChunkRequest
 from .sdk.contracts.dtos.sdk.requests.chunk.create import ChunkCreateRequest
 from .sdk.contracts.dtos.sdk.requests.chunk.delete import ChunkDeleteRequest
+from .sdk.contracts.dtos.sdk.requests.chunk.fastforward import ChunkFastForwardRequest
 from .sdk.contracts.dtos.sdk.requests.chunk.get import ChunkGetRequest
 from .sdk.contracts.dtos.sdk.requests.chunk.patch import ChunkPatchRequest
 from .sdk.contracts.dtos.sdk.requests.chunk.quantum import ChunkQuantumRequest
 from .sdk.contracts.dtos.sdk.requests.entity.delete import EntityDeleteRequest
 from .sdk.contracts.dtos.sdk.requests.entity.entity import EntityRequest
 from .sdk.contracts.dtos.sdk.requests.entity.patch import EntityPatchRequest
+from .sdk.contracts.dtos.sdk.requests.tile.at import TileAtRequest
 from .sdk.contracts.dtos.sdk.requests.tile.delete import TileDeleteRequest
 from .sdk.contracts.dtos.sdk.requests.tile.get import TileGetRequest
 from .sdk.contracts.dtos.sdk.requests.tile.patch import TilePatchRequest
 from .sdk.contracts.dtos.sdk.requests.tile.tile import TileRequest
+from .sdk.contracts.dtos.sdk.requests.tile.window import TileWindowRequest
 from .sdk.contracts.dtos.sdk.requests.world.create import WorldCreateRequest
 from .sdk.contracts.dtos.sdk.requests.world.delete import WorldDeleteRequest
 from .sdk.contracts.dtos.sdk.requests.world.get import WorldGetRequest
@@ -65,6 +69,8 @@ from .sdk.contracts.dtos.sdk.wrapped_request import WrappedRequest
 from .sdk.contracts.dtos.tiles.abtract import AbstractTile
 from .sdk.contracts.dtos.tiles.address import Address
 from .sdk.contracts.dtos.tiles.chunk import Chunk
+from .sdk.contracts.dtos.tiles.grid import Grid
+from .sdk.contracts.dtos.tiles.partial import TilePartial
 from .sdk.contracts.dtos.tiles.tile import Tile
 from .sdk.contracts.dtos.tiles.world import World
 from .sdk.contracts.dtos.window import Window
@@ -83,4 +89,5 @@ from .sdk.contracts.types.connection import TileConnectionType
 from .sdk.contracts.types.dao_document import DaoDocumentType
 from .sdk.contracts.types.entity import EntityType
 from .sdk.contracts.types.sdk.request_verb import RequestVerbType
+from .sdk.contracts.types.storage_backend import StorageBackendType
 from .sdk.contracts.types.tile import TileType
@@ -197,8 +197,10 @@ class StateClient:
         success: bool = await self.chunk_patch_command.execute(request=request)
         return success
 
-    async def chunk_quantum(self, world_id: str, chunk_id: str, scope: ChunkQuantumType) -> None:
-        request: ChunkQuantumRequest = ChunkQuantumRequest(world_id=world_id, chunk_id=chunk_id, scope=scope)
+    async def chunk_quantum(self, world_id: str, chunk_id: str, scope: ChunkQuantumType, ticks: int = 1) -> None:
+        request: ChunkQuantumRequest = ChunkQuantumRequest(
+            world_id=world_id, chunk_id=chunk_id, scope=scope, ticks=ticks
+        )
         await self.chunk_quantum_command.execute(request=request)
 
     # world
@@ -5,9 +5,18 @@ from ...types.entity import EntityType
 
 class AbstractEntity(BaseModel):
     id: str
+
+    # parents
+    world_id: str | None = None
+    chunk_id: str | None = None
+    tile_id: str | None = None
+
     name: str | None = None
     rbac: dict = {}
     entity_type: EntityType = EntityType.UNKNOWN
 
     amount: float = 0
     state: int = 0
+
+    # chunk tick of the next state transition, `None` until scheduled (see `EntityFactory.quantum_events`)
+    due: int | None = None
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from ...types.entity import EntityType
+
+
+class EntityPartial(BaseModel):
+    """Projected Entity (parent tile and lifecycle fields only)"""
+
+    id: str
+    tile_id: str | None = None
+    entity_type: EntityType = EntityType.UNKNOWN
+
+    amount: float = 0
+    state: int = 0
+    due: int | None = None
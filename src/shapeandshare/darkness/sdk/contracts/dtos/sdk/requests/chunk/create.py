@@ -9,3 +9,6 @@ class ChunkCreateRequest(BaseModel):
     name: str | None = None
     dimensions: tuple[int, int]
     biome: TileType
+
+    # build the chunk (with its tiles and entities) in memory, then persist it in one bulk commit
+    bulk: bool = True
@@ -0,0 +1,5 @@
+from .chunk import ChunkRequest
+
+
+class ChunkFastForwardRequest(ChunkRequest):
+    ticks: int
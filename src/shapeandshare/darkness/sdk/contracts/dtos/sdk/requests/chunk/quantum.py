@@ -6,3 +6,6 @@ class ChunkQuantumRequest(ChunkRequest):
     world_id: str | None = None
     chunk_id: str | None = None
     scope: ChunkQuantumType
+
+    # ticks to advance by, more than one fast-forwards the entity lifecycles (the only scope which can be)
+    ticks: int = 1
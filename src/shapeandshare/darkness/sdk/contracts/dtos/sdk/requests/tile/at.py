@@ -0,0 +1,6 @@
+from ..chunk.chunk import ChunkRequest
+
+
+class TileAtRequest(ChunkRequest):
+    x: int
+    y: int
@@ -0,0 +1,6 @@
+from ....window import Window
+from ..chunk.chunk import ChunkRequest
+
+
+class TileWindowRequest(ChunkRequest):
+    window: Window
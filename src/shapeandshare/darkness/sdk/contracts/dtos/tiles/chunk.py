@@ -1,10 +1,23 @@
 from ...types.tile import TileType
 from .abtract import AbstractTile
+from .grid import Grid
 from .tile import Tile
 
 
 class Chunk(AbstractTile[str, Tile]):
+    world_id: str | None = None  # parent
+
     tile_type: TileType = TileType.CHUNK
     dimensions: tuple[int, int] | None = None
     biome: TileType | None = None
     origin: str | None = None  # what is tile id at (0,0) of the nXm dim land
+
+    # packed storage format, when set the tiles and entities live here rather than as their own documents
+    grid: Grid | None = None
+
+    # the tiles which may change on the next tick, as a packed row-major bitmask over the dimensions (see
+    # `pack_mask`), `None` when unknown (every tile is evaluated)
+    active: str | None = None
+
+    # entity passes run, the clock entity transitions are scheduled against
+    tick: int = 0
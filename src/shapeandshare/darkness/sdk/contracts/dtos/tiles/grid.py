@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+
+
+class Grid(BaseModel):
+    """
+    Packed chunk layout: every tile (and entity) of a chunk held in parallel arrays, row-major from the origin.
+
+    Byte arrays are base64 encoded uint8 codes, see `server/clients/grid.py` for the codec.
+    """
+
+    width: int
+    height: int
+
+    # one entry per tile, index = y * width + x
+    tile_ids: list[str] = []
+    tile_types: str = ""
+    # sparse, only the tiles which have them (by tile id)
+    tile_names: dict[str, str] = {}
+    tile_rbacs: dict[str, dict] = {}
+
+    # entities of tile `i` are `entity_offsets[i]:entity_offsets[i + 1]` of the entity arrays
+    entity_offsets: list[int] = []
+    entity_ids: list[str] = []
+    entity_types: str = ""
+    entity_states: str = ""
+    entity_amounts: list[float] = []
+    # empty when no entity is scheduled
+    entity_dues: list[int | None] = []
+    # sparse, only the entities which have them (by entity id)
+    entity_names: dict[str, str] = {}
+    entity_rbacs: dict[str, dict] = {}
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from ...types.connection import TileConnectionType
+from ...types.tile import TileType
+
+
+class TilePartial(BaseModel):
+    """Projected Tile (type, position and neighbors only)"""
+
+    id: str
+    tile_type: TileType = TileType.UNKNOWN
+    x: int | None = None
+    y: int | None = None
+    next: dict[TileConnectionType, str] = {}  # str=id
@@ -4,3 +4,11 @@ from .abtract import AbstractTile
 
 class Tile(AbstractTile[str, AbstractEntity]):
     """Basic Tile"""
+
+    # parents
+    world_id: str | None = None
+    chunk_id: str | None = None
+
+    # position within the chunk (1-based column and row)
+    x: int | None = None
+    y: int | None = None
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class StorageBackendType(str, Enum):
+    MONGODB = "mongodb"
+    MEMORY = "memory"
+    SQLITE = "sqlite"
@@ -1,11 +1,19 @@
 import logging
 import sys
 
+from ....sdk.common.config.environment import (
+    demand_env_var_as_bool,
+    demand_env_var_as_float,
+    demand_env_var_as_int,
+    get_env_var,
+)
 from ....sdk.contracts.errors.server.service import ServiceError
-from ...clients.dao import DaoClient, get_mongodb
+from ...clients.cache import DaoCache
+from ...clients.dao import DaoClient, get_storage
 from ...factories.chunk.flat import FlatChunkFactory
 from ...factories.entity.entity import EntityFactory
 from ...factories.world.world import WorldFactory
+from ...services.rng import SimulationRngService
 from ...services.state import StateService
 
 logger = logging.getLogger()
@@ -18,17 +26,45 @@ class ContextManager:
     @staticmethod
     def deferred_init():
         if ContextManager.state_service is None:
-            daoclient: DaoClient = DaoClient(database=get_mongodb())
+            # optional long-lived dao cache (per tick caches are always scoped by the state service)
+            cache: DaoCache | None = None
+            cache_size: int = (
+                demand_env_var_as_int(name="DARKNESS_DAO_CACHE_SIZE")
+                if get_env_var(name="DARKNESS_DAO_CACHE_SIZE")
+                else 0
+            )
+            if cache_size > 0:
+                cache_ttl: float | None = (
+                    demand_env_var_as_float(name="DARKNESS_DAO_CACHE_TTL")
+                    if get_env_var(name="DARKNESS_DAO_CACHE_TTL")
+                    else None
+                )
+                cache = DaoCache(max_size=cache_size, ttl=cache_ttl)
+            daoclient: DaoClient = DaoClient(storage=get_storage(), cache=cache)
 
             world_factory = WorldFactory(daoclient=daoclient)
-            entity_factory = EntityFactory(daoclient=daoclient)
+            # entity transitions are scheduled as discrete events unless disabled (then rolled for on every tick)
+            entity_events: bool = (
+                demand_env_var_as_bool(name="DARKNESS_ENTITY_EVENTS")
+                if get_env_var(name="DARKNESS_ENTITY_EVENTS")
+                else True
+            )
+            entity_factory = EntityFactory(daoclient=daoclient, events=entity_events)
             flatchunk_factory = FlatChunkFactory(daoclient=daoclient, entity_factory=entity_factory)
 
+            # optional simulation seed, for reproducible runs
+            seed: int | None = (
+                demand_env_var_as_int(name="DARKNESS_SIMULATION_SEED")
+                if get_env_var(name="DARKNESS_SIMULATION_SEED")
+                else None
+            )
+
             ContextManager.state_service = StateService(
                 daoclient=daoclient,
                 entity_factory=entity_factory,
                 world_factory=world_factory,
                 flatchunk_factory=flatchunk_factory,
+                rng=SimulationRngService(seed=seed),
             )
             logger.debug("[ContextManager] assigned new state service to context manager")
         else:
@@ -1,10 +1,13 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 
 import click
 import uvicorn
 from fastapi import FastAPI
+from typing_extensions import AsyncIterator
 
+from ....sdk.contracts.types.storage_backend import StorageBackendType
 from ..common.routers import metrics
 from .context import ContextManager
 from .routers import world, worlds
@@ -13,26 +16,75 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
+# pylint: disable=unused-argument
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[FastAPI]:
+    logger.debug("Starting lifespan")
+    await ContextManager.state_service.daoclient.create_indexes()
+    # documents written before parent ids were stamped are migrated before serving
+    backfilled: int = await ContextManager.state_service.daoclient.backfill_parents()
+    if backfilled > 0:
+        logger.info("[lifespan] stamped parent ids onto %s documents", backfilled)
+    yield
+    await ContextManager.state_service.daoclient.close()
+    logger.debug("Ending lifespan")
+
+
 # pylint: disable=too-many-arguments,no-value-for-parameter
 @click.command()
 @click.option("--hostname", type=click.STRING, default="0.0.0.0", help="monogdb host address to connect to")
 @click.option("--port", type=click.INT, default=8000, help="monogdb host port to connect to")
+@click.option(
+    "--storage-backend",
+    type=click.Choice([member.value for member in StorageBackendType]),
+    default=StorageBackendType.MONGODB.value,
+    help="document storage backend",
+)
+@click.option("--sqlite-path", type=click.STRING, default="darkness.db", help="sqlite database file (sqlite backend)")
 @click.option("--mongodb-hostname", type=click.STRING, default="0.0.0.0", help="monogdb host address to connect to")
 @click.option("--mongodb-port", type=click.INT, default=27017, help="monogdb host port to connect to")
 @click.option("--mongodb-database", type=click.STRING, default="darkness", help="monogdb database name")
+@click.option(
+    "--dao-cache-size", type=click.INT, default=0, help="long-lived dao document cache size (0 disables the cache)"
+)
+@click.option("--dao-cache-ttl", type=click.FLOAT, default=5.0, help="long-lived dao document cache ttl (seconds)")
+@click.option(
+    "--entity-events/--no-entity-events",
+    default=True,
+    help="schedule entity transitions as discrete events (or roll for them on every tick)",
+)
+@click.option("--simulation-seed", type=click.INT, default=None, help="simulation seed, for reproducible runs")
 @click.option("--log-level", type=click.STRING, default="INFO", help="log level (INFO, DEBUG, WARNING, ERROR, FATAL)")
 def main(
-    hostname: str, port: int, mongodb_hostname: str, mongodb_port: int, mongodb_database: str, log_level: str
+    hostname: str,
+    port: int,
+    storage_backend: str,
+    sqlite_path: str,
+    mongodb_hostname: str,
+    mongodb_port: int,
+    mongodb_database: str,
+    dao_cache_size: int,
+    dao_cache_ttl: float,
+    entity_events: bool,
+    simulation_seed: int | None,
+    log_level: str,
 ) -> None:
     logger.setLevel(logging.getLevelName(log_level))
 
+    os.environ["DARKNESS_STORAGE_BACKEND"] = storage_backend
+    os.environ["DARKNESS_SQLITE_PATH"] = sqlite_path
     os.environ["DARKNESS_MONGODB_HOST"] = mongodb_hostname
     os.environ["DARKNESS_MONGODB_PORT"] = str(mongodb_port)
     os.environ["DARKNESS_MONGODB_DATABASE"] = mongodb_database
+    os.environ["DARKNESS_DAO_CACHE_SIZE"] = str(dao_cache_size)
+    os.environ["DARKNESS_DAO_CACHE_TTL"] = str(dao_cache_ttl)
+    os.environ["DARKNESS_ENTITY_EVENTS"] = str(entity_events)
+    if simulation_seed is not None:
+        os.environ["DARKNESS_SIMULATION_SEED"] = str(simulation_seed)
     ContextManager.deferred_init()
 
     logger.info("[Main] starting")
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     logger.debug("[Main] adding metrics routes")
     app.include_router(metrics.router)
@@ -4,6 +4,7 @@ from .....sdk.contracts.dtos.entities.entity import Entity
 from .....sdk.contracts.dtos.sdk.requests.chunk.chunk import ChunkRequest
 from .....sdk.contracts.dtos.sdk.requests.chunk.create import ChunkCreateRequest
 from .....sdk.contracts.dtos.sdk.requests.chunk.delete import ChunkDeleteRequest
+from .....sdk.contracts.dtos.sdk.requests.chunk.fastforward import ChunkFastForwardRequest
 from .....sdk.contracts.dtos.sdk.requests.chunk.get import ChunkGetRequest
 from .....sdk.contracts.dtos.sdk.requests.chunk.patch import ChunkPatchRequest
 from .....sdk.contracts.dtos.sdk.requests.chunk.quantum import ChunkQuantumRequest
@@ -134,7 +135,17 @@ async def chunk_delete(world_id: str, chunk_id: str, parent: bool, cascade: bool
 @error_handler
 async def chunk_quantum(world_id: str, chunk_id: str, request: ChunkQuantumRequest) -> Response[bool]:
     chunk_request: ChunkRequest = ChunkRequest(world_id=world_id, chunk_id=chunk_id)
-    if request.scope == ChunkQuantumType.ALL:
+    if request.ticks < 1:
+        msg: str = f"ticks must be positive ({request.ticks})"
+        raise HTTPException(status_code=400, detail=msg)
+    if request.ticks > 1:
+        if request.scope != ChunkQuantumType.ENTITY:
+            msg: str = f"only the {ChunkQuantumType.ENTITY.value} scope can be fast-forwarded ({request.scope})"
+            raise HTTPException(status_code=400, detail=msg)
+        await ContextManager.state_service.chunk_fast_forward(
+            request=ChunkFastForwardRequest(world_id=world_id, chunk_id=chunk_id, ticks=request.ticks)
+        )
+    elif request.scope == ChunkQuantumType.ALL:
         await ContextManager.state_service.chunk_quantum(request=chunk_request)
     elif request.scope == ChunkQuantumType.ENTITY:
         await ContextManager.state_service.chunk_quantum_entity(request=chunk_request)
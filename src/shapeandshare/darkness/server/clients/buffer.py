@@ -0,0 +1,59 @@
+from ...sdk.contracts.types.dao_document import DaoDocumentType
+
+
+class DaoWriteBuffer:
+    """
+    Write-behind unit of work, coalescing partial (`$set`) patches per document until flushed.
+
+    Successive patches of the same document are merged (later values win), so a document touched many
+    times within a tick costs a single update when the buffer is flushed.
+
+    Attributes
+    ----------
+    merged: int
+        Number of patches folded into an already pending update.
+    flushed: int
+        Number of document updates handed off by `drain`.
+    """
+
+    def __init__(self) -> None:
+        self.merged: int = 0
+        self.flushed: int = 0
+        self._patches: dict[tuple[DaoDocumentType, str], dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._patches)
+
+    def merge(self, doc_type: DaoDocumentType, document_id: str, document: dict) -> None:
+        key: tuple[DaoDocumentType, str] = (doc_type, document_id)
+        if key in self._patches:
+            self.merged += 1
+            self._patches[key].update(document)
+        else:
+            self._patches[key] = dict(document)
+
+    def pending(self, doc_type: DaoDocumentType, document_id: str) -> dict | None:
+        return self._patches.get((doc_type, document_id))
+
+    def take(self, doc_type: DaoDocumentType, document_id: str) -> dict | None:
+        patch: dict | None = self._patches.pop((doc_type, document_id), None)
+        if patch is not None:
+            self.flushed += 1
+        return patch
+
+    def pending_ids(self, doc_type: DaoDocumentType) -> list[str]:
+        return [document_id for pending_type, document_id in self._patches if pending_type == doc_type]
+
+    def discard(self, doc_type: DaoDocumentType, document_id: str) -> None:
+        self._patches.pop((doc_type, document_id), None)
+
+    def drain(self) -> list[tuple[DaoDocumentType, str, dict]]:
+        patches: list[tuple[DaoDocumentType, str, dict]] = [
+            (doc_type, document_id, patch) for (doc_type, document_id), patch in self._patches.items()
+        ]
+        self._patches = {}
+        self.flushed += len(patches)
+        return patches
+
+    def stats(self) -> dict:
+        return {"pending": len(self._patches), "merged": self.merged, "flushed": self.flushed}
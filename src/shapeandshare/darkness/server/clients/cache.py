@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+
+from ...sdk.contracts.types.dao_document import DaoDocumentType
+
+
+class DaoCache:
+    """
+    Bounded LRU (with optional TTL) cache of raw documents, keyed by document type and id.
+
+    Documents are held as the raw dictionaries read from the store and are re-validated on every hit,
+    so callers can freely mutate what they are handed.
+
+    Attributes
+    ----------
+    max_size: int
+        The maximum number of documents held before the least recently used is evicted.
+    ttl: float | None
+        Seconds a document may be served for after it was read, `None` to hold until evicted or invalidated.
+    hits: int
+        Number of lookups served from the cache.
+    misses: int
+        Number of lookups which had to go to the store.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float | None = None) -> None:
+        self.max_size: int = max_size
+        self.ttl: float | None = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._documents: OrderedDict[tuple[DaoDocumentType, str], tuple[float, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, doc_type: DaoDocumentType, document_id: str) -> dict | None:
+        key: tuple[DaoDocumentType, str] = (doc_type, document_id)
+        entry: tuple[float, dict] | None = self._documents.get(key)
+
+        if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._documents[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._documents.move_to_end(key)
+        return entry[1]
+
+    def put(self, doc_type: DaoDocumentType, document: dict) -> None:
+        key: tuple[DaoDocumentType, str] = (doc_type, document["id"])
+        self._documents[key] = (time.monotonic(), document)
+        self._documents.move_to_end(key)
+        while len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+
+    def invalidate(self, doc_type: DaoDocumentType, document_id: str) -> None:
+        self._documents.pop((doc_type, document_id), None)
+
+    def invalidate_type(self, doc_type: DaoDocumentType) -> None:
+        for key in [key for key in self._documents if key[0] == doc_type]:
+            del self._documents[key]
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._documents), "hits": self.hits, "misses": self.misses}
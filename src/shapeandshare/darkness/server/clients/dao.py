@@ -1,122 +1,656 @@
+import copy
 import json
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from itertools import batched
 
 from pydantic import BaseModel
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from pymongo.database import Database
-from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+from typing_extensions import AsyncIterator
 
-from ...sdk.common.config.environment import demand_env_var, demand_env_var_as_int
+from ...sdk.common.config.environment import demand_env_var, get_env_var
 from ...sdk.common.utils import address_type, get_document_id_from_address
+from ...sdk.contracts.dtos.coordinate import Coordinate
 from ...sdk.contracts.dtos.entities.entity import Entity
 from ...sdk.contracts.dtos.tiles.address import Address
 from ...sdk.contracts.dtos.tiles.chunk import Chunk
 from ...sdk.contracts.dtos.tiles.tile import Tile
 from ...sdk.contracts.dtos.tiles.world import World
+from ...sdk.contracts.dtos.window import Window
 from ...sdk.contracts.errors.server.dao.doesnotexist import DaoDoesNotExistError
 from ...sdk.contracts.errors.server.dao.unknown import DaoUnknownError
 from ...sdk.contracts.types.dao_document import DaoDocumentType
+from ...sdk.contracts.types.storage_backend import StorageBackendType
+from .buffer import DaoWriteBuffer
+from .cache import DaoCache
+from .decoder import DocumentDecoder
+from .storage.abstract import AbstractStorage, StorageWrite
+from .storage.memory import MemoryStorage
+from .storage.mongo import MongoStorage, get_mongodb
+from .storage.query import apply_update
+from .storage.sqlite import SqliteStorage
 
+# Parent ids stamped onto each document type, outermost first (compound index key order)
+SCOPE_FIELDS: dict[DaoDocumentType, list[str]] = {
+    DaoDocumentType.WORLD: [],
+    DaoDocumentType.CHUNK: ["world_id"],
+    DaoDocumentType.TILE: ["world_id", "chunk_id"],
+    DaoDocumentType.ENTITY: ["world_id", "chunk_id", "tile_id"],
+}
 
-def get_mongodb() -> Database:
-    hostname: str = demand_env_var(name="DARKNESS_MONGODB_HOST")
-    port: int = demand_env_var_as_int(name="DARKNESS_MONGODB_PORT")
-    database: str = demand_env_var(name="DARKNESS_MONGODB_DATABASE")
-    return MongoClient(hostname, port)[database]
+# Further compound indexes, e.g. a tile is found at (world_id, chunk_id, x, y) by positional (`get_at`, `*_window`)
+# queries, and an entity by (world_id, chunk_id, due) by scheduled (`iter_due`) ones
+INDEX_FIELDS: dict[DaoDocumentType, list[list[str]]] = {
+    DaoDocumentType.TILE: [["world_id", "chunk_id", "x", "y"]],
+    DaoDocumentType.ENTITY: [["world_id", "chunk_id", "due"]],
+}
 
+# Model each document type is read back as (unless projected)
+MODELS: dict[DaoDocumentType, type[BaseModel]] = {
+    DaoDocumentType.WORLD: World,
+    DaoDocumentType.CHUNK: Chunk,
+    DaoDocumentType.TILE: Tile,
+    DaoDocumentType.ENTITY: Entity,
+}
+
+# Decoders are compiled once per model, on first use
+DECODERS: dict[type[BaseModel], DocumentDecoder] = {}
+
+# Cache bound by `DaoClient.cache_scope` (per request, per tick ..), takes precedence over `DaoClient.cache`
+scoped_cache: ContextVar[DaoCache | None] = ContextVar("scoped_cache", default=None)
+
+# Write-behind buffer bound by `DaoClient.write_behind` (per tick), `patch` calls are deferred into it
+scoped_buffer: ContextVar[DaoWriteBuffer | None] = ContextVar("scoped_buffer", default=None)
+
+
+def get_decoder(model: type[BaseModel]) -> DocumentDecoder:
+    if model not in DECODERS:
+        DECODERS[model] = DocumentDecoder(model=model)
+    return DECODERS[model]
+
+
+def get_storage() -> AbstractStorage:
+    backend: StorageBackendType = StorageBackendType(
+        get_env_var(name="DARKNESS_STORAGE_BACKEND") or StorageBackendType.MONGODB.value
+    )
+
+    if backend == StorageBackendType.MEMORY:
+        return MemoryStorage()
+
+    if backend == StorageBackendType.SQLITE:
+        return SqliteStorage(path=demand_env_var(name="DARKNESS_SQLITE_PATH"))
+
+    return MongoStorage(database=get_mongodb())
 
-class DaoClient(BaseModel):
-    database: Database
-    collections: dict[DaoDocumentType, Collection] = {}
 
-    def __init__(self, **kwargs) -> None:
-        super().__init__(**kwargs)
+# pylint: disable=too-many-public-methods
+class DaoClient(BaseModel):
+    storage: AbstractStorage
 
-        # our collections will match our document types
-        for member in DaoDocumentType:
-            # Create a collection for each document type
-            self.collections[DaoDocumentType[member.name]] = self.database[member.value]
+    # default number of documents per round trip, for the bulk (`*_multi`) writes and the streaming (`iter_*`) reads
+    batch_size: int = 1000
 
-            # We add a single column index on the business logic layer `id` for our lookups:
-            # db.<collection>.createIndex( { <field>: <sortOrder> } )
-            self.collections[DaoDocumentType[member.name]].create_index({"id": 1})
+    # optional long-lived read-through cache, shared by every caller of this client
+    cache: DaoCache | None = None
 
     class Config:
         arbitrary_types_allowed = True
 
+    async def create_indexes(self) -> None:
+        # Index creation is a round trip, so it can not live in __init__ and must be awaited on startup.
+        for doc_type in DaoDocumentType:
+            # We add a single column index on the business logic layer `id` for our lookups
+            await self.storage.create_index(doc_type=doc_type, fields=["id"])
+
+            # And a compound index on the parent ids, so scoped (`*_scoped`) queries are a single range scan
+            if len(SCOPE_FIELDS[doc_type]) > 0:
+                await self.storage.create_index(doc_type=doc_type, fields=SCOPE_FIELDS[doc_type])
+
+            # And the further ones, so positional and scheduled queries are too
+            for fields in INDEX_FIELDS.get(doc_type, []):
+                await self.storage.create_index(doc_type=doc_type, fields=fields)
+
+    async def backfill_parents(self) -> int:
+        # Stamps the parent ids onto documents written before they were (which scoped queries and cascades can not
+        # see), walking the `ids` of each parent level by level. Stamped documents are not matched, so once done
+        # it is a single pass over the parents. Returns the number of documents stamped.
+        stamped_count: int = 0
+        for parent_type, doc_type in (
+            (DaoDocumentType.WORLD, DaoDocumentType.CHUNK),
+            (DaoDocumentType.CHUNK, DaoDocumentType.TILE),
+            (DaoDocumentType.TILE, DaoDocumentType.ENTITY),
+        ):
+            projection: dict = {field: 1 for field in ["id", "ids", *SCOPE_FIELDS[parent_type]]}
+            stamps: dict[str, dict] = {}
+            async for parent in self.storage.find(
+                doc_type=parent_type, query={}, projection=projection, batch_size=self.batch_size
+            ):
+                stamp: dict = {field: parent.get(field) for field in SCOPE_FIELDS[parent_type]}
+                stamp[SCOPE_FIELDS[doc_type][-1]] = parent["id"]
+                for child_id in parent.get("ids", []):
+                    stamps[child_id] = stamp
+                if len(stamps) >= self.batch_size:
+                    stamped_count += await self._stamp(doc_type=doc_type, stamps=stamps)
+                    stamps = {}
+            stamped_count += await self._stamp(doc_type=doc_type, stamps=stamps)
+
+            self._invalidate(doc_type=doc_type)
+        return stamped_count
+
+    async def _stamp(self, doc_type: DaoDocumentType, stamps: dict[str, dict]) -> int:
+        # the parent ids of the unstamped documents among `stamps` (child id to parent ids)
+        if len(stamps) == 0:
+            return 0
+        legacy: list[str] = [
+            document["id"]
+            async for document in self.storage.find(
+                doc_type=doc_type,
+                query={"id": {"$in": list(stamps.keys())}, SCOPE_FIELDS[doc_type][-1]: None},
+                projection={"id": 1},
+            )
+        ]
+        return await self._write_grouped(
+            grouped={
+                doc_type: [
+                    StorageWrite(query={"id": document_id}, update={"$set": stamps[document_id]})
+                    for document_id in legacy
+                ]
+            },
+            batch_size=None,
+            ordered=False,
+        )
+
+    @staticmethod
+    def _scope_filter(address: Address, doc_type: DaoDocumentType) -> dict:
+        # e.g. a chunk address scoped to TILE becomes {"world_id": .., "chunk_id": ..}
+        scope: dict = {}
+        for field in SCOPE_FIELDS[doc_type]:
+            value: str | None = getattr(address, field)
+            if value is None:
+                break
+            scope[field] = value
+
+        if len(scope) == 0:
+            raise DaoUnknownError(f"address does not scope any {doc_type.value} documents")
+        return scope
+
+    @staticmethod
+    def _window_filter(address: Address, window: Window) -> dict:
+        # the tiles of a chunk within the (inclusive) window
+        return {
+            **DaoClient._scope_filter(address=address, doc_type=DaoDocumentType.TILE),
+            "x": {"$gte": window.min.x, "$lte": window.max.x},
+            "y": {"$gte": window.min.y, "$lte": window.max.y},
+        }
+
+    async def close(self) -> None:
+        await self.storage.close()
+
+    ### Cache ##################################
+
+    def active_cache(self) -> DaoCache | None:
+        scoped: DaoCache | None = scoped_cache.get()
+        return scoped if scoped is not None else self.cache
+
+    @asynccontextmanager
+    async def cache_scope(self, max_size: int = 100000, ttl: float | None = None) -> AsyncIterator[DaoCache]:
+        # Repeated reads within the scope (and any tasks it spawns) are served from a private cache
+        cache: DaoCache = DaoCache(max_size=max_size, ttl=ttl)
+        token = scoped_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            scoped_cache.reset(token)
+
+    def _invalidate(self, doc_type: DaoDocumentType, document_ids: list[str] | None = None) -> None:
+        # writes invalidate both the scoped and the long-lived cache, `None` drops every document of the type
+        for cache in (scoped_cache.get(), self.cache):
+            if cache is None:
+                continue
+            if document_ids is None:
+                cache.invalidate_type(doc_type=doc_type)
+            else:
+                for document_id in document_ids:
+                    cache.invalidate(doc_type=doc_type, document_id=document_id)
+
+    ### Write Behind ##################################
+
+    @asynccontextmanager
+    async def write_behind(self) -> AsyncIterator[DaoWriteBuffer]:
+        # Patches within the scope (and any tasks it spawns) are merged per document, and written as one
+        # unordered bulk write when the scope exits. Reads within the scope see the pending values.
+        # Should the scope raise, the pending patches are discarded. Nested scopes join the outermost one.
+        active: DaoWriteBuffer | None = scoped_buffer.get()
+        if active is not None:
+            yield active
+            return
+
+        buffer: DaoWriteBuffer = DaoWriteBuffer()
+        token = scoped_buffer.set(buffer)
+        try:
+            yield buffer
+            await self.flush()
+        finally:
+            scoped_buffer.reset(token)
+
+    async def flush(self, batch_size: int | None = None) -> int:
+        # commits the pending patches of the active write-behind scope (if any)
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        if buffer is None or len(buffer) == 0:
+            return 0
+
+        grouped: dict[DaoDocumentType, list[StorageWrite]] = {}
+        for doc_type, document_id, document in buffer.drain():
+            grouped.setdefault(doc_type, []).append(StorageWrite(query={"id": document_id}, update={"$set": document}))
+            self._invalidate(doc_type=doc_type, document_ids=[document_id])
+        return await self._write_grouped(grouped=grouped, batch_size=batch_size, ordered=False)
+
+    async def _settle(self, doc_type: DaoDocumentType, document_ids: list[str]) -> None:
+        # an immediate write must land after any pending patch of the same document
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        if buffer is None or len(buffer) == 0:
+            return
+        for document_id in document_ids:
+            document: dict | None = buffer.take(doc_type=doc_type, document_id=document_id)
+            if document is not None:
+                await self.storage.update_one(doc_type=doc_type, query={"id": document_id}, update={"$set": document})
+
+    @staticmethod
+    def _discard(doc_type: DaoDocumentType, document_ids: list[str]) -> None:
+        # pending patches of deleted documents are dropped
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        if buffer is None or len(buffer) == 0:
+            return
+        for document_id in document_ids:
+            buffer.discard(doc_type=doc_type, document_id=document_id)
+
+    @staticmethod
+    def _overlay(doc_type: DaoDocumentType, document: dict) -> dict:
+        # documents read within a write-behind scope carry its pending patches
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        if buffer is None or len(buffer) == 0:
+            return document
+        pending: dict | None = buffer.pending(doc_type=doc_type, document_id=document.get("id"))
+        if pending is None:
+            return document
+        return apply_update(document=copy.deepcopy(document), update={"$set": pending})
+
+    ### Single ##################################
+
     # Single document delete
-    async def delete(self, address: Address) -> DeleteResult:
+    async def delete(self, address: Address) -> int:
         doc_type = address_type(address)
         document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
-        return self.collections[doc_type].delete_one({"id": document_id})
+        DaoClient._discard(doc_type=doc_type, document_ids=[document_id])
+        self._invalidate(doc_type=doc_type, document_ids=[document_id])
+        return await self.storage.delete_one(doc_type=doc_type, query={"id": document_id})
+
+    @staticmethod
+    def _projection(projection: type[BaseModel] | None) -> dict | None:
+        # partial models name exactly the fields to move over the wire
+        if projection is None:
+            return None
+        return {"_id": 0, **{field: 1 for field in projection.model_fields}}
+
+    @staticmethod
+    def _decoder(doc_type: DaoDocumentType, projection: type[BaseModel] | None = None) -> DocumentDecoder:
+        model: type[BaseModel] | None = projection if projection is not None else MODELS.get(doc_type)
+        if model is None:
+            raise DaoUnknownError("invalid document type")
+        return get_decoder(model=model)
+
+    @staticmethod
+    def _validate(
+        doc_type: DaoDocumentType, document: dict, projection: type[BaseModel] | None = None
+    ) -> World | Chunk | Tile | Entity | BaseModel:
+        return DaoClient._decoder(doc_type=doc_type, projection=projection).decode(document)
 
     # single document get with typing!
-    async def get(self, address: Address) -> World | Chunk | Tile | Entity:
+    async def get(
+        self, address: Address, projection: type[BaseModel] | None = None
+    ) -> World | Chunk | Tile | Entity | BaseModel:
         doc_type: DaoDocumentType = address_type(address=address)
         document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
-        result: dict | None = self.collections[doc_type].find_one({"id": document_id})
+
+        cache: DaoCache | None = self.active_cache()
+        if cache is None:
+            result: dict | None = await self.storage.find_one(
+                doc_type=doc_type, query={"id": document_id}, projection=DaoClient._projection(projection)
+            )
+        else:
+            # the cache only holds whole documents, projections are applied on the way out
+            result: dict | None = cache.get(doc_type=doc_type, document_id=document_id)
+            if result is None:
+                result = await self.storage.find_one(doc_type=doc_type, query={"id": document_id})
+                if result is not None:
+                    cache.put(doc_type=doc_type, document=result)
 
         if result is None:
             raise DaoDoesNotExistError("no document found")
 
-        if doc_type == DaoDocumentType.ENTITY:
-            return Entity.model_validate(result)
+        return DaoClient._validate(
+            doc_type=doc_type, document=DaoClient._overlay(doc_type=doc_type, document=result), projection=projection
+        )
+
+    async def get_all(
+        self, doc_type: DaoDocumentType, projection: type[BaseModel] | None = None
+    ) -> list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]:
+        documents: list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel] = []
+        async for batch in self.iter_all(doc_type=doc_type, projection=projection):
+            documents.extend(batch)
+        return documents
+
+    async def get_multi(
+        self, addresses: list[Address], doc_type: DaoDocumentType, projection: type[BaseModel] | None = None
+    ) -> list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]:
+        documents: list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel] = []
+        async for batch in self.iter_multi(addresses=addresses, doc_type=doc_type, projection=projection):
+            documents.extend(batch)
+        return documents
 
-        if doc_type == DaoDocumentType.TILE:
-            return Tile.model_validate(result)
+    async def get_scoped(
+        self, address: Address, doc_type: DaoDocumentType, projection: type[BaseModel] | None = None
+    ) -> list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]:
+        # all documents of `doc_type` beneath `address`, e.g. every tile of a chunk
+        documents: list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel] = []
+        async for batch in self.iter_scoped(address=address, doc_type=doc_type, projection=projection):
+            documents.extend(batch)
+        return documents
 
-        if doc_type == DaoDocumentType.CHUNK:
-            return Chunk.model_validate(result)
+    ### Streaming ##################################
 
-        if doc_type == DaoDocumentType.WORLD:
-            return World.model_validate(result)
+    # The `iter_*` variants yield lists of at most `batch_size` documents, one cursor batch at a time,
+    # so callers that consume as they go never hold the whole result set.
 
-        raise DaoUnknownError("invalid document type")
+    async def _stream(
+        self, doc_type: DaoDocumentType, query: dict, projection: type[BaseModel] | None, batch_size: int | None
+    ) -> AsyncIterator[list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]]:
+        # each batch is decoded with a single call (see `DocumentDecoder`)
+        decoder: DocumentDecoder = DaoClient._decoder(doc_type=doc_type, projection=projection)
+        size: int = batch_size if batch_size else self.batch_size
+        results: list[dict] = []
+        async for result in self.storage.find(
+            doc_type=doc_type, query=query, projection=DaoClient._projection(projection), batch_size=size
+        ):
+            results.append(DaoClient._overlay(doc_type=doc_type, document=result))
+            if len(results) >= size:
+                yield decoder.decode_many(results)
+                results = []
+        if len(results) > 0:
+            yield decoder.decode_many(results)
 
-    async def get_all(self, doc_type: DaoDocumentType) -> list[World] | list[Chunk] | list[Tile] | list[Entity]:
-        results = self.collections[doc_type].find()
-        documents: list[World] | list[Chunk] | list[Tile] | list[Entity] = []
-        for result in results:
-            if doc_type == DaoDocumentType.ENTITY:
-                documents.append(Entity.model_validate(result))
-            elif doc_type == DaoDocumentType.TILE:
-                documents.append(Tile.model_validate(result))
-            elif doc_type == DaoDocumentType.CHUNK:
-                documents.append(Chunk.model_validate(result))
-            elif doc_type == DaoDocumentType.WORLD:
-                documents.append(World.model_validate(result))
-            else:
-                raise DaoUnknownError("invalid document type")
-        return documents
+    async def iter_all(
+        self, doc_type: DaoDocumentType, projection: type[BaseModel] | None = None, batch_size: int | None = None
+    ) -> AsyncIterator[list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]]:
+        async for batch in self._stream(doc_type=doc_type, query={}, projection=projection, batch_size=batch_size):
+            yield batch
 
-    async def get_multi(
-        self, addresses: list[Address], doc_type: DaoDocumentType
-    ) -> list[World] | list[Chunk] | list[Tile] | list[Entity]:
+    async def iter_multi(
+        self,
+        addresses: list[Address],
+        doc_type: DaoDocumentType,
+        projection: type[BaseModel] | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]]:
         doc_ids: list = []
         for address in addresses:
             document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
             doc_ids.append(document_id)
-        results = self.collections[doc_type].find({"id": {"$in": doc_ids}})
-        documents: list[World] | list[Chunk] | list[Tile] | list[Entity] = []
-        for result in results:
-            if doc_type == DaoDocumentType.ENTITY:
-                documents.append(Entity.model_validate(result))
-            elif doc_type == DaoDocumentType.TILE:
-                documents.append(Tile.model_validate(result))
-            elif doc_type == DaoDocumentType.CHUNK:
-                documents.append(Chunk.model_validate(result))
-            elif doc_type == DaoDocumentType.WORLD:
-                documents.append(World.model_validate(result))
-            else:
-                raise DaoUnknownError("invalid document type")
+
+        cache: DaoCache | None = self.active_cache()
+        if cache is None:
+            async for batch in self._stream(
+                doc_type=doc_type, query={"id": {"$in": doc_ids}}, projection=projection, batch_size=batch_size
+            ):
+                yield batch
+            return
+
+        # serve what we can from the cache, and only go to the store for the remainder
+        decoder: DocumentDecoder = DaoClient._decoder(doc_type=doc_type, projection=projection)
+        size: int = batch_size if batch_size else self.batch_size
+        results: list[dict] = []
+        missing_doc_ids: list = []
+        for document_id in dict.fromkeys(doc_ids):
+            result: dict | None = cache.get(doc_type=doc_type, document_id=document_id)
+            if result is None:
+                missing_doc_ids.append(document_id)
+                continue
+            results.append(DaoClient._overlay(doc_type=doc_type, document=result))
+            if len(results) >= size:
+                yield decoder.decode_many(results)
+                results = []
+
+        if len(missing_doc_ids) > 0:
+            async for result in self.storage.find(
+                doc_type=doc_type, query={"id": {"$in": missing_doc_ids}}, batch_size=size
+            ):
+                cache.put(doc_type=doc_type, document=result)
+                results.append(DaoClient._overlay(doc_type=doc_type, document=result))
+                if len(results) >= size:
+                    yield decoder.decode_many(results)
+                    results = []
+
+        if len(results) > 0:
+            yield decoder.decode_many(results)
+
+    async def iter_scoped(
+        self,
+        address: Address,
+        doc_type: DaoDocumentType,
+        projection: type[BaseModel] | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[World] | list[Chunk] | list[Tile] | list[Entity] | list[BaseModel]]:
+        async for batch in self._stream(
+            doc_type=doc_type,
+            query=DaoClient._scope_filter(address=address, doc_type=doc_type),
+            projection=projection,
+            batch_size=batch_size,
+        ):
+            yield batch
+
+    ### Positional ##################################
+
+    async def get_at(
+        self, address: Address, coordinate: Coordinate, projection: type[BaseModel] | None = None
+    ) -> Tile | BaseModel:
+        # the tile at a position of the chunk `address`, one indexed lookup rather than a walk from the origin
+        query: dict = {
+            **DaoClient._scope_filter(address=address, doc_type=DaoDocumentType.TILE),
+            "x": coordinate.x,
+            "y": coordinate.y,
+        }
+        result: dict | None = await self.storage.find_one(
+            doc_type=DaoDocumentType.TILE, query=query, projection=DaoClient._projection(projection)
+        )
+        if result is None:
+            raise DaoDoesNotExistError("no document found")
+
+        return DaoClient._validate(
+            doc_type=DaoDocumentType.TILE,
+            document=DaoClient._overlay(doc_type=DaoDocumentType.TILE, document=result),
+            projection=projection,
+        )
+
+    async def get_window(
+        self, address: Address, window: Window, projection: type[BaseModel] | None = None
+    ) -> list[Tile] | list[BaseModel]:
+        documents: list[Tile] | list[BaseModel] = []
+        async for batch in self.iter_window(address=address, window=window, projection=projection):
+            documents.extend(batch)
         return documents
 
-    async def post(self, address: Address, document: World | Chunk | Tile | Entity) -> InsertOneResult:
+    async def iter_window(
+        self,
+        address: Address,
+        window: Window,
+        projection: type[BaseModel] | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[Tile] | list[BaseModel]]:
+        # the tiles of the chunk `address` within the window, a single range scan of the positional index
+        async for batch in self._stream(
+            doc_type=DaoDocumentType.TILE,
+            query=DaoClient._window_filter(address=address, window=window),
+            projection=projection,
+            batch_size=batch_size,
+        ):
+            yield batch
+
+    ### Scheduled ##################################
+
+    async def iter_due(
+        self,
+        address: Address,
+        tick: int,
+        projection: type[BaseModel] | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[Entity] | list[BaseModel]]:
+        # the entities of the chunk `address` due by `tick`, then those not yet scheduled (no `due`),
+        # each a range scan of the schedule index
+        scope: dict = {"world_id": address.world_id, "chunk_id": address.chunk_id}
+        for query in ({**scope, "due": {"$lte": tick}}, {**scope, "due": None}):
+            async for batch in self._stream(
+                doc_type=DaoDocumentType.ENTITY, query=query, projection=projection, batch_size=batch_size
+            ):
+                yield batch
+
+    async def post(self, address: Address, document: World | Chunk | Tile | Entity) -> None:
         doc_type: DaoDocumentType = address_type(address=address)
-        return self.collections[doc_type].insert_one(json.loads(document.model_dump_json()))
+        await self._settle(doc_type=doc_type, document_ids=[document.id])
+        self._invalidate(doc_type=doc_type, document_ids=[document.id])
+        await self.storage.insert_one(doc_type=doc_type, document=json.loads(document.model_dump_json()))
 
-    async def patch(self, address: Address, document: dict) -> UpdateResult:
+    async def patch(self, address: Address, document: dict) -> int:
         # document CAN NOT CONTAIN set variables.  It MUST be serialized before this call, so help you
         doc_type: DaoDocumentType = address_type(address=address)
         document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
-        return self.collections[doc_type].update_one(filter={"id": document_id}, update={"$set": document})
+
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        if buffer is not None:
+            # deferred until the write-behind scope flushes, nothing has been written yet
+            buffer.merge(doc_type=doc_type, document_id=document_id, document=document)
+            return 0
+
+        self._invalidate(doc_type=doc_type, document_ids=[document_id])
+        return await self.storage.update_one(doc_type=doc_type, query={"id": document_id}, update={"$set": document})
+
+    async def add_to_set(self, address: Address, field: str, values: list[str]) -> int:
+        # atomic `$addToSet` of child ids, the write is the size of `values` rather than of the whole set
+        doc_type: DaoDocumentType = address_type(address=address)
+        document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
+        await self._settle(doc_type=doc_type, document_ids=[document_id])
+        self._invalidate(doc_type=doc_type, document_ids=[document_id])
+        return await self.storage.update_one(
+            doc_type=doc_type, query={"id": document_id}, update={"$addToSet": {field: {"$each": values}}}
+        )
+
+    async def remove_from_set(self, address: Address, field: str, values: list[str]) -> int:
+        # atomic `$pull` of child ids
+        doc_type: DaoDocumentType = address_type(address=address)
+        document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
+        await self._settle(doc_type=doc_type, document_ids=[document_id])
+        self._invalidate(doc_type=doc_type, document_ids=[document_id])
+        return await self.storage.update_one(
+            doc_type=doc_type, query={"id": document_id}, update={"$pull": {field: {"$in": values}}}
+        )
+
+    ### Bulk ##################################
+
+    async def post_multi(
+        self,
+        documents: list[tuple[Address, World | Chunk | Tile | Entity]],
+        batch_size: int | None = None,
+        ordered: bool = False,
+    ) -> int:
+        # documents are grouped by collection and sent with `insert_many`, `batch_size` documents per round trip
+        grouped: dict[DaoDocumentType, list[dict]] = {}
+        for address, document in documents:
+            doc_type: DaoDocumentType = address_type(address=address)
+            grouped.setdefault(doc_type, []).append(json.loads(document.model_dump_json()))
+
+        inserted_count: int = 0
+        for doc_type, serialized_documents in grouped.items():
+            await self._settle(doc_type=doc_type, document_ids=[document["id"] for document in serialized_documents])
+            self._invalidate(doc_type=doc_type, document_ids=[document["id"] for document in serialized_documents])
+            for batch in batched(serialized_documents, batch_size if batch_size else self.batch_size):
+                inserted_count += await self.storage.insert_many(
+                    doc_type=doc_type, documents=list(batch), ordered=ordered
+                )
+        return inserted_count
+
+    async def bulk_write(
+        self,
+        upserts: list[tuple[Address, World | Chunk | Tile | Entity]] | None = None,
+        patches: list[tuple[Address, dict]] | None = None,
+        batch_size: int | None = None,
+        ordered: bool = False,
+    ) -> int:
+        # Mixed whole document upserts and partial (`$set`) patches, grouped by collection.
+        # patches follow the same rule as `patch`: they CAN NOT CONTAIN set variables,
+        # and are likewise deferred within a write-behind scope.
+        grouped: dict[DaoDocumentType, list[StorageWrite]] = {}
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+
+        for address, document in upserts if upserts else []:
+            doc_type: DaoDocumentType = address_type(address=address)
+            document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
+            grouped.setdefault(doc_type, []).append(
+                StorageWrite(query={"id": document_id}, replacement=json.loads(document.model_dump_json()), upsert=True)
+            )
+            await self._settle(doc_type=doc_type, document_ids=[document_id])
+            self._invalidate(doc_type=doc_type, document_ids=[document_id])
+
+        for address, document in patches if patches else []:
+            doc_type: DaoDocumentType = address_type(address=address)
+            document_id: str = get_document_id_from_address(address=address, doc_type=doc_type)
+            if buffer is not None:
+                buffer.merge(doc_type=doc_type, document_id=document_id, document=document)
+                continue
+            grouped.setdefault(doc_type, []).append(StorageWrite(query={"id": document_id}, update={"$set": document}))
+            self._invalidate(doc_type=doc_type, document_ids=[document_id])
+
+        return await self._write_grouped(grouped=grouped, batch_size=batch_size, ordered=ordered)
+
+    async def _write_grouped(
+        self, grouped: dict[DaoDocumentType, list[StorageWrite]], batch_size: int | None, ordered: bool
+    ) -> int:
+        written_count: int = 0
+        for doc_type, operations in grouped.items():
+            for batch in batched(operations, batch_size if batch_size else self.batch_size):
+                written_count += await self.storage.bulk_write(
+                    doc_type=doc_type, operations=list(batch), ordered=ordered
+                )
+        return written_count
+
+    async def delete_multi(self, addresses: list[Address], batch_size: int | None = None) -> int:
+        grouped: dict[DaoDocumentType, list[str]] = {}
+        for address in addresses:
+            doc_type: DaoDocumentType = address_type(address=address)
+            grouped.setdefault(doc_type, []).append(get_document_id_from_address(address=address, doc_type=doc_type))
+
+        deleted_count: int = 0
+        for doc_type, doc_ids in grouped.items():
+            DaoClient._discard(doc_type=doc_type, document_ids=doc_ids)
+            self._invalidate(doc_type=doc_type, document_ids=doc_ids)
+            for batch in batched(doc_ids, batch_size if batch_size else self.batch_size):
+                deleted_count += await self.storage.delete_many(doc_type=doc_type, query={"id": {"$in": list(batch)}})
+        return deleted_count
+
+    async def delete_scoped(self, address: Address, doc_type: DaoDocumentType) -> int:
+        # all documents of `doc_type` beneath `address`, e.g. every entity of a chunk
+        scope: dict = DaoClient._scope_filter(address=address, doc_type=doc_type)
+
+        # pending patches of the documents within the scope are dropped
+        buffer: DaoWriteBuffer | None = scoped_buffer.get()
+        pending_ids: list[str] = buffer.pending_ids(doc_type=doc_type) if buffer is not None else []
+        if len(pending_ids) > 0:
+            DaoClient._discard(
+                doc_type=doc_type,
+                document_ids=[
+                    document["id"]
+                    async for document in self.storage.find(
+                        doc_type=doc_type, query={**scope, "id": {"$in": pending_ids}}, projection={"id": 1}
+                    )
+                ],
+            )
+
+        self._invalidate(doc_type=doc_type)
+        return await self.storage.delete_many(doc_type=doc_type, query=scope)
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, TypeAdapter
+
+
+class DocumentDecoder:
+    """
+    Precompiled decoder for documents read back from our own store.
+
+    The list validator is built once per model, and a whole cursor batch is decoded with a single call into
+    pydantic-core rather than one `model_validate` per document. (`model_construct` skips validation, but is
+    implemented in python and is slower than the compiled validator for our models.)
+
+    Attributes
+    ----------
+    model: type[BaseModel]
+        The model to decode into.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model: type[BaseModel] = model
+        self._adapter: TypeAdapter = TypeAdapter(list[model])
+
+    def decode(self, document: dict) -> BaseModel:
+        return self.model.model_validate(document)
+
+    def decode_many(self, documents: list[dict]) -> list[BaseModel]:
+        return self._adapter.validate_python(documents)
@@ -0,0 +1,304 @@
+"""Codec between the per-tile document layout of a chunk and its packed `Grid` form."""
+
+import base64
+
+import numpy as np
+
+from ...sdk.contracts.dtos.entities.entity import Entity
+from ...sdk.contracts.dtos.tiles.grid import Grid
+from ...sdk.contracts.dtos.tiles.partial import TilePartial
+from ...sdk.contracts.dtos.tiles.tile import Tile
+from ...sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+from ...sdk.contracts.types.connection import TileConnectionType
+from ...sdk.contracts.types.entity import EntityType
+from ...sdk.contracts.types.tile import TileType
+
+# uint8 codes of the packed arrays, append only (the position is the code)
+TILE_CODES: list[TileType] = [
+    TileType.UNKNOWN,
+    TileType.OCEAN,
+    TileType.WATER,
+    TileType.SHORE,
+    TileType.DIRT,
+    TileType.ROCK,
+    TileType.GRASS,
+    TileType.FOREST,
+    TileType.WORLD,
+    TileType.CHUNK,
+]
+ENTITY_CODES: list[EntityType] = [
+    EntityType.UNKNOWN,
+    EntityType.GRASS,
+    EntityType.TREE,
+    EntityType.FISH,
+    EntityType.FUNGI,
+]
+
+
+def pack_codes(values: list, codes: list) -> str:
+    """
+    Packs enum members as base64 encoded uint8 codes.
+
+    Parameters
+    ----------
+    values: list
+        The enum members to pack.
+    codes: list
+        The code table (`TILE_CODES` or `ENTITY_CODES`).
+
+    Returns
+    -------
+    packed: str
+        The base64 encoded codes.
+    """
+
+    lookup: dict = {member: code for code, member in enumerate(codes)}
+    return base64.b64encode(bytes(lookup[value] for value in values)).decode("ascii")
+
+
+def unpack_codes(packed: str, codes: list) -> list:
+    """
+    Unpacks base64 encoded uint8 codes into enum members.
+
+    Parameters
+    ----------
+    packed: str
+        The base64 encoded codes.
+    codes: list
+        The code table (`TILE_CODES` or `ENTITY_CODES`).
+
+    Returns
+    -------
+    values: list
+        The enum members.
+    """
+
+    return [codes[code] for code in base64.b64decode(packed)]
+
+
+def pack_mask(mask: np.ndarray) -> str:
+    """
+    Packs a boolean grid as a base64 encoded row-major bitmask (trailing unset bytes are dropped).
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        2D boolean grid.
+
+    Returns
+    -------
+    packed: str
+        The base64 encoded bitmask, empty when no cell is set.
+    """
+
+    return base64.b64encode(np.packbits(mask.ravel()).tobytes().rstrip(b"\0")).decode("ascii")
+
+
+def unpack_mask(packed: str, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Unpacks a base64 encoded row-major bitmask into a boolean grid.
+
+    Parameters
+    ----------
+    packed: str
+        The base64 encoded bitmask.
+    shape: tuple[int, int]
+        The (height, width) of the grid.
+
+    Returns
+    -------
+    mask: np.ndarray
+        2D boolean grid.
+    """
+
+    bits: np.ndarray = np.unpackbits(np.frombuffer(base64.b64decode(packed), dtype=np.uint8)).astype(bool)
+    size: int = shape[0] * shape[1]
+    if len(bits) >= size + 8:
+        raise DaoUnknownError(f"bitmask does not fit a grid of shape {shape}")
+
+    mask: np.ndarray = np.zeros(size, dtype=bool)
+    mask[: min(size, len(bits))] = bits[:size]
+    return mask.reshape(shape)
+
+
+def walk_layout(origin: str, tiles: dict[str, Tile | TilePartial]) -> tuple[int, int, list[str]]:
+    """
+    Recovers the row-major layout of a per-tile chunk by walking `next` pointers from its origin.
+
+    Rows are followed RIGHT from the origin, and each row starts DOWN from the start of the previous one.
+
+    Parameters
+    ----------
+    origin: str
+        The id of the tile at the first position of the chunk.
+    tiles: dict[str, Tile | TilePartial]
+        Every tile of the chunk, by id.
+
+    Returns
+    -------
+    layout: tuple[int, int, list[str]]
+        The width, height and row-major tile ids.
+    """
+
+    tile_ids: list[str] = []
+    width: int | None = None
+    row_start: str | None = origin
+    while row_start is not None:
+        row: list[str] = []
+        tile_id: str | None = row_start
+        while tile_id is not None:
+            # e.g. a neighbor still pointing at a deleted tile
+            if tile_id not in tiles:
+                raise DaoUnknownError(f"chunk tiles reference a missing tile ({tile_id})")
+            row.append(tile_id)
+            tile_id = tiles[tile_id].next.get(TileConnectionType.RIGHT)
+
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            raise DaoUnknownError("chunk tiles do not form a rectangular grid")
+
+        tile_ids.extend(row)
+        row_start = tiles[row_start].next.get(TileConnectionType.DOWN)
+
+    if len(tile_ids) != len(tiles):
+        raise DaoUnknownError("chunk tiles are not all reachable from the origin")
+    return width, len(tile_ids) // width, tile_ids
+
+
+def grid_neighbors(tile_ids: list[str], width: int, height: int, index: int) -> dict[TileConnectionType, str]:
+    """
+    Returns the neighbors of a tile, as determined by its position in a row-major layout.
+
+    Parameters
+    ----------
+    tile_ids: list[str]
+        The row-major tile ids.
+    width: int
+        The number of columns.
+    height: int
+        The number of rows.
+    index: int
+        The position of the tile, y * width + x.
+
+    Returns
+    -------
+    neighbors: dict[TileConnectionType, str]
+        The `next` map of the tile.
+    """
+
+    x: int = index % width
+    y: int = index // width
+
+    neighbors: dict[TileConnectionType, str] = {}
+    if x > 0:
+        neighbors[TileConnectionType.LEFT] = tile_ids[index - 1]
+    if x < width - 1:
+        neighbors[TileConnectionType.RIGHT] = tile_ids[index + 1]
+    if y > 0:
+        neighbors[TileConnectionType.UP] = tile_ids[index - width]
+    if y < height - 1:
+        neighbors[TileConnectionType.DOWN] = tile_ids[index + width]
+    return neighbors
+
+
+def encode_grid(width: int, height: int, tile_ids: list[str], tiles: dict[str, Tile]) -> Grid:
+    """
+    Packs hydrated tiles (and the entities in their contents) into a grid.
+
+    Parameters
+    ----------
+    width: int
+        The number of columns.
+    height: int
+        The number of rows.
+    tile_ids: list[str]
+        The row-major tile ids.
+    tiles: dict[str, Tile]
+        The hydrated tiles, by id.
+
+    Returns
+    -------
+    grid: Grid
+        The packed chunk.
+    """
+
+    entity_offsets: list[int] = [0]
+    entities: list[Entity] = []
+    for tile_id in tile_ids:
+        entities.extend(tiles[tile_id].contents.values())
+        entity_offsets.append(len(entities))
+    dues: list[int | None] = [entity.due for entity in entities]
+
+    return Grid(
+        width=width,
+        height=height,
+        tile_ids=tile_ids,
+        tile_types=pack_codes(values=[tiles[tile_id].tile_type for tile_id in tile_ids], codes=TILE_CODES),
+        tile_names={tile_id: tiles[tile_id].name for tile_id in tile_ids if tiles[tile_id].name is not None},
+        tile_rbacs={tile_id: tiles[tile_id].rbac for tile_id in tile_ids if len(tiles[tile_id].rbac) > 0},
+        entity_offsets=entity_offsets,
+        entity_ids=[entity.id for entity in entities],
+        entity_types=pack_codes(values=[entity.entity_type for entity in entities], codes=ENTITY_CODES),
+        entity_states=base64.b64encode(bytes(entity.state for entity in entities)).decode("ascii"),
+        entity_amounts=[entity.amount for entity in entities],
+        entity_dues=dues if any(due is not None for due in dues) else [],
+        entity_names={entity.id: entity.name for entity in entities if entity.name is not None},
+        entity_rbacs={entity.id: entity.rbac for entity in entities if len(entity.rbac) > 0},
+    )
+
+
+def decode_grid(grid: Grid, world_id: str, chunk_id: str) -> dict[str, Tile]:
+    """
+    Unpacks a grid into hydrated tiles, with their positions and neighbors bound from grid position.
+
+    Parameters
+    ----------
+    grid: Grid
+        The packed chunk.
+    world_id: str
+        The parent world id stamped onto every tile and entity.
+    chunk_id: str
+        The parent chunk id stamped onto every tile and entity.
+
+    Returns
+    -------
+    tiles: dict[str, Tile]
+        The tiles (entities in their contents), by id in row-major order.
+    """
+
+    tile_types: list[TileType] = unpack_codes(packed=grid.tile_types, codes=TILE_CODES)
+    entity_types: list[EntityType] = unpack_codes(packed=grid.entity_types, codes=ENTITY_CODES)
+    entity_states: bytes = base64.b64decode(grid.entity_states)
+
+    tiles: dict[str, Tile] = {}
+    for index, tile_id in enumerate(grid.tile_ids):
+        entities: dict[str, Entity] = {}
+        for position in range(grid.entity_offsets[index], grid.entity_offsets[index + 1]):
+            entities[grid.entity_ids[position]] = Entity(
+                id=grid.entity_ids[position],
+                world_id=world_id,
+                chunk_id=chunk_id,
+                tile_id=tile_id,
+                entity_type=entity_types[position],
+                state=entity_states[position],
+                amount=grid.entity_amounts[position],
+                due=grid.entity_dues[position] if len(grid.entity_dues) > 0 else None,
+                name=grid.entity_names.get(grid.entity_ids[position]),
+                rbac=grid.entity_rbacs.get(grid.entity_ids[position], {}),
+            )
+
+        tiles[tile_id] = Tile(
+            id=tile_id,
+            world_id=world_id,
+            chunk_id=chunk_id,
+            name=grid.tile_names.get(tile_id),
+            rbac=grid.tile_rbacs.get(tile_id, {}),
+            tile_type=tile_types[index],
+            x=index % grid.width + 1,
+            y=index // grid.width + 1,
+            next=grid_neighbors(tile_ids=grid.tile_ids, width=grid.width, height=grid.height, index=index),
+            ids=set(entities.keys()),
+            contents=entities,
+        )
+    return tiles
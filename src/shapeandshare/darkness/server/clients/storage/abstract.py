@@ -0,0 +1,71 @@
+from abc import abstractmethod
+
+from pydantic import BaseModel
+from typing_extensions import AsyncIterator
+
+from ....sdk.contracts.types.dao_document import DaoDocumentType
+
+
+class StorageWrite(BaseModel):
+    """A single operation of a bulk write, either a partial `update` or a whole document `replacement`"""
+
+    query: dict
+    update: dict | None = None
+    replacement: dict | None = None
+    upsert: bool = False
+
+
+class AbstractStorage(BaseModel):
+    """
+    Document store behind the DaoClient, one collection per document type.
+
+    Queries, updates and projections are expressed in MongoDB document syntax. Backends other than
+    MongoDB implement the subset the DaoClient issues (see `query.py`).
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @abstractmethod
+    async def create_index(self, doc_type: DaoDocumentType, fields: list[str]) -> None:
+        """Ensures an (ascending, compound when more than one field) index exists"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Releases any held connections"""
+
+    @abstractmethod
+    async def find_one(self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None) -> dict | None:
+        """Returns the first matching document, or `None`"""
+
+    @abstractmethod
+    async def find(
+        self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Iterates every matching document, fetching `batch_size` documents per round trip (backend default if `None`)"""
+        # (an async generator, as are the implementations)
+        yield {}
+
+    @abstractmethod
+    async def insert_one(self, doc_type: DaoDocumentType, document: dict) -> None:
+        """Stores a single document"""
+
+    @abstractmethod
+    async def insert_many(self, doc_type: DaoDocumentType, documents: list[dict], ordered: bool = False) -> int:
+        """Stores many documents, returning the number inserted"""
+
+    @abstractmethod
+    async def update_one(self, doc_type: DaoDocumentType, query: dict, update: dict, upsert: bool = False) -> int:
+        """Updates the first matching document, returning the number modified (or upserted)"""
+
+    @abstractmethod
+    async def bulk_write(self, doc_type: DaoDocumentType, operations: list[StorageWrite], ordered: bool = False) -> int:
+        """Applies many writes, returning the number of documents modified (or upserted)"""
+
+    @abstractmethod
+    async def delete_one(self, doc_type: DaoDocumentType, query: dict) -> int:
+        """Deletes the first matching document, returning the number deleted"""
+
+    @abstractmethod
+    async def delete_many(self, doc_type: DaoDocumentType, query: dict) -> int:
+        """Deletes every matching document, returning the number deleted"""
@@ -0,0 +1,164 @@
+import copy
+
+from typing_extensions import AsyncIterator
+
+from ....sdk.contracts.types.dao_document import DaoDocumentType
+from .abstract import AbstractStorage, StorageWrite
+from .query import MISSING, apply_update, equalities, get_field, matches, project
+
+
+class MemoryStorage(AbstractStorage):
+    """
+    Dict backed, single process store, for single node simulation and tests.
+
+    Documents are keyed by `id`. Each index (and each of its leading prefixes) is kept as a posting
+    map from field values to document ids, so scoped queries do not scan the collection.
+    """
+
+    documents: dict[DaoDocumentType, dict[str, dict]] = {member: {} for member in DaoDocumentType}
+    indexes: dict[DaoDocumentType, list[tuple[str, ...]]] = {member: [] for member in DaoDocumentType}
+    postings: dict[tuple[DaoDocumentType, tuple[str, ...]], dict[tuple, set[str]]] = {}
+
+    @staticmethod
+    def _key(document: dict, fields: tuple[str, ...]) -> tuple:
+        return tuple(None if (value := get_field(document, field)) is MISSING else value for field in fields)
+
+    def _index(self, doc_type: DaoDocumentType, document: dict) -> None:
+        for fields in self.indexes[doc_type]:
+            key: tuple = MemoryStorage._key(document=document, fields=fields)
+            self.postings[(doc_type, fields)].setdefault(key, set()).add(document["id"])
+
+    def _unindex(self, doc_type: DaoDocumentType, document: dict) -> None:
+        for fields in self.indexes[doc_type]:
+            key: tuple = MemoryStorage._key(document=document, fields=fields)
+            posting: set[str] | None = self.postings[(doc_type, fields)].get(key)
+            if posting is not None:
+                posting.discard(document["id"])
+                if len(posting) == 0:
+                    del self.postings[(doc_type, fields)][key]
+
+    def _candidates(self, doc_type: DaoDocumentType, query: dict) -> list[str]:
+        collection: dict[str, dict] = self.documents[doc_type]
+
+        # primary key lookups
+        id_condition = query.get("id", MISSING)
+        if isinstance(id_condition, dict) and "$in" in id_condition:
+            return [document_id for document_id in dict.fromkeys(id_condition["$in"]) if document_id in collection]
+        if id_condition is not MISSING and not isinstance(id_condition, dict):
+            return [id_condition] if id_condition in collection else []
+
+        # otherwise the longest index prefix fully covered by equality conditions
+        terms: dict = equalities(query=query)
+        best: tuple[str, ...] = ()
+        for fields in self.indexes[doc_type]:
+            if len(fields) > len(best) and all(field in terms for field in fields):
+                best = fields
+        if len(best) > 0:
+            return list(self.postings[(doc_type, best)].get(tuple(terms[field] for field in best), ()))
+
+        return list(collection.keys())
+
+    def _matching(self, doc_type: DaoDocumentType, query: dict) -> list[dict]:
+        collection: dict[str, dict] = self.documents[doc_type]
+        return [
+            collection[document_id]
+            for document_id in self._candidates(doc_type=doc_type, query=query)
+            if matches(document=collection[document_id], query=query)
+        ]
+
+    def _store(self, doc_type: DaoDocumentType, document: dict) -> None:
+        previous: dict | None = self.documents[doc_type].get(document["id"])
+        if previous is not None:
+            self._unindex(doc_type=doc_type, document=previous)
+        self.documents[doc_type][document["id"]] = document
+        self._index(doc_type=doc_type, document=document)
+
+    def _update(self, doc_type: DaoDocumentType, document: dict, update: dict) -> None:
+        self._unindex(doc_type=doc_type, document=document)
+        apply_update(document=document, update=update)
+        self._index(doc_type=doc_type, document=document)
+
+    def _upsert(self, doc_type: DaoDocumentType, query: dict, update: dict) -> None:
+        document: dict = copy.deepcopy(equalities(query=query))
+        apply_update(document=document, update=update)
+        self._store(doc_type=doc_type, document=document)
+
+    def _remove(self, doc_type: DaoDocumentType, document: dict) -> None:
+        self._unindex(doc_type=doc_type, document=document)
+        del self.documents[doc_type][document["id"]]
+
+    async def create_index(self, doc_type: DaoDocumentType, fields: list[str]) -> None:
+        # `id` is the primary key
+        if fields == ["id"]:
+            return
+
+        # every leading prefix is indexed as well, matching how a compound index serves prefix queries
+        for length in range(1, len(fields) + 1):
+            prefix: tuple[str, ...] = tuple(fields[:length])
+            if prefix in self.indexes[doc_type]:
+                continue
+            self.indexes[doc_type].append(prefix)
+            self.postings[(doc_type, prefix)] = {}
+            for document in self.documents[doc_type].values():
+                key: tuple = MemoryStorage._key(document=document, fields=prefix)
+                self.postings[(doc_type, prefix)].setdefault(key, set()).add(document["id"])
+
+    async def close(self) -> None:
+        """Nothing to release"""
+
+    async def find_one(self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None) -> dict | None:
+        for document in self._matching(doc_type=doc_type, query=query):
+            return project(document=document, projection=projection)
+        return None
+
+    async def find(
+        self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        # documents are already in process, only the (projected) copies are made lazily
+        for document in self._matching(doc_type=doc_type, query=query):
+            yield project(document=document, projection=projection)
+
+    async def insert_one(self, doc_type: DaoDocumentType, document: dict) -> None:
+        self._store(doc_type=doc_type, document=copy.deepcopy(document))
+
+    async def insert_many(self, doc_type: DaoDocumentType, documents: list[dict], ordered: bool = False) -> int:
+        for document in documents:
+            self._store(doc_type=doc_type, document=copy.deepcopy(document))
+        return len(documents)
+
+    async def update_one(self, doc_type: DaoDocumentType, query: dict, update: dict, upsert: bool = False) -> int:
+        for document in self._matching(doc_type=doc_type, query=query):
+            self._update(doc_type=doc_type, document=document, update=update)
+            return 1
+        if upsert:
+            self._upsert(doc_type=doc_type, query=query, update=update)
+            return 1
+        return 0
+
+    async def bulk_write(self, doc_type: DaoDocumentType, operations: list[StorageWrite], ordered: bool = False) -> int:
+        written_count: int = 0
+        for operation in operations:
+            if operation.replacement is not None:
+                existing: list[dict] = self._matching(doc_type=doc_type, query=operation.query)
+                if len(existing) > 0 or operation.upsert:
+                    for document in existing[:1]:
+                        self._remove(doc_type=doc_type, document=document)
+                    self._store(doc_type=doc_type, document=copy.deepcopy(operation.replacement))
+                    written_count += 1
+            else:
+                written_count += await self.update_one(
+                    doc_type=doc_type, query=operation.query, update=operation.update, upsert=operation.upsert
+                )
+        return written_count
+
+    async def delete_one(self, doc_type: DaoDocumentType, query: dict) -> int:
+        for document in self._matching(doc_type=doc_type, query=query):
+            self._remove(doc_type=doc_type, document=document)
+            return 1
+        return 0
+
+    async def delete_many(self, doc_type: DaoDocumentType, query: dict) -> int:
+        documents: list[dict] = self._matching(doc_type=doc_type, query=query)
+        for document in documents:
+            self._remove(doc_type=doc_type, document=document)
+        return len(documents)
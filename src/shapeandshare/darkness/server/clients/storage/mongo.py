@@ -0,0 +1,81 @@
+from pymongo import AsyncMongoClient, ReplaceOne, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.results import BulkWriteResult, DeleteResult, InsertManyResult, UpdateResult
+from typing_extensions import AsyncIterator
+
+from ....sdk.common.config.environment import demand_env_var, demand_env_var_as_int
+from ....sdk.contracts.types.dao_document import DaoDocumentType
+from .abstract import AbstractStorage, StorageWrite
+
+
+def get_mongodb() -> AsyncDatabase:
+    hostname: str = demand_env_var(name="DARKNESS_MONGODB_HOST")
+    port: int = demand_env_var_as_int(name="DARKNESS_MONGODB_PORT")
+    database: str = demand_env_var(name="DARKNESS_MONGODB_DATABASE")
+    # The async client connects lazily, so it binds to the event loop of its first operation (uvicorn's)
+    return AsyncMongoClient(hostname, port)[database]
+
+
+class MongoStorage(AbstractStorage):
+    database: AsyncDatabase
+    collections: dict[DaoDocumentType, AsyncCollection] = {}
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        # our collections will match our document types
+        for member in DaoDocumentType:
+            # Create a collection for each document type
+            self.collections[DaoDocumentType[member.name]] = self.database[member.value]
+
+    async def create_index(self, doc_type: DaoDocumentType, fields: list[str]) -> None:
+        # db.<collection>.createIndex( { <field>: <sortOrder> } )
+        await self.collections[doc_type].create_index({field: 1 for field in fields})
+
+    async def close(self) -> None:
+        await self.database.client.close()
+
+    async def find_one(self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None) -> dict | None:
+        return await self.collections[doc_type].find_one(query, projection=projection)
+
+    async def find(
+        self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        # 0 leaves the cursor batch size to the server
+        cursor = self.collections[doc_type].find(
+            query, projection=projection, batch_size=batch_size if batch_size else 0
+        )
+        async for document in cursor:
+            yield document
+
+    async def insert_one(self, doc_type: DaoDocumentType, document: dict) -> None:
+        await self.collections[doc_type].insert_one(document)
+
+    async def insert_many(self, doc_type: DaoDocumentType, documents: list[dict], ordered: bool = False) -> int:
+        result: InsertManyResult = await self.collections[doc_type].insert_many(documents, ordered=ordered)
+        return len(result.inserted_ids)
+
+    async def update_one(self, doc_type: DaoDocumentType, query: dict, update: dict, upsert: bool = False) -> int:
+        result: UpdateResult = await self.collections[doc_type].update_one(filter=query, update=update, upsert=upsert)
+        return result.modified_count + (1 if result.upserted_id is not None else 0)
+
+    async def bulk_write(self, doc_type: DaoDocumentType, operations: list[StorageWrite], ordered: bool = False) -> int:
+        requests: list[ReplaceOne | UpdateOne] = []
+        for operation in operations:
+            if operation.replacement is not None:
+                requests.append(
+                    ReplaceOne(filter=operation.query, replacement=operation.replacement, upsert=operation.upsert)
+                )
+            else:
+                requests.append(UpdateOne(filter=operation.query, update=operation.update, upsert=operation.upsert))
+        result: BulkWriteResult = await self.collections[doc_type].bulk_write(requests, ordered=ordered)
+        return result.modified_count + result.upserted_count
+
+    async def delete_one(self, doc_type: DaoDocumentType, query: dict) -> int:
+        result: DeleteResult = await self.collections[doc_type].delete_one(query)
+        return result.deleted_count
+
+    async def delete_many(self, doc_type: DaoDocumentType, query: dict) -> int:
+        result: DeleteResult = await self.collections[doc_type].delete_many(query)
+        return result.deleted_count
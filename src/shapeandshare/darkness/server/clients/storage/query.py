@@ -0,0 +1,202 @@
+"""MongoDB document syntax subset, evaluated in process by the non-MongoDB storage backends."""
+
+import copy
+from typing import Any
+
+from ....sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+
+MISSING: object = object()
+
+COMPARISONS: dict = {
+    "$gt": lambda value, bound: value > bound,
+    "$gte": lambda value, bound: value >= bound,
+    "$lt": lambda value, bound: value < bound,
+    "$lte": lambda value, bound: value <= bound,
+}
+
+
+def get_field(document: dict, path: str) -> Any:
+    """
+    Returns the value at a (dotted) path of a document.
+
+    Parameters
+    ----------
+    document: dict
+        The document to read.
+    path: str
+        The field name, nested fields are separated by `.`
+
+    Returns
+    -------
+    value: Any
+        The field value, or `MISSING` when the path does not exist.
+    """
+
+    value: Any = document
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return MISSING
+        value = value[key]
+    return value
+
+
+def matches(document: dict, query: dict) -> bool:
+    """
+    Tests a document against a query.
+
+    Supports equality (`None` matching missing fields), `$in`, `$gt`, `$gte`, `$lt` and `$lte`.
+
+    Parameters
+    ----------
+    document: dict
+        The document to test.
+    query: dict
+        The query.
+
+    Returns
+    -------
+    matched: bool
+        Whether every query condition holds.
+    """
+
+    for path, condition in query.items():
+        value: Any = get_field(document=document, path=path)
+
+        if not isinstance(condition, dict):
+            if condition is None:
+                if value is not MISSING and value is not None:
+                    return False
+            elif value is MISSING or value != condition:
+                return False
+            continue
+
+        for operator, operand in condition.items():
+            if operator == "$in":
+                if value is MISSING or value not in operand:
+                    return False
+            elif operator in COMPARISONS:
+                if value is MISSING or value is None or not COMPARISONS[operator](value, operand):
+                    return False
+            else:
+                raise DaoUnknownError(f"unsupported query operator ({operator})")
+    return True
+
+
+def equalities(query: dict) -> dict:
+    """
+    Returns the plain equality conditions of a query (used for index lookups and upserts).
+
+    Parameters
+    ----------
+    query: dict
+        The query.
+
+    Returns
+    -------
+    equalities: dict
+        Field path to value for each equality condition.
+    """
+
+    return {path: condition for path, condition in query.items() if not isinstance(condition, dict)}
+
+
+def set_field(document: dict, path: str, value: Any) -> None:
+    """
+    Sets the value at a (dotted) path of a document, creating intermediate documents as needed.
+
+    Parameters
+    ----------
+    document: dict
+        The document to modify.
+    path: str
+        The field name, nested fields are separated by `.`
+    value: Any
+        The value to store.
+    """
+
+    keys: list[str] = path.split(".")
+    for key in keys[:-1]:
+        document = document.setdefault(key, {})
+    document[keys[-1]] = value
+
+
+def apply_update(document: dict, update: dict) -> dict:
+    """
+    Applies an update document in place.
+
+    Supports `$set`, `$addToSet` (with `$each`) and `$pull` (with `$in`).
+
+    Parameters
+    ----------
+    document: dict
+        The document to modify.
+    update: dict
+        The update.
+
+    Returns
+    -------
+    document: dict
+        The modified document.
+    """
+
+    for operator, fields in update.items():
+        if operator == "$set":
+            for path, value in fields.items():
+                set_field(document=document, path=path, value=copy.deepcopy(value))
+        elif operator == "$addToSet":
+            for path, value in fields.items():
+                members: list = _array_field(document=document, path=path)
+                for member in value["$each"] if isinstance(value, dict) and "$each" in value else [value]:
+                    if member not in members:
+                        members.append(copy.deepcopy(member))
+        elif operator == "$pull":
+            for path, value in fields.items():
+                members: Any = get_field(document=document, path=path)
+                if not isinstance(members, list):
+                    continue
+                pulled: list = value["$in"] if isinstance(value, dict) and "$in" in value else [value]
+                set_field(document=document, path=path, value=[member for member in members if member not in pulled])
+        else:
+            raise DaoUnknownError(f"unsupported update operator ({operator})")
+    return document
+
+
+def _array_field(document: dict, path: str) -> list:
+    # the array at `path`, created when missing (as `$addToSet` does)
+    members: Any = get_field(document=document, path=path)
+    if members is MISSING or members is None:
+        members = []
+        set_field(document=document, path=path, value=members)
+    if not isinstance(members, list):
+        raise DaoUnknownError(f"field is not an array ({path})")
+    return members
+
+
+def project(document: dict, projection: dict | None) -> dict:
+    """
+    Returns a copy of the document limited to the (inclusive) projection.
+
+    Parameters
+    ----------
+    document: dict
+        The document to project.
+    projection: dict | None
+        Field name to 1 for each included field, `None` for the whole document.
+
+    Returns
+    -------
+    document: dict
+        The projected copy.
+    """
+
+    if projection is None:
+        return copy.deepcopy(document)
+
+    projected: dict = {}
+    for path, include in projection.items():
+        if not include or path == "_id":
+            continue
+        value: Any = get_field(document=document, path=path)
+        if value is not MISSING:
+            set_field(document=projected, path=path, value=copy.deepcopy(value))
+    return projected
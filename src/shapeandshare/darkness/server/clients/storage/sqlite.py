@@ -0,0 +1,265 @@
+import asyncio
+import json
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from pydantic import Field
+from typing_extensions import AsyncIterator
+
+from ....sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+from ....sdk.contracts.types.dao_document import DaoDocumentType
+from .abstract import AbstractStorage, StorageWrite
+from .query import apply_update, equalities, project
+
+FIELD_PATTERN: re.Pattern = re.compile("^[A-Za-z_][A-Za-z0-9_]*(\\.[A-Za-z_][A-Za-z0-9_]*)*$")
+COMPARISONS: dict[str, str] = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _column(field: str) -> str:
+    if field == "id":
+        return "id"
+    if FIELD_PATTERN.match(field) is None:
+        raise DaoUnknownError(f"unsupported field name ({field})")
+    return f"json_extract(document, '$.{field}')"
+
+
+def _where(query: dict) -> tuple[str, list]:
+    # Every condition the DaoClient issues maps onto SQL, so no documents are filtered in process
+    clauses: list[str] = []
+    parameters: list = []
+    for field, condition in query.items():
+        column: str = _column(field=field)
+        if not isinstance(condition, dict):
+            if condition is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                parameters.append(condition)
+            continue
+
+        for operator, operand in condition.items():
+            if operator == "$in":
+                # a single json parameter, so large id lists do not run into the bound variable limit
+                clauses.append(f"{column} IN (SELECT value FROM json_each(?))")
+                parameters.append(json.dumps(list(operand)))
+            elif operator in COMPARISONS:
+                clauses.append(f"{column} {COMPARISONS[operator]} ?")
+                parameters.append(operand)
+            else:
+                raise DaoUnknownError(f"unsupported query operator ({operator})")
+    return (" AND ".join(clauses) if len(clauses) > 0 else "1"), parameters
+
+
+class SqliteStorage(AbstractStorage):
+    """
+    Embedded on-disk store: one SQLite table per document type holding JSON documents, in WAL mode.
+
+    Indexes are expression indexes over the JSON fields. All statements run on a single worker thread
+    which owns the connection, keeping the event loop free.
+    """
+
+    path: str
+    connection: sqlite3.Connection | None = None
+    executor: ThreadPoolExecutor = Field(default_factory=lambda: ThreadPoolExecutor(max_workers=1))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            for member in DaoDocumentType:
+                self.connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{member.value}" (id TEXT PRIMARY KEY, document TEXT NOT NULL)'
+                )
+        return self.connection
+
+    async def _run(self, function: Callable[[sqlite3.Connection], Any]) -> Any:
+        def task() -> Any:
+            connection: sqlite3.Connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                result: Any = function(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, task)
+
+    @staticmethod
+    def _select(
+        connection: sqlite3.Connection,
+        doc_type: DaoDocumentType,
+        query: dict,
+        limit: int | None = None,
+        after: str | None = None,
+    ):
+        where, parameters = _where(query=query)
+        statement: str = f'SELECT id, document FROM "{doc_type.value}" WHERE {where}'
+        if after is not None:
+            # keyset pagination, resumes a paged read after the last seen primary key
+            statement += " AND id > ? ORDER BY id"
+            parameters.append(after)
+        if limit is not None:
+            statement += f" LIMIT {int(limit)}"
+        return connection.execute(statement, parameters).fetchall()
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, doc_type: DaoDocumentType, document: dict) -> None:
+        connection.execute(
+            f'INSERT OR REPLACE INTO "{doc_type.value}" (id, document) VALUES (?, ?)',
+            (document["id"], json.dumps(document)),
+        )
+
+    @staticmethod
+    def _update(
+        connection: sqlite3.Connection, doc_type: DaoDocumentType, query: dict, update: dict, upsert: bool
+    ) -> int:
+        rows = SqliteStorage._select(connection=connection, doc_type=doc_type, query=query, limit=1)
+        if len(rows) > 0:
+            document: dict = apply_update(document=json.loads(rows[0][1]), update=update)
+            connection.execute(
+                f'UPDATE "{doc_type.value}" SET document = ? WHERE id = ?', (json.dumps(document), rows[0][0])
+            )
+            return 1
+        if upsert:
+            SqliteStorage._write(
+                connection=connection,
+                doc_type=doc_type,
+                document=apply_update(document=equalities(query), update=update),
+            )
+            return 1
+        return 0
+
+    @staticmethod
+    def _replace(
+        connection: sqlite3.Connection, doc_type: DaoDocumentType, query: dict, replacement: dict, upsert: bool
+    ) -> int:
+        rows = SqliteStorage._select(connection=connection, doc_type=doc_type, query=query, limit=1)
+        if len(rows) == 0 and not upsert:
+            return 0
+        if len(rows) > 0:
+            connection.execute(f'DELETE FROM "{doc_type.value}" WHERE id = ?', (rows[0][0],))
+        SqliteStorage._write(connection=connection, doc_type=doc_type, document=replacement)
+        return 1
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, doc_type: DaoDocumentType, query: dict, limit: int | None) -> int:
+        rows = SqliteStorage._select(connection=connection, doc_type=doc_type, query=query, limit=limit)
+        connection.executemany(f'DELETE FROM "{doc_type.value}" WHERE id = ?', [(row[0],) for row in rows])
+        return len(rows)
+
+    async def create_index(self, doc_type: DaoDocumentType, fields: list[str]) -> None:
+        # `id` is the primary key
+        if fields == ["id"]:
+            return
+
+        name: str = "_".join(["ix", doc_type.value, *[field.replace(".", "_") for field in fields]])
+        columns: str = ", ".join([_column(field=field) for field in fields])
+        await self._run(
+            lambda connection: connection.execute(
+                f'CREATE INDEX IF NOT EXISTS "{name}" ON "{doc_type.value}" ({columns})'
+            )
+        )
+
+    async def close(self) -> None:
+        def task() -> None:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+        await asyncio.get_running_loop().run_in_executor(self.executor, task)
+
+        # the worker thread goes with the connection, a fresh executor only starts one should the store be used again
+        self.executor.shutdown(wait=True)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    async def find_one(self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None) -> dict | None:
+        rows = await self._run(
+            lambda connection: SqliteStorage._select(connection=connection, doc_type=doc_type, query=query, limit=1)
+        )
+        if len(rows) == 0:
+            return None
+        return project(document=json.loads(rows[0][1]), projection=projection)
+
+    async def find(
+        self, doc_type: DaoDocumentType, query: dict, projection: dict | None = None, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        if not batch_size:
+            rows = await self._run(
+                lambda connection: SqliteStorage._select(connection=connection, doc_type=doc_type, query=query)
+            )
+            for row in rows:
+                yield project(document=json.loads(row[1]), projection=projection)
+            return
+
+        # one page per round trip, so only `batch_size` rows are held at a time
+        after: str = ""
+        while True:
+            rows = await self._run(
+                lambda connection, after=after: SqliteStorage._select(
+                    connection=connection, doc_type=doc_type, query=query, limit=batch_size, after=after
+                )
+            )
+            for row in rows:
+                yield project(document=json.loads(row[1]), projection=projection)
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    async def insert_one(self, doc_type: DaoDocumentType, document: dict) -> None:
+        await self._run(
+            lambda connection: SqliteStorage._write(connection=connection, doc_type=doc_type, document=document)
+        )
+
+    async def insert_many(self, doc_type: DaoDocumentType, documents: list[dict], ordered: bool = False) -> int:
+        def task(connection: sqlite3.Connection) -> int:
+            for document in documents:
+                SqliteStorage._write(connection=connection, doc_type=doc_type, document=document)
+            return len(documents)
+
+        return await self._run(task)
+
+    async def update_one(self, doc_type: DaoDocumentType, query: dict, update: dict, upsert: bool = False) -> int:
+        return await self._run(
+            lambda connection: SqliteStorage._update(
+                connection=connection, doc_type=doc_type, query=query, update=update, upsert=upsert
+            )
+        )
+
+    async def bulk_write(self, doc_type: DaoDocumentType, operations: list[StorageWrite], ordered: bool = False) -> int:
+        def task(connection: sqlite3.Connection) -> int:
+            written_count: int = 0
+            for operation in operations:
+                if operation.replacement is not None:
+                    written_count += SqliteStorage._replace(
+                        connection=connection,
+                        doc_type=doc_type,
+                        query=operation.query,
+                        replacement=operation.replacement,
+                        upsert=operation.upsert,
+                    )
+                else:
+                    written_count += SqliteStorage._update(
+                        connection=connection,
+                        doc_type=doc_type,
+                        query=operation.query,
+                        update=operation.update,
+                        upsert=operation.upsert,
+                    )
+            return written_count
+
+        return await self._run(task)
+
+    async def delete_one(self, doc_type: DaoDocumentType, query: dict) -> int:
+        return await self._run(
+            lambda connection: SqliteStorage._delete(connection=connection, doc_type=doc_type, query=query, limit=1)
+        )
+
+    async def delete_many(self, doc_type: DaoDocumentType, query: dict) -> int:
+        return await self._run(
+            lambda connection: SqliteStorage._delete(connection=connection, doc_type=doc_type, query=query, limit=None)
+        )
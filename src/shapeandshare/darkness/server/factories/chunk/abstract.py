@@ -1,28 +1,28 @@
-import asyncio
-import json
 import logging
-import re
-import uuid
 from abc import abstractmethod
 from asyncio import Queue
 
+import numpy as np
 from pydantic import BaseModel
 
-from ....sdk.common.utils import generate_random_float
-from ....sdk.contracts.dtos.entities.entity import Entity
 from ....sdk.contracts.dtos.tiles.address import Address
-from ....sdk.contracts.dtos.tiles.chunk import Chunk
+from ....sdk.contracts.dtos.tiles.partial import TilePartial
 from ....sdk.contracts.dtos.tiles.tile import Tile
-from ....sdk.contracts.dtos.tiles.world import World
 from ....sdk.contracts.dtos.window import Window
-from ....sdk.contracts.types.connection import TileConnectionType
 from ....sdk.contracts.types.dao_document import DaoDocumentType
 from ....sdk.contracts.types.tile import TileType
 from ...clients.dao import DaoClient
+from ...clients.grid import TILE_CODES, grid_neighbors, walk_layout
+from ...services.rng import active_rng
 from ..entity.entity import EntityFactory
+from .automaton import LIQUID_REACH
+from .terrain import UNREACHABLE
 
 logger = logging.getLogger()
 
+# tile types growth measures distances to
+LIQUIDS: tuple[TileType, ...] = (TileType.WATER, TileType.OCEAN)
+
 
 # pylint: disable=too-many-statements
 class AbstractChunkFactory(BaseModel):
@@ -34,16 +34,49 @@ class AbstractChunkFactory(BaseModel):
 
     @staticmethod
     async def producer(ids: set[str], queue: Queue):
-        for local_id in ids:
+        for local_id in sorted(ids):
             await queue.put(local_id)
 
     @abstractmethod
     async def create(self, world_id: str, name: str | None, dimensions: tuple[int, int], biome: TileType) -> str:
         """ """
 
+    async def load_grid(self, address: Address, origin: str | None) -> tuple[list[str], np.ndarray] | None:
+        # The row-major tile ids of a chunk, and its tile type codes as a 2D grid (`None` when it has no tiles)
+        if origin is None:
+            return None
+
+        tiles: dict[str, TilePartial] = {
+            tile.id: tile
+            for tile in await self.daoclient.get_scoped(
+                address=address, doc_type=DaoDocumentType.TILE, projection=TilePartial
+            )
+        }
+        if len(tiles) == 0:
+            return None
+
+        width, height, tile_ids = walk_layout(origin=origin, tiles=tiles)
+        types: np.ndarray = np.array(
+            [TILE_CODES.index(tiles[tile_id].tile_type) for tile_id in tile_ids], dtype=np.uint8
+        ).reshape((height, width))
+        return tile_ids, types
+
+    async def liquid_distances(self, address: Address) -> dict[TileType, int]:
+        # distance to the nearest tile of each liquid (`UNREACHABLE` beyond LIQUID_REACH tiles)
+        distances: dict[TileType, int] = {liquid: UNREACHABLE for liquid in LIQUIDS}
+        for distance, level in enumerate(await self.neighborhood(address=address, depth=LIQUID_REACH)):
+            for tile in level:
+                if tile.tile_type in distances:
+                    distances[tile.tile_type] = min(distances[tile.tile_type], distance)
+        return distances
+
+    async def touch(self, address: Address) -> None:
+        # the chunk's tiles were changed outside of a tick, its next tick evaluates every tile again
+        await self.daoclient.patch(address=address, document={"active": None})
+
     async def mutate_tile(self, address: Address, mutate: float, tile_type: TileType) -> None:
-        if generate_random_float() <= mutate:
-            target_tile: Tile = await self.daoclient.get(address=address)
+        if active_rng().random() <= mutate:
+            target_tile: TilePartial = await self.daoclient.get(address=address, projection=TilePartial)
             await self.convert_tile(address=address, source=target_tile.tile_type, target=tile_type)
 
     async def convert_tile(
@@ -55,10 +88,12 @@ class AbstractChunkFactory(BaseModel):
         if target_tile.tile_type == source:
             doc_patch: dict = {"tile_type": target}
             if clear_entities:
-                for child_id in target_tile.ids:
-                    await self.daoclient.delete(
-                        address=Address.model_validate({**address.model_dump(), "entity_id": child_id})
-                    )
+                await self.daoclient.delete_multi(
+                    addresses=[
+                        Address.model_validate({**address.model_dump(), "entity_id": child_id})
+                        for child_id in target_tile.ids
+                    ]
+                )
                 # update doc_patch
                 doc_patch["ids"] = []
 
@@ -67,63 +102,58 @@ class AbstractChunkFactory(BaseModel):
             # repopulate entities
             await self.entity_factory.generate(address=address)
 
-    async def adjacent_liquids(self, address: Address, depth: int) -> list[TileType]:
-        return await self.adjecent_to(address=address, types=[TileType.OCEAN, TileType.WATER], depth=depth)
-
-    async def adjacents(self, address: Address) -> list[Tile]:
-        target_tile: Tile = await self.daoclient.get(address=address)
-        adjecent_tile_addresses: list[Address] = []
-        for _, adjecent_id in target_tile.next.items():
-            adjecent_tile_addresses.append(Address.model_validate({**address.model_dump(), "tile_id": adjecent_id}))
-
-        adjecent_tiles: list[Tile] = await self.daoclient.get_multi(
-            addresses=adjecent_tile_addresses, doc_type=DaoDocumentType.TILE
-        )
-        return adjecent_tiles
-
-    async def adjacent_recursive(self, address: Address, depth: int) -> list[Tile]:
-        if depth < 0:
-            return []
-
-        adjacent_tiles = await self.adjacents(address=address)
-
-        if depth > 1:
-            child_tiles: list[Tile] = []
-            for adj_tile in adjacent_tiles:
-                current_children: list[Tile] = await self.adjacent_recursive(
-                    address=Address.model_validate({**address.model_dump(), "tile_id": adj_tile.id}), depth=depth - 1
-                )
-                child_tiles = child_tiles + current_children
-
-            adjacent_tiles = adjacent_tiles + child_tiles
-
-        tile_ids: set[str] = set()
-        deduped_tiles: list[Tile] = []
-        for tile in adjacent_tiles:
-            if tile.id not in tile_ids:
-                tile_ids.add(tile.id)
-                deduped_tiles.append(tile)
-        return deduped_tiles
+    async def neighborhood(self, address: Address, depth: int) -> list[list[TilePartial]]:
+        # Level-synchronous breadth first expansion, each frontier is fetched with a single batched read
+        # (served from memory within a cache scope). Returns the tiles grouped by distance, [0] being the tile
+        # itself, and stops early once every reachable tile has been visited.
+        origin: TilePartial = await self.daoclient.get(address=address, projection=TilePartial)
+        visited: set[str] = {origin.id}
+        levels: list[list[TilePartial]] = [[origin]]
+
+        for _ in range(depth):
+            frontier_ids: list[str] = []
+            for tile in levels[-1]:
+                for neighbor_id in tile.next.values():
+                    if neighbor_id not in visited:
+                        visited.add(neighbor_id)
+                        frontier_ids.append(neighbor_id)
+            if len(frontier_ids) == 0:
+                break
+
+            frontier: list[TilePartial] = await self.daoclient.get_multi(
+                addresses=[
+                    Address.model_validate({**address.model_dump(), "tile_id": frontier_id})
+                    for frontier_id in frontier_ids
+                ],
+                doc_type=DaoDocumentType.TILE,
+                projection=TilePartial,
+            )
+            levels.append(frontier)
+        return levels
+
+    async def adjacents(self, address: Address) -> list[TilePartial]:
+        levels: list[list[TilePartial]] = await self.neighborhood(address=address, depth=1)
+        return levels[1] if len(levels) > 1 else []
 
     async def adjecent_to(self, address: Address, types: list[TileType] | None, depth: int) -> list[TileType]:
-        adjecent_targets: list[TileType] = []
-        adjecent_tiles: list[Tile] = await self.adjacent_recursive(address=address, depth=depth)
-        for adjecent_tile in adjecent_tiles:
-            if adjecent_tile.tile_type in types:
-                adjecent_targets.append(adjecent_tile.tile_type)
-        return list(set(adjecent_targets))
+        # the distinct `types` found within `depth` tiles (excluding the tile itself)
+        adjecent_targets: set[TileType] = set()
+        for level in (await self.neighborhood(address=address, depth=depth))[1:]:
+            for adjecent_tile in level:
+                if adjecent_tile.tile_type in types:
+                    adjecent_targets.add(adjecent_tile.tile_type)
+        return list(adjecent_targets)
 
     async def _grow_dirt_tile(self, address: Address) -> None:
-        adjecent_liquids: list[TileType] = await self.adjacent_liquids(address=address, depth=1)
+        distances: dict[TileType, int] = await self.liquid_distances(address=address)
 
         # Grass does not grow directly next to the ocean
-        if TileType.OCEAN not in adjecent_liquids:
-            if TileType.WATER in adjecent_liquids:
+        if distances[TileType.OCEAN] != 1:
+            if distances[TileType.WATER] == 1:
                 await self.mutate_tile(address=address, mutate=0.01, tile_type=TileType.GRASS)
             else:
                 # Grass can not grow more than 3 tiles beyond a WATER source
-                liquid_tiles: list[TileType] = await self.adjecent_to(address=address, types=[TileType.WATER], depth=3)
-                if TileType.WATER in liquid_tiles:
+                if distances[TileType.WATER] <= LIQUID_REACH:
 
                     # Grass grows from other grass
                     adjecent_flora: list[TileType] = await self.adjecent_to(
@@ -151,7 +181,7 @@ class AbstractChunkFactory(BaseModel):
 
     async def tile_grow(self, address: Address) -> None:
         # get
-        target_tile: Tile = await self.daoclient.get(address=address)
+        target_tile: TilePartial = await self.daoclient.get(address=address, projection=TilePartial)
 
         # dirt -> grass
         if target_tile.tile_type == TileType.DIRT:
@@ -173,164 +203,32 @@ class AbstractChunkFactory(BaseModel):
             elif target_tile.tile_type == TileType.FOREST:
                 await self.mutate_tile(address=address, mutate=1, tile_type=TileType.GRASS)
 
-    async def brackish_tile(self, address: Address) -> None:
-        # Convert inner Ocean to Water Tiles
-
-        # See if we are next to another ocean tile
-        neighbors: list[TileType] = await self.adjecent_to(address=address, types=[TileType.OCEAN], depth=1)
-        if len(neighbors) < 1:
-            await self.convert_tile(address=address, source=TileType.OCEAN, target=TileType.WATER)
-
-        # TODO: are we an isolated ocean body? if so then we are water
-        #
-        # # 1. For each next that is liquid (recusively), can we get to the edge?
-        # #     # 1. Are we ocean? - if no then return False
-        # #     # 2. Are we edge? - if yes then return True
-        # #     # 3. then check my nexts
-        # #     # 4. Return False (not ocean)
-
-    async def erode_tile(self, address: Address) -> None:
-        # get
-        target_tile: Tile = await self.daoclient.get(address=address)
-
-        # shore erosion
-        if target_tile.tile_type not in [TileType.UNKNOWN, TileType.OCEAN, TileType.WATER, TileType.SHORE]:
-            adjecent_liquids: list[TileType] = await self.adjacent_liquids(address=address, depth=1)
-            # Apply erosion - rocks and be left by oceans, everything else becomes shore
-            if TileType.OCEAN in adjecent_liquids:
-                if target_tile.tile_type not in (TileType.ROCK, TileType.SHORE):
-                    # await self.daoclient.patch(address=address, document={"tile_type": TileType.SHORE})
-                    await self.convert_tile(address=address, source=target_tile.tile_type, target=TileType.SHORE)
-
-    async def gen_geo_bind(self, address: Address, conn_dir: TileConnectionType, target_tile_id: str) -> None:
-        # TODO: move to native mongodb to make this efficient ..
-        doc: World | Chunk | Tile | Entity = await self.daoclient.get(address=address)
-        doc.next[conn_dir] = target_tile_id
-        await self.daoclient.patch(address=address, document=json.loads(doc.model_dump_json()))
-
     async def generate_ocean_block(self, address: Address, window: Window):
-        tile_map: dict[str, str] = {}
-
-        async def flat_producer(window: Window, queue: Queue):
-            range_x_min: int = window.min.x - 1
-            range_x_max: int = window.max.x
-            range_y_min: int = window.min.x - 1
-            range_y_max: int = window.max.y
-
-            for x in range(range_x_min, range_x_max):
-                for y in range(range_y_min, range_y_max):
-                    local_x = x + 1
-                    local_y = y + 1
-                    tile_id: str = f"tile_{local_x}_{local_y}"
-                    await queue.put(tile_id)
-
-        # 1. fill a blank nXm area with ocean
-        async def step_one():
-            # get container
-            async def consumer(queue: Queue):
-                chunk: Chunk = await self.daoclient.get(address=address)
-
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    tile_map[local_tile_id] = str(uuid.uuid4())
-                    local_tile: Tile = Tile(id=tile_map[local_tile_id], tile_type=TileType.OCEAN)
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile.id})
-
-                    # create tile
-                    await self.daoclient.post(address=address_tile, document=local_tile)
-                    # msg: str = f"({local_tile_id}) brought into existence as {TileType.OCEAN}"
-                    # logger.debug(msg)
-
-                    # update
-                    chunk.ids.add(tile_map[local_tile_id])
-                    queue.task_done()
-
-                # Update the chunk --
-                # put -- store chunk update (tile addition)
-                document = {"ids": list(chunk.ids)}
-                # print(document)
-                await self.daoclient.patch(address=address, document=document)
-
-            queue = asyncio.Queue()
-            await asyncio.gather(flat_producer(window, queue), consumer(queue))
-
-        await step_one()
+        # lay the block out row-major, every tile's neighbors then follow from its (x, y) position
+        width: int = window.max.x - window.min.x + 1
+        height: int = window.max.y - window.min.y + 1
+        tile_ids: list[str] = [active_rng().new_id() for _ in range(width * height)]
+
+        # 1. fill a blank nXm area with ocean, bound to its neighbors on creation
+        new_tiles: list[tuple[Address, Tile]] = []
+        for index, tile_id in enumerate(tile_ids):
+            local_tile: Tile = Tile(
+                id=tile_id,
+                world_id=address.world_id,
+                chunk_id=address.chunk_id,
+                tile_type=TileType.OCEAN,
+                x=window.min.x + index % width,
+                y=window.min.y + index // width,
+                next=grid_neighbors(tile_ids=tile_ids, width=width, height=height, index=index),
+            )
+            address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile.id})
+            new_tiles.append((address_tile, local_tile))
+
+        # create tiles (batched)
+        await self.daoclient.post_multi(documents=new_tiles)
+
+        # Update the chunk -- (tile addition)
+        await self.daoclient.add_to_set(address=address, field="ids", values=tile_ids)
 
         # set origin tile on chunk
-        await self.daoclient.patch(address=address, document={"origin": tile_map["tile_1_1"]})
-
-        # 2. Connect everything together
-        async def step_two():
-            pattern: re.Pattern = re.compile("^tile_([a-zA-Z0-9-]+)_([a-zA-Z0-9-]+)$")
-
-            async def consumer(queue):
-                while not queue.empty():
-                    _local_tile_id: str = await queue.get()
-                    local_tile_id = tile_map[_local_tile_id]
-
-                    match = pattern.search(_local_tile_id)
-                    # tile_id: str = f"tile_{local_x}_{local_y}"
-                    local_x: int = int(match.group(1))
-                    local_y: int = int(match.group(2))
-
-                    # msg: str = f"binding ({local_tile_id}) physically to peers"
-                    # logger.debug(msg)
-
-                    # Bind LEFT
-                    _target_tile_id: str = f"tile_{local_x - 1}_{local_y}"
-                    if _target_tile_id in tile_map:
-                        target_tile_id = tile_map[_target_tile_id]
-                        address_tile: Address = Address.model_validate(
-                            {**address.model_dump(), "tile_id": local_tile_id}
-                        )
-                        await self.gen_geo_bind(
-                            address=address_tile,
-                            target_tile_id=target_tile_id,
-                            conn_dir=TileConnectionType.LEFT,
-                        )
-
-                    # Bind RIGHT
-                    _target_tile_id: str = f"tile_{local_x + 1}_{local_y}"
-                    if _target_tile_id in tile_map:
-                        target_tile_id = tile_map[_target_tile_id]
-                        address_tile: Address = Address.model_validate(
-                            {**address.model_dump(), "tile_id": local_tile_id}
-                        )
-                        await self.gen_geo_bind(
-                            address=address_tile,
-                            target_tile_id=target_tile_id,
-                            conn_dir=TileConnectionType.RIGHT,
-                        )
-
-                    # Bind UP
-                    _target_tile_id: str = f"tile_{local_x}_{local_y - 1}"
-                    if _target_tile_id in tile_map:
-                        target_tile_id = tile_map[_target_tile_id]
-                        address_tile: Address = Address.model_validate(
-                            {**address.model_dump(), "tile_id": local_tile_id}
-                        )
-                        await self.gen_geo_bind(
-                            address=address_tile,
-                            target_tile_id=target_tile_id,
-                            conn_dir=TileConnectionType.UP,
-                        )
-
-                    # Bind DOWN
-                    _target_tile_id: str = f"tile_{local_x}_{local_y + 1}"
-                    if _target_tile_id in tile_map:
-                        target_tile_id = tile_map[_target_tile_id]
-                        address_tile: Address = Address.model_validate(
-                            {**address.model_dump(), "tile_id": local_tile_id}
-                        )
-                        await self.gen_geo_bind(
-                            address=address_tile,
-                            target_tile_id=target_tile_id,
-                            conn_dir=TileConnectionType.DOWN,
-                        )
-
-                    queue.task_done()
-
-            queue = asyncio.Queue()
-            await asyncio.gather(flat_producer(window, queue), consumer(queue))
-
-        await step_two()
+        await self.daoclient.patch(address=address, document={"origin": tile_ids[0]})
@@ -0,0 +1,114 @@
+"""Tile quantum as a cellular automaton over a chunk's 2D grid of tile type codes (see `clients/grid.py`)."""
+
+import numpy as np
+
+from ....sdk.contracts.types.tile import TileType
+from ...clients.grid import TILE_CODES
+from .terrain import adjacent, distance_field
+
+OCEAN: int = TILE_CODES.index(TileType.OCEAN)
+WATER: int = TILE_CODES.index(TileType.WATER)
+DIRT: int = TILE_CODES.index(TileType.DIRT)
+GRASS: int = TILE_CODES.index(TileType.GRASS)
+FOREST: int = TILE_CODES.index(TileType.FOREST)
+
+# Grass can not grow more than 3 tiles beyond a WATER source
+LIQUID_REACH: int = 3
+
+# growth probabilities, per tile per tick
+GRASS_BY_WATER: float = 0.01
+GRASS_BY_FOREST: float = 0.005
+FOREST_BY_GRASS: float = 0.00125
+
+# neighbor types counted towards forest growth
+FOREST_NEIGHBORS: tuple[int, ...] = (WATER, GRASS, FOREST, OCEAN, DIRT)
+
+
+def _rules(types: np.ndarray, populated: np.ndarray) -> dict[str, np.ndarray]:
+    # the tiles each rule applies to, before any draws
+    near_ocean: np.ndarray = adjacent(types == OCEAN)
+    near_water: np.ndarray = adjacent(types == WATER)
+    near_dirt: np.ndarray = adjacent(types == DIRT)
+    near_forest: np.ndarray = adjacent(types == FOREST)
+    within_reach: np.ndarray = distance_field(sources=types == WATER, limit=LIQUID_REACH) <= LIQUID_REACH
+
+    neighbor_types: np.ndarray = np.zeros(types.shape, dtype=np.uint8)
+    for code in FOREST_NEIGHBORS:
+        neighbor_types += adjacent(types == code)
+
+    return {
+        "grass_by_water": (types == DIRT) & ~near_ocean & near_water,
+        "grass_by_forest": (types == DIRT) & ~near_ocean & ~near_water & within_reach & near_forest,
+        "forest_by_grass": (types == GRASS) & ~near_ocean & ~near_dirt & (neighbor_types > 1),
+        "barren": ~populated & ((types == GRASS) | (types == FOREST)),
+    }
+
+
+def eligible(types: np.ndarray, populated: np.ndarray) -> np.ndarray:
+    """
+    Marks the tiles which may change in the next generation (with some draw), every other tile is certain not to.
+
+    Parameters
+    ----------
+    types: np.ndarray
+        2D grid of tile type codes, (height, width).
+    populated: np.ndarray
+        2D boolean grid, whether each tile holds any entities.
+
+    Returns
+    -------
+    eligible: np.ndarray
+        2D boolean grid of the same shape.
+    """
+
+    rules: dict[str, np.ndarray] = _rules(types=types, populated=populated)
+    return rules["grass_by_water"] | rules["grass_by_forest"] | rules["forest_by_grass"] | rules["barren"]
+
+
+def tile_generation(types: np.ndarray, populated: np.ndarray, rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    Computes the next generation of a chunk's tiles from the previous one alone, so the result does not depend
+    on the order tiles are visited in.
+
+    Growth (`tile_grow`):
+    1. dirt not next to the ocean becomes grass, with probability `GRASS_BY_WATER` next to water, or
+       `GRASS_BY_FOREST` next to a forest when within `LIQUID_REACH` tiles of water
+    2. grass next to neither ocean nor dirt, with more than one neighbor type, becomes forest with probability
+       `FOREST_BY_GRASS`
+
+    Senescence (`tile_senescence`), of the tiles which did not grow:
+    3. grass without entities becomes dirt, and forest without entities becomes grass
+
+    Parameters
+    ----------
+    types: np.ndarray
+        2D grid of tile type codes, (height, width).
+    populated: np.ndarray
+        2D boolean grid, whether each tile holds any entities.
+    rng: np.random.Generator | None
+        Random source, a fresh unseeded generator when `None`.
+
+    Returns
+    -------
+    types: np.ndarray
+        The next generation (a new array).
+    """
+
+    rng = rng if rng is not None else np.random.default_rng()
+    draws: np.ndarray = rng.random(types.shape)
+    rules: dict[str, np.ndarray] = _rules(types=types, populated=populated)
+
+    grow_grass: np.ndarray = (rules["grass_by_water"] & (draws <= GRASS_BY_WATER)) | (
+        rules["grass_by_forest"] & (draws <= GRASS_BY_FOREST)
+    )
+    grow_forest: np.ndarray = rules["forest_by_grass"] & (draws <= FOREST_BY_GRASS)
+
+    generated: np.ndarray = types.copy()
+    generated[grow_grass] = GRASS
+    generated[grow_forest] = FOREST
+
+    # grown tiles are repopulated on conversion, so only the others can senesce
+    barren: np.ndarray = rules["barren"] & ~grow_grass & ~grow_forest
+    generated[barren & (types == GRASS)] = DIRT
+    generated[barren & (types == FOREST)] = GRASS
+    return generated
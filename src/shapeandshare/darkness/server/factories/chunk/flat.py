@@ -1,86 +1,106 @@
 import asyncio
 import logging
-import uuid
 from asyncio import Queue
 
+import numpy as np
+
 from ....sdk.contracts.dtos.coordinate import Coordinate
+from ....sdk.contracts.dtos.entities.entity import Entity
 from ....sdk.contracts.dtos.tiles.address import Address
 from ....sdk.contracts.dtos.tiles.chunk import Chunk
-from ....sdk.contracts.dtos.tiles.world import World
+from ....sdk.contracts.dtos.tiles.tile import Tile
 from ....sdk.contracts.dtos.window import Window
+from ....sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+from ....sdk.contracts.types.dao_document import DaoDocumentType
 from ....sdk.contracts.types.tile import TileType
+from ...clients.grid import TILE_CODES, grid_neighbors, pack_mask, unpack_mask, walk_layout
+from ...services.rng import active_rng
 from .abstract import AbstractChunkFactory
+from .automaton import LIQUID_REACH, eligible, tile_generation
+from .terrain import distance_field, generate_terrain, label_components
 
 logger = logging.getLogger()
 
+# the most windows a tick reads its active tiles through
+MAX_WINDOWS: int = 16
+
 
 class FlatChunkFactory(AbstractChunkFactory):
     async def terrain_generate(self, address: Address, chunk: Chunk) -> None:
-        # Lets shovel in some biome default or dirt tiles!
-        async def step_one():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile_id})
-                    # Mutate tiles to biome default (or dirt)
-                    await self.mutate_tile(
-                        address=address_tile,
-                        mutate=0.9375,  # percentage of 100%
-                        tile_type=(chunk.biome if chunk.biome else TileType.DIRT),
-                    )
-                    queue.task_done()
+        # Every pass (biome, rocks, brackish water and erosion) runs over the chunk's tile type grid at once,
+        # and only the tiles which changed are persisted, in a single bulk write.
+        grid: tuple[list[str], np.ndarray] | None = await self.load_grid(address=address, origin=chunk.origin)
+        if grid is None:
+            return
+        tile_ids, types = grid
 
-            queue = asyncio.Queue()
-            await asyncio.gather(FlatChunkFactory.producer(ids=chunk.ids, queue=queue), consumer(queue))
-
-        await step_one()
+        generated: np.ndarray = generate_terrain(
+            types=types, biome=chunk.biome if chunk.biome else TileType.DIRT, rng=active_rng().generator
+        )
 
-        # Add Eradicates (rocks)
-        async def step_two():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile_id})
-                    await self.mutate_tile(
-                        address=address_tile,
-                        mutate=0.0025,  # 0.5% change (very low)
-                        tile_type=TileType.ROCK,
-                    )
-                    queue.task_done()
+        changed: np.ndarray = np.flatnonzero(generated.ravel() != types.ravel())
+        await self.daoclient.bulk_write(
+            patches=[
+                (
+                    Address.model_validate({**address.model_dump(), "tile_id": tile_ids[index]}),
+                    {"tile_type": TILE_CODES[generated.flat[index]]},
+                )
+                for index in changed
+            ]
+        )
 
-            queue = asyncio.Queue()
-            await asyncio.gather(self.producer(ids=chunk.ids, queue=queue), consumer(queue))
+    def build(self, world_id: str, name: str | None, dimensions: tuple[int, int], biome: TileType) -> Chunk:
+        # The complete chunk, its tiles (positioned, and neighbors bound by position) and their initial entities, in memory only.
+        if name is None:
+            name = "roshar"
 
-        await step_two()
+        chunk: Chunk = Chunk(id=active_rng().new_id(), world_id=world_id, name=name, dimensions=dimensions, biome=biome)
 
-        # Convert inner Ocean to Water Tiles
-        async def step_three():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile_id})
-                    # Convert inner Ocean to Water Tiles
-                    await self.brackish_tile(address=address_tile)
-                    queue.task_done()
+        width, height = dimensions
+        tile_ids: list[str] = [active_rng().new_id() for _ in range(width * height)]
+        types: np.ndarray = generate_terrain(
+            types=np.full((height, width), TILE_CODES.index(TileType.OCEAN), dtype=np.uint8),
+            biome=biome if biome else TileType.DIRT,
+            rng=active_rng().generator,
+        )
 
-            queue = asyncio.Queue()
-            await asyncio.gather(self.producer(ids=chunk.ids, queue=queue), consumer(queue))
+        for index, tile_id in enumerate(tile_ids):
+            tile: Tile = Tile(
+                id=tile_id,
+                world_id=world_id,
+                chunk_id=chunk.id,
+                tile_type=TILE_CODES[types.flat[index]],
+                x=index % width + 1,
+                y=index // width + 1,
+                next=grid_neighbors(tile_ids=tile_ids, width=width, height=height, index=index),
+            )
+            parents: dict = {"world_id": world_id, "chunk_id": chunk.id, "tile_id": tile_id}
+            for entity in self.entity_factory.spawn(tile_type=tile.tile_type, parents=parents):
+                tile.contents[entity.id] = entity
+                tile.ids.add(entity.id)
+            chunk.contents[tile_id] = tile
 
-        await step_three()
+        chunk.ids = set(tile_ids)
+        chunk.origin = tile_ids[0]
+        return chunk
 
-        # Erode Tiles (to make shore)
-        async def step_four():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile_id})
-                    await self.erode_tile(address=address_tile)
-                    queue.task_done()
+    async def commit(self, chunk: Chunk) -> None:
+        # Persists a built chunk with one bulk insert (chunk, tiles, then entities), and lastly adds it to the world
+        address_world: Address = Address.model_validate({"world_id": chunk.world_id})
+        address_chunk: Address = Address.model_validate({**address_world.model_dump(), "chunk_id": chunk.id})
 
-            queue = asyncio.Queue()
-            await asyncio.gather(self.producer(ids=chunk.ids, queue=queue), consumer(queue))
+        documents: list[tuple[Address, Chunk | Tile | Entity]] = [
+            (address_chunk, chunk.model_copy(update={"contents": {}}))
+        ]
+        entities: list[tuple[Address, Entity]] = []
+        for tile in chunk.contents.values():
+            address_tile: Address = Address.model_validate({**address_chunk.model_dump(), "tile_id": tile.id})
+            documents.append((address_tile, tile.model_copy(update={"contents": {}})))
+            for entity in tile.contents.values():
+                entities.append((Address.model_validate({**address_tile.model_dump(), "entity_id": entity.id}), entity))
+        await self.daoclient.post_multi(documents=documents + entities)
 
-        await step_four()
+        await self.daoclient.add_to_set(address=address_world, field="ids", values=[chunk.id])
 
     async def create(self, world_id: str, name: str | None, dimensions: tuple[int, int], biome: TileType) -> Chunk:
         if name is None:
@@ -89,14 +109,12 @@ class FlatChunkFactory(AbstractChunkFactory):
         address_world: Address = Address.model_validate({"world_id": world_id})
 
         # 1. blank, named chunk
-        chunk: Chunk = Chunk(id=str(uuid.uuid4()), name=name, dimensions=dimensions, biome=biome)
+        chunk: Chunk = Chunk(id=active_rng().new_id(), world_id=world_id, name=name, dimensions=dimensions, biome=biome)
         address_chunk: Address = Address.model_validate({**address_world.model_dump(), "chunk_id": chunk.id})
         await self.daoclient.post(address=address_chunk, document=chunk)
 
         # update world metadata
-        world: World = await self.daoclient.get(address=address_world)
-        world.ids.add(chunk.id)
-        await self.daoclient.patch(address=address_world, document={"ids": list(world.ids)})
+        await self.daoclient.add_to_set(address=address_world, field="ids", values=[chunk.id])
 
         # Define the maximum size
         max_x, max_y = dimensions
@@ -114,9 +132,220 @@ class FlatChunkFactory(AbstractChunkFactory):
         # get final state and return
         return await self.daoclient.get(address=address_chunk)
 
+    @staticmethod
+    def _active(chunk: Chunk) -> np.ndarray | None:
+        # the (height, width) mask of the tiles the next tick evaluates, `None` for every tile
+        if chunk.active is None or chunk.dimensions is None:
+            return None
+        width, height = chunk.dimensions
+        try:
+            return unpack_mask(packed=chunk.active, shape=(height, width))
+        except DaoUnknownError as error:
+            logger.warning("[FlatChunkFactory] chunk (%s) active set is unusable: %s", chunk.id, error)
+            return None
+
+    @staticmethod
+    def _reach_windows(active: np.ndarray) -> list[Window]:
+        # disjoint windows holding every active tile along with the margin the rules read around it
+        reach: np.ndarray = distance_field(sources=active, limit=LIQUID_REACH) <= LIQUID_REACH
+        height, width = active.shape
+        return FlatChunkFactory._merge(
+            windows=FlatChunkFactory._windows(
+                mask=reach, region=Window(min=Coordinate(x=1, y=1), max=Coordinate(x=width, y=height))
+            ),
+            limit=MAX_WINDOWS,
+        )
+
+    @staticmethod
+    def _merge(windows: list[Window], limit: int) -> list[Window]:
+        # Merges windows down to at most `limit` pairwise disjoint windows covering them. Beyond the limit the
+        # windows are first joined into `limit` bands (in row order), overlapping windows are then joined.
+        def union(windows: list[Window]) -> Window:
+            return Window(
+                min=Coordinate(x=min(window.min.x for window in windows), y=min(window.min.y for window in windows)),
+                max=Coordinate(x=max(window.max.x for window in windows), y=max(window.max.y for window in windows)),
+            )
+
+        def overlap(first: Window, second: Window) -> bool:
+            return (
+                first.min.x <= second.max.x
+                and second.min.x <= first.max.x
+                and first.min.y <= second.max.y
+                and second.min.y <= first.max.y
+            )
+
+        if len(windows) > limit:
+            ordered: list[Window] = sorted(windows, key=lambda window: (window.min.y, window.min.x))
+            size: int = -(-len(ordered) // limit)
+            windows = [union(ordered[start : start + size]) for start in range(0, len(ordered), size)]
+
+        merged: list[Window] = []
+        for window in windows:
+            # the merged windows are disjoint, the growing window absorbs each one it comes to overlap
+            absorbed: list[Window] = [other for other in merged if overlap(window, other)]
+            while len(absorbed) > 0:
+                merged = [other for other in merged if all(other is not joined for joined in absorbed)]
+                window = union([window, *absorbed])
+                absorbed = [other for other in merged if overlap(window, other)]
+            merged.append(window)
+        return merged
+
+    async def _read_region(self, address: Address, region: Window) -> list[Tile] | None:
+        # the row-major tiles of a region, `None` unless every position of it is held by a tile
+        tiles: list[Tile] = await self.daoclient.get_window(address=address, window=region)
+        area: int = (region.max.x - region.min.x + 1) * (region.max.y - region.min.y + 1)
+        if len(tiles) != area:
+            return None
+        return sorted(tiles, key=lambda tile: (tile.y, tile.x))
+
+    async def _read_grid(self, address: Address, origin: str) -> tuple[list[Tile], Window]:
+        # the row-major tiles of the whole chunk, laid out from its origin
+        tiles: dict[str, Tile] = {
+            tile.id: tile for tile in await self.daoclient.get_scoped(address=address, doc_type=DaoDocumentType.TILE)
+        }
+        if len(tiles) == 0:
+            return [], Window(min=Coordinate(x=1, y=1), max=Coordinate(x=0, y=0))
+
+        width, height, tile_ids = walk_layout(origin=origin, tiles=tiles)
+        return [tiles[tile_id] for tile_id in tile_ids], Window(
+            min=Coordinate(x=1, y=1), max=Coordinate(x=width, y=height)
+        )
+
+    @staticmethod
+    def _windows(mask: np.ndarray, region: Window) -> list[Window]:
+        # the bounds of each connected group of marked cells of a region, in chunk coordinates
+        labels, count = label_components(mask=mask)
+        if count == 0:
+            return []
+
+        rows, columns = np.nonzero(labels)
+        components: np.ndarray = labels[rows, columns]
+        bounds: list[list[int]] = []
+        for values, reduce, initial in (
+            (rows, np.minimum, mask.shape[0]),
+            (columns, np.minimum, mask.shape[1]),
+            (rows, np.maximum, -1),
+            (columns, np.maximum, -1),
+        ):
+            bound: np.ndarray = np.full(count + 1, initial, dtype=np.int64)
+            reduce.at(bound, components, values)
+            bounds.append(bound[1:].tolist())
+
+        return [
+            Window(
+                min=Coordinate(x=region.min.x + min_x, y=region.min.y + min_y),
+                max=Coordinate(x=region.min.x + max_x, y=region.min.y + max_y),
+            )
+            for min_y, min_x, max_y, max_x in zip(*bounds)
+        ]
+
+    async def _read_windows(self, address: Address, windows: list[Window]) -> list[list[Tile]] | None:
+        # the row-major tiles of each window, `None` unless every position of them is held by a tile
+        views: list[list[Tile]] = []
+        for window in windows:
+            tiles: list[Tile] | None = await self._read_region(address=address, region=window)
+            if tiles is None:
+                return None
+            views.append(tiles)
+        return views
+
+    @staticmethod
+    def _generation(tiles: list[Tile], evaluated: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # the next tile type codes of a window's row-major tiles, and which of them changed
+        types: np.ndarray = np.array([TILE_CODES.index(tile.tile_type) for tile in tiles], dtype=np.uint8).reshape(
+            evaluated.shape
+        )
+        populated: np.ndarray = np.array([len(tile.ids) > 0 for tile in tiles]).reshape(types.shape)
+
+        # the margin is only read, its own neighborhood is not (fully) known
+        generated: np.ndarray = np.where(
+            evaluated, tile_generation(types=types, populated=populated, rng=active_rng().generator), types
+        )
+        return generated, generated != types
+
+    # pylint: disable=too-many-locals
+    async def tick(self, address: Address, chunk: Chunk) -> bool:
+        # One generation of the chunk's tiles as a cellular automaton (see `tile_generation`), evaluated over the
+        # chunk's active tiles only, and written back as one bulk write of the changed tiles (and their new
+        # entities). Quiet chunks are not read at all. Returns False when the tiles are not laid out as a grid.
+        if chunk.origin is None:
+            return False
+        active: np.ndarray | None = FlatChunkFactory._active(chunk=chunk)
+        if active is not None and not active.any():
+            return True
+
+        # a few windows around the active tiles by position, or else every tile by walking from the origin
+        windows: list[Window] = [] if active is None else FlatChunkFactory._reach_windows(active=active)
+        views: list[list[Tile]] | None = None
+        if active is not None:
+            views = await self._read_windows(address=address, windows=windows)
+        if views is None:
+            try:
+                tiles, region = await self._read_grid(address=address, origin=chunk.origin)
+            except DaoUnknownError as error:
+                logger.warning("[FlatChunkFactory] chunk (%s) is not a grid: %s", address.chunk_id, error)
+                return False
+            if len(tiles) == 0:
+                return True
+            windows, views = [region], [tiles]
+            if active is None or active.shape != (region.max.y, region.max.x):
+                active = np.ones((region.max.y, region.max.x), dtype=bool)
+
+        # each window holds the whole neighborhood of its active tiles, so windows are evaluated independently
+        generations: list[tuple[tuple[slice, slice], np.ndarray, np.ndarray]] = []
+        changed_tiles: list[Tile] = []
+        changed_types: list[TileType] = []
+        for window, tiles in zip(windows, views):
+            cells: tuple[slice, slice] = (slice(window.min.y - 1, window.max.y), slice(window.min.x - 1, window.max.x))
+            generated, changed = FlatChunkFactory._generation(tiles=tiles, evaluated=active[cells])
+            changed_tiles.extend(tiles[index] for index in np.flatnonzero(changed))
+            changed_types.extend(TILE_CODES[generated.flat[index]] for index in np.flatnonzero(changed))
+            generations.append((cells, generated, changed))
+        await self.write_generation(address=address, tiles=changed_tiles, tile_types=changed_types)
+
+        # Next tick's active tiles: the eligible ones, and beyond those evaluated any tile within reach of a change
+        # (tiles out of reach of every change can not have become eligible, nor lie outside of the windows).
+        candidates: np.ndarray = np.zeros(active.shape, dtype=bool)
+        for (cells, generated, changed), tiles in zip(generations, views):
+            populated = np.array([len(tile.ids) > 0 for tile in tiles]).reshape(generated.shape)
+            candidates[cells] = (eligible(types=generated, populated=populated) & active[cells]) | (
+                (distance_field(sources=changed, limit=LIQUID_REACH) <= LIQUID_REACH) & ~active[cells]
+            )
+        await self.daoclient.patch(address=address, document={"active": pack_mask(mask=candidates)})
+        return True
+
+    async def write_generation(self, address: Address, tiles: list[Tile], tile_types: list[TileType]) -> None:
+        # Converts the tiles to their new types with one bulk write, repopulating them as `convert_tile` does
+        patches: list[tuple[Address, dict]] = []
+        entities: list[tuple[Address, Entity]] = []
+        spawns: list[tuple[Address, list[str]]] = []
+        for tile, tile_type in zip(tiles, tile_types):
+            address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": tile.id})
+            patches.append((address_tile, {"tile_type": tile_type}))
+
+            parents: dict = {"world_id": address.world_id, "chunk_id": address.chunk_id, "tile_id": tile.id}
+            spawned: list[Entity] = self.entity_factory.spawn(tile_type=tile_type, parents=parents)
+            if len(spawned) > 0:
+                tile.ids = tile.ids | {entity.id for entity in spawned}
+                spawns.append((address_tile, [entity.id for entity in spawned]))
+                entities.extend(
+                    (Address.model_validate({**address_tile.model_dump(), "entity_id": entity.id}), entity)
+                    for entity in spawned
+                )
+
+        # entities before the tiles referencing them, which only gain their ids (never a rewrite of the set)
+        await self.daoclient.post_multi(documents=entities)
+        await self.daoclient.bulk_write(patches=patches)
+        for address_tile, entity_ids in spawns:
+            await self.daoclient.add_to_set(address=address_tile, field="ids", values=entity_ids)
+
     async def quantum(self, address: Address) -> None:
         chunk: Chunk = await self.daoclient.get(address=address)
 
+        # chunks laid out as a grid tick as a whole, anything else falls back to the tile by tile pass below
+        if await self.tick(address=address, chunk=chunk):
+            return
+
         # Grow Tiles
         async def step_five():
             async def consumer(queue: Queue):
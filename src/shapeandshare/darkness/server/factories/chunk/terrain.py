@@ -0,0 +1,186 @@
+"""Array-backed terrain generation over a chunk's 2D grid of tile type codes (see `clients/grid.py`)."""
+
+import numpy as np
+
+from ....sdk.contracts.types.tile import TileType
+from ...clients.grid import TILE_CODES
+
+OCEAN: int = TILE_CODES.index(TileType.OCEAN)
+WATER: int = TILE_CODES.index(TileType.WATER)
+ROCK: int = TILE_CODES.index(TileType.ROCK)
+SHORE: int = TILE_CODES.index(TileType.SHORE)
+
+# distance of cells no source reaches (within the limit)
+UNREACHABLE: int = np.iinfo(np.int32).max
+
+# tile types erosion leaves alone (rocks are left by oceans)
+ERODE_EXEMPT: np.ndarray = np.array(
+    [TILE_CODES.index(tile_type) for tile_type in (TileType.UNKNOWN, TileType.OCEAN, TileType.WATER, TileType.SHORE)]
+    + [ROCK],
+    dtype=np.uint8,
+)
+
+
+def adjacent(mask: np.ndarray) -> np.ndarray:
+    """
+    Four-neighbor stencil, marks every cell with at least one marked (LEFT, RIGHT, UP or DOWN) neighbor.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        2D boolean grid.
+
+    Returns
+    -------
+    adjacent: np.ndarray
+        2D boolean grid of the same shape.
+    """
+
+    result: np.ndarray = np.zeros_like(mask, dtype=bool)
+    result[:, 1:] |= mask[:, :-1]
+    result[:, :-1] |= mask[:, 1:]
+    result[1:, :] |= mask[:-1, :]
+    result[:-1, :] |= mask[1:, :]
+    return result
+
+
+def label_components(mask: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Labels the four-connected components of a mask with a single flood fill sweep (each cell is visited once).
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        2D boolean grid.
+
+    Returns
+    -------
+    labels: tuple[np.ndarray, int]
+        2D int32 grid of component labels (1 .. count, 0 outside the mask), and the number of components.
+    """
+
+    height, width = mask.shape
+    cells: list[bool] = mask.ravel().tolist()
+    labels: list[int] = [0] * len(cells)
+
+    count: int = 0
+    for start, marked in enumerate(cells):
+        if not marked or labels[start] != 0:
+            continue
+        count += 1
+        labels[start] = count
+        stack: list[int] = [start]
+        while len(stack) > 0:
+            index: int = stack.pop()
+            x: int = index % width
+            for neighbor, inside in (
+                (index - 1, x > 0),
+                (index + 1, x < width - 1),
+                (index - width, index >= width),
+                (index + width, index < (height - 1) * width),
+            ):
+                if inside and cells[neighbor] and labels[neighbor] == 0:
+                    labels[neighbor] = count
+                    stack.append(neighbor)
+
+    return np.array(labels, dtype=np.int32).reshape(mask.shape), count
+
+
+def enclosed(mask: np.ndarray) -> np.ndarray:
+    """
+    Marks the cells of every component of a mask which does not reach the edge of the grid.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        2D boolean grid.
+
+    Returns
+    -------
+    enclosed: np.ndarray
+        2D boolean grid of the same shape.
+    """
+
+    labels, count = label_components(mask=mask)
+    reaches_edge: np.ndarray = np.zeros(count + 1, dtype=bool)
+    reaches_edge[0] = True
+    reaches_edge[np.concatenate([labels[0, :], labels[-1, :], labels[:, 0], labels[:, -1]])] = True
+    return ~reaches_edge[labels]
+
+
+def distance_field(sources: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """
+    Multi-source breadth first search over the four-neighbor grid, each wavefront is a single stencil pass.
+
+    Parameters
+    ----------
+    sources: np.ndarray
+        2D boolean grid of the cells at distance 0.
+    limit: int | None
+        The greatest distance searched, the whole grid when `None`.
+
+    Returns
+    -------
+    distances: np.ndarray
+        2D int32 grid of the distance from each cell to its nearest source (`UNREACHABLE` when beyond the limit).
+    """
+
+    distances: np.ndarray = np.full(sources.shape, UNREACHABLE, dtype=np.int32)
+    distances[sources] = 0
+
+    reached: np.ndarray = sources.copy()
+    frontier: np.ndarray = sources
+    distance: int = 0
+    while frontier.any() and (limit is None or distance < limit):
+        distance += 1
+        frontier = adjacent(frontier) & ~reached
+        distances[frontier] = distance
+        reached |= frontier
+    return distances
+
+
+def generate_terrain(
+    types: np.ndarray,
+    biome: TileType,
+    rng: np.random.Generator | None = None,
+    mutate: float = 0.9375,
+    rock: float = 0.0025,
+) -> np.ndarray:
+    """
+    Generates terrain from a blank (ocean) grid, each pass applied to the whole grid at once.
+
+    1. biome: tiles become the biome type with probability `mutate`
+    2. rocks: tiles become rock with probability `rock`
+    3. brackish: ocean bodies which do not reach the edge of the chunk become water
+    4. erosion: land tiles (other than rock) next to the ocean become shore
+
+    Parameters
+    ----------
+    types: np.ndarray
+        2D grid of tile type codes, (height, width).
+    biome: TileType
+        The chunk biome.
+    rng: np.random.Generator | None
+        Random source, a fresh unseeded generator when `None`.
+    mutate: float
+        Probability of a tile taking the biome type.
+    rock: float
+        Probability of a tile becoming rock.
+
+    Returns
+    -------
+    types: np.ndarray
+        The generated grid (a new array).
+    """
+
+    rng = rng if rng is not None else np.random.default_rng()
+    generated: np.ndarray = types.copy()
+
+    generated[rng.random(generated.shape) <= mutate] = TILE_CODES.index(biome)
+    generated[rng.random(generated.shape) <= rock] = ROCK
+
+    generated[enclosed(generated == OCEAN)] = WATER
+
+    ocean = generated == OCEAN
+    generated[~np.isin(generated, ERODE_EXEMPT) & adjacent(ocean)] = SHORE
+    return generated
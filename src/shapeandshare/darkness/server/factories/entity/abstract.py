@@ -1,20 +1,15 @@
-import asyncio
 import logging
-import uuid
 from asyncio import Queue
 
 from pydantic import BaseModel
 
 from ....sdk.contracts.dtos.entities.entity import Entity
-from ....sdk.contracts.dtos.entities.fauna.fish import EntityFish
-from ....sdk.contracts.dtos.entities.flora.grass import EntityGrass
-from ....sdk.contracts.dtos.entities.flora.tree import EntityTree
-from ....sdk.contracts.dtos.entities.funga.fungi import EntityFungi
 from ....sdk.contracts.dtos.tiles.address import Address
 from ....sdk.contracts.dtos.tiles.tile import Tile
 from ....sdk.contracts.types.entity import EntityType
 from ....sdk.contracts.types.tile import TileType
 from ...clients.dao import DaoClient
+from ...services.rng import active_rng
 
 logger = logging.getLogger()
 
@@ -27,9 +22,24 @@ class AbstractEntityFactory(BaseModel):
 
     @staticmethod
     async def producer(ids: set[str], queue: Queue):
-        for local_id in ids:
+        for local_id in sorted(ids):
             await queue.put(local_id)
 
+    @staticmethod
+    def spawn(tile_type: TileType, parents: dict) -> list[Entity]:
+        # the initial entities of a tile by its type (in memory only), `parents` are the ids stamped on each
+        new_entities: list[Entity] = []
+        if tile_type == TileType.GRASS:
+            new_entities.append(Entity(id=active_rng().new_id(), entity_type=EntityType.GRASS, **parents))
+
+        elif tile_type == TileType.FOREST:
+            new_entities.append(Entity(id=active_rng().new_id(), entity_type=EntityType.TREE, **parents))
+            new_entities.append(Entity(id=active_rng().new_id(), entity_type=EntityType.FUNGI, **parents))
+
+        elif tile_type == TileType.OCEAN:
+            new_entities.append(Entity(id=active_rng().new_id(), entity_type=EntityType.FISH, **parents))
+        return new_entities
+
     async def generate(self, address: Address) -> None:
         # get entities ids for the tile
         local_tile: Tile = await self.daoclient.get(address=address)
@@ -39,79 +49,16 @@ class AbstractEntityFactory(BaseModel):
         #     logger.warning(msg)
 
         # Review types now
-        if local_tile.tile_type == TileType.GRASS:
-            new_entity: Entity = Entity(id=str(uuid.uuid4()), entity_type=EntityType.GRASS)
-            address_entity: Address = Address.model_validate({**address.model_dump(), "entity_id": new_entity.id})
-            await self.daoclient.post(address=address_entity, document=new_entity)
-            local_tile.ids.add(new_entity.id)
-
-        elif local_tile.tile_type == TileType.FOREST:
-            new_entity: Entity = Entity(id=str(uuid.uuid4()), entity_type=EntityType.TREE)
-            address_entity: Address = Address.model_validate({**address.model_dump(), "entity_id": new_entity.id})
-            await self.daoclient.post(address=address_entity, document=new_entity)
-            local_tile.ids.add(new_entity.id)
-
-            new_entity = Entity(id=str(uuid.uuid4()), entity_type=EntityType.FUNGI)
-            address_entity: Address = Address.model_validate({**address.model_dump(), "entity_id": new_entity.id})
-            await self.daoclient.post(address=address_entity, document=new_entity)
-            local_tile.ids.add(new_entity.id)
-
-        elif local_tile.tile_type == TileType.OCEAN:
-            new_entity: Entity = Entity(id=str(uuid.uuid4()), entity_type=EntityType.FISH)
-            address_entity: Address = Address.model_validate({**address.model_dump(), "entity_id": new_entity.id})
-            await self.daoclient.post(address=address_entity, document=new_entity)
-            local_tile.ids.add(new_entity.id)
-
-        patch: dict = {"ids": list(local_tile.ids)}
-        # print(f"tile id {local_tile}, got: {patch}")
-        await self.daoclient.patch(address=address, document=patch)
-
-    ###
-
-    async def grow_entities(self, address: Address):
-        # get entities ids for the tile
-        local_tile: Tile = await self.daoclient.get(address=address)
-
-        async def entity_producer(queue: Queue):
-            for entity_id in local_tile.ids:
-                await queue.put(entity_id)
-
-        async def step_one():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_entity_id: str = await queue.get()
-
-                    # TODO: Process entity
-                    address_entity: Address = Address.model_validate(
-                        {**address.model_dump(), "entity_id": local_entity_id}
-                    )
-                    entity: Entity = await self.daoclient.get(address=address_entity)
-                    # print(wrapped_entity.model_dump())
-
-                    if entity.entity_type == EntityType.FUNGI:
-                        fungi: EntityFungi = EntityFungi.model_validate(
-                            {**entity.model_dump(), "address": address_entity, "daoclient": self.daoclient}
-                        )
-                        await fungi.quantum()
-                    elif entity.entity_type == EntityType.GRASS:
-                        grass: EntityGrass = EntityGrass.model_validate(
-                            {**entity.model_dump(), "address": address_entity, "daoclient": self.daoclient}
-                        )
-                        await grass.quantum()
-                    elif entity.entity_type == EntityType.FISH:
-                        fish: EntityFish = EntityFish.model_validate(
-                            {**entity.model_dump(), "address": address_entity, "daoclient": self.daoclient}
-                        )
-                        await fish.quantum()
-                    elif entity.entity_type == EntityType.TREE:
-                        tree: EntityTree = EntityTree.model_validate(
-                            {**entity.model_dump(), "address": address_entity, "daoclient": self.daoclient}
-                        )
-                        await tree.quantum()
-
-                    queue.task_done()
-
-            queue = asyncio.Queue()
-            await asyncio.gather(entity_producer(queue), consumer(queue))
-
-        await step_one()
+        parents: dict = {"world_id": address.world_id, "chunk_id": address.chunk_id, "tile_id": address.tile_id}
+        new_entities: list[Entity] = AbstractEntityFactory.spawn(tile_type=local_tile.tile_type, parents=parents)
+
+        if len(new_entities) > 0:
+            await self.daoclient.post_multi(
+                documents=[
+                    (Address.model_validate({**address.model_dump(), "entity_id": new_entity.id}), new_entity)
+                    for new_entity in new_entities
+                ]
+            )
+            await self.daoclient.add_to_set(
+                address=address, field="ids", values=[new_entity.id for new_entity in new_entities]
+            )
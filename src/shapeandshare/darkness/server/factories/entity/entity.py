@@ -2,9 +2,15 @@ import asyncio
 import logging
 from asyncio import Queue
 
+import numpy as np
+
+from ....sdk.contracts.dtos.entities.partial import EntityPartial
 from ....sdk.contracts.dtos.tiles.address import Address
 from ....sdk.contracts.dtos.tiles.chunk import Chunk
+from ....sdk.contracts.types.dao_document import DaoDocumentType
+from ...services.rng import active_rng
 from .abstract import AbstractEntityFactory
+from .lifecycle import UNSCHEDULED, EntityArrays, advance, next_due, rolled, sample_transitions, transition
 
 logger = logging.getLogger()
 
@@ -12,6 +18,9 @@ logger = logging.getLogger()
 class EntityFactory(AbstractEntityFactory):
     """ """
 
+    # discrete event mode (see `quantum_events`), otherwise every entity is rolled on every tick
+    events: bool = True
+
     async def terrain_generate(self, address: Address, chunk: Chunk) -> None:
         async def step_one():
             async def consumer(queue: Queue):
@@ -27,18 +36,75 @@ class EntityFactory(AbstractEntityFactory):
         await step_one()
 
     async def quantum(self, address: Address):
+        if self.events:
+            await self.quantum_events(address=address)
+            return
+
+        # Every entity is rolled for, as arrays (see `lifecycle.py`) from a single scoped read of the chunk's
+        # entities, and only the changed ones are written back
+        arrays: EntityArrays = EntityArrays(
+            entities=await self.daoclient.get_scoped(
+                address=address, doc_type=DaoDocumentType.ENTITY, projection=EntityPartial
+            )
+        )
+        mask: np.ndarray = rolled(types=arrays.types, draws=active_rng().random_batch(len(arrays)))
+        states, amounts = transition(types=arrays.types, states=arrays.states, amounts=arrays.amounts, mask=mask)
+        await self.daoclient.bulk_write(patches=arrays.patches(address=address, states=states, amounts=amounts))
+
+    async def quantum_events(self, address: Address) -> int:
+        # Discrete event entity quantum, the chunk keeps a tick counter and each entity the tick its next transition
+        # is due at, so a tick only reads (and advances) the entities due, with a range scan of the schedule index
         chunk: Chunk = await self.daoclient.get(address=address)
+        tick: int = chunk.tick + 1
 
-        # Entity Factory Quantum
-        async def step_six():
-            async def consumer(queue: Queue):
-                while not queue.empty():
-                    local_tile_id: str = await queue.get()
-                    address_tile: Address = Address.model_validate({**address.model_dump(), "tile_id": local_tile_id})
-                    await self.grow_entities(address=address_tile)
-                    queue.task_done()
+        entities: list[EntityPartial] = []
+        async for batch in self.daoclient.iter_due(address=address, tick=tick, projection=EntityPartial):
+            entities.extend(batch)
+        arrays: EntityArrays = EntityArrays(entities=entities)
 
-            queue = asyncio.Queue()
-            await asyncio.gather(self.producer(ids=chunk.ids, queue=queue), consumer(queue))
+        # New (or unpacked) entities are scheduled from the previous tick, as though they had been rolled for
+        # from then on (transitions are memoryless, so a late schedule is as good as an early one)
+        generator: np.random.Generator = active_rng().generator
+        dues: np.ndarray = arrays.dues.copy()
+        unscheduled: np.ndarray = dues == UNSCHEDULED
+        dues[unscheduled] = next_due(tick=tick - 1, types=arrays.types[unscheduled], rng=generator)
+
+        # the entities due are advanced together, and rescheduled
+        mask: np.ndarray = dues <= tick
+        states, amounts = transition(types=arrays.types, states=arrays.states, amounts=arrays.amounts, mask=mask)
+        dues[mask] = next_due(tick=tick, types=arrays.types[mask], rng=generator)
+
+        await self.daoclient.bulk_write(
+            patches=arrays.patches(address=address, states=states, amounts=amounts, dues=dues)
+        )
+        await self.daoclient.patch(address=address, document={"tick": tick})
+        return int(mask.sum())
+
+    async def fast_forward(self, address: Address, ticks: int) -> int:
+        # Catches the chunk's entities up by `ticks` ticks in a single pass, the number of transitions each makes
+        # is sampled directly (see `lifecycle.py`) rather than by running each tick, returns the number changed
+        arrays: EntityArrays = EntityArrays(
+            entities=await self.daoclient.get_scoped(
+                address=address, doc_type=DaoDocumentType.ENTITY, projection=EntityPartial
+            )
+        )
+        generator: np.random.Generator = active_rng().generator
+
+        # with a schedule, it is carried through the window and the chunk's clock moved past it
+        chunk: Chunk | None = await self.daoclient.get(address=address) if self.events else None
+        transitions, dues = sample_transitions(
+            types=arrays.types,
+            ticks=ticks,
+            rng=generator,
+            dues=arrays.dues if chunk is not None else None,
+            tick=chunk.tick if chunk is not None else 0,
+        )
+        states, amounts = advance(
+            types=arrays.types, states=arrays.states, amounts=arrays.amounts, transitions=transitions
+        )
 
-        await step_six()
+        patches: list[tuple[Address, dict]] = arrays.patches(address=address, states=states, amounts=amounts, dues=dues)
+        await self.daoclient.bulk_write(patches=patches)
+        if chunk is not None:
+            await self.daoclient.patch(address=address, document={"tick": chunk.tick + ticks})
+        return len(patches)
@@ -0,0 +1,260 @@
+"""Entity quantum as vectorized state machines over a chunk's entities, held as parallel arrays (struct of arrays)."""
+
+import numpy as np
+
+from ....sdk.contracts.dtos.entities.partial import EntityPartial
+from ....sdk.contracts.dtos.tiles.address import Address
+from ....sdk.contracts.types.entity import EntityType
+from ...clients.grid import ENTITY_CODES
+from .registry import ENTITY_BEHAVIORS
+
+# Per tick transition probability by entity type code (see `ENTITY_CODES`), of the registered behaviors
+MUTATION_RATES: np.ndarray = np.zeros(len(ENTITY_CODES), dtype=np.float64)
+for _entity_type, _behavior in ENTITY_BEHAVIORS.items():
+    MUTATION_RATES[ENTITY_CODES.index(_entity_type)] = _behavior.mutation_rate
+
+# due tick of entities not yet scheduled
+UNSCHEDULED: int = -1
+
+
+class EntityArrays:
+    """
+    A chunk's entities (those with a registered behavior) as parallel arrays, one row per entity ordered by id.
+
+    Attributes
+    ----------
+    ids: list[str]
+        Entity ids.
+    tile_ids: list[str | None]
+        Parent tile ids.
+    types: np.ndarray
+        Entity type codes (see `ENTITY_CODES`).
+    states: np.ndarray
+        Lifecycle states.
+    amounts: np.ndarray
+        Amounts.
+    dues: np.ndarray
+        Due ticks of the next transition (`UNSCHEDULED` when not scheduled).
+    """
+
+    __slots__ = ("ids", "tile_ids", "types", "states", "amounts", "dues")
+
+    def __init__(self, entities: list[EntityPartial]) -> None:
+        rows: list[EntityPartial] = sorted(
+            (entity for entity in entities if entity.entity_type in ENTITY_BEHAVIORS), key=lambda entity: entity.id
+        )
+        lookup: dict[EntityType, int] = {member: code for code, member in enumerate(ENTITY_CODES)}
+
+        self.ids: list[str] = [entity.id for entity in rows]
+        self.tile_ids: list[str | None] = [entity.tile_id for entity in rows]
+        self.types: np.ndarray = np.array([lookup[entity.entity_type] for entity in rows], dtype=np.int64)
+        self.states: np.ndarray = np.array([entity.state for entity in rows], dtype=np.int64)
+        self.amounts: np.ndarray = np.array([entity.amount for entity in rows], dtype=np.float64)
+        self.dues: np.ndarray = np.array(
+            [entity.due if entity.due is not None else UNSCHEDULED for entity in rows], dtype=np.int64
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def patches(
+        self, address: Address, states: np.ndarray, amounts: np.ndarray, dues: np.ndarray | None = None
+    ) -> list[tuple[Address, dict]]:
+        """
+        Builds the patches of the rows changed by a generation, each carrying only its changed fields.
+
+        Parameters
+        ----------
+        address: Address
+            The chunk address.
+        states: np.ndarray
+            The next states.
+        amounts: np.ndarray
+            The next amounts.
+        dues: np.ndarray | None
+            The next due ticks, when scheduled.
+
+        Returns
+        -------
+        patches: list[tuple[Address, dict]]
+            Entity address and document of each changed row (for `DaoClient.bulk_write`).
+        """
+
+        columns: list[tuple[str, np.ndarray, np.ndarray]] = [
+            ("state", self.states, states),
+            ("amount", self.amounts, amounts),
+        ]
+        if dues is not None:
+            columns.append(("due", self.dues, dues))
+
+        changed: np.ndarray = np.zeros(len(self), dtype=bool)
+        for _, previous, current in columns:
+            changed |= previous != current
+
+        patches: list[tuple[Address, dict]] = []
+        for row in np.flatnonzero(changed).tolist():
+            document: dict = {
+                field: current[row].item() for field, previous, current in columns if previous[row] != current[row]
+            }
+            patches.append(
+                (
+                    Address(
+                        world_id=address.world_id,
+                        chunk_id=address.chunk_id,
+                        tile_id=self.tile_ids[row],
+                        entity_id=self.ids[row],
+                    ),
+                    document,
+                )
+            )
+        return patches
+
+
+def rolled(types: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """
+    Marks the entities whose draw transitions them this tick.
+
+    Parameters
+    ----------
+    types: np.ndarray
+        Entity type codes.
+    draws: np.ndarray
+        One uniform draw in [0, 1) per entity.
+
+    Returns
+    -------
+    rolled: np.ndarray
+        Boolean mask of the same shape.
+    """
+
+    return draws <= MUTATION_RATES[types]
+
+
+def next_due(tick: int, types: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws the tick of each entity's next transition. A transition is rolled at `MUTATION_RATES` on each tick,
+    so the number of ticks until the next one is geometric.
+
+    Parameters
+    ----------
+    tick: int
+        The tick the draw is made on (the earliest next transition is the one after).
+    types: np.ndarray
+        Entity type codes.
+    rng: np.random.Generator
+        Random source.
+
+    Returns
+    -------
+    dues: np.ndarray
+        Due ticks, int64.
+    """
+
+    return tick + rng.geometric(p=MUTATION_RATES[types]).astype(np.int64)
+
+
+def transition(
+    types: np.ndarray, states: np.ndarray, amounts: np.ndarray, mask: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Advances the marked entities to their next state (see `advance`).
+
+    Parameters
+    ----------
+    types: np.ndarray
+        Entity type codes.
+    states: np.ndarray
+        Lifecycle states.
+    amounts: np.ndarray
+        Amounts.
+    mask: np.ndarray
+        Boolean mask of the entities to advance.
+
+    Returns
+    -------
+    generation: tuple[np.ndarray, np.ndarray]
+        The next states and amounts (new arrays).
+    """
+
+    return advance(types=types, states=states, amounts=amounts, transitions=mask.astype(np.int64))
+
+
+def sample_transitions(
+    types: np.ndarray, ticks: int, rng: np.random.Generator, dues: np.ndarray | None = None, tick: int = 0
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Samples the number of transitions each entity makes over `ticks` ticks without stepping through them,
+    one being rolled for per tick their number is binomial.
+
+    With a schedule (see `next_due`) the first transition of a scheduled entity is already drawn, those due within
+    the window make it and a binomial number after, the others none (keeping their due tick). Every entity which
+    transitions is rescheduled after the window, transitions being memoryless.
+
+    Parameters
+    ----------
+    types: np.ndarray
+        Entity type codes.
+    ticks: int
+        The number of ticks skipped.
+    rng: np.random.Generator
+        Random source.
+    dues: np.ndarray | None
+        Due ticks (`UNSCHEDULED` when not scheduled), `None` without a schedule.
+    tick: int
+        The last tick run, the window being (tick, tick + ticks].
+
+    Returns
+    -------
+    sample: tuple[np.ndarray, np.ndarray | None]
+        The number of transitions (int64), and the due ticks at the end of the window (`None` without a schedule).
+    """
+
+    rates: np.ndarray = MUTATION_RATES[types]
+    if dues is None:
+        return rng.binomial(n=ticks, p=rates).astype(np.int64), None
+
+    end: int = tick + ticks
+    unscheduled: np.ndarray = dues == UNSCHEDULED
+    within: np.ndarray = ~unscheduled & (dues <= end)
+
+    transitions: np.ndarray = np.zeros(types.shape, dtype=np.int64)
+    transitions[unscheduled] = rng.binomial(n=ticks, p=rates[unscheduled])
+    transitions[within] = 1 + rng.binomial(n=end - dues[within], p=rates[within])
+
+    next_dues: np.ndarray = dues.copy()
+    next_dues[unscheduled | within] = next_due(tick=end, types=types[unscheduled | within], rng=rng)
+    return transitions, next_dues
+
+
+def advance(
+    types: np.ndarray, states: np.ndarray, amounts: np.ndarray, transitions: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Advances each entity by a number of transitions at once, the rows of each type by its registered
+    behavior (see `EntityBehavior.advance`).
+
+    Parameters
+    ----------
+    types: np.ndarray
+        Entity type codes.
+    states: np.ndarray
+        Lifecycle states.
+    amounts: np.ndarray
+        Amounts.
+    transitions: np.ndarray
+        The number of transitions of each entity.
+
+    Returns
+    -------
+    generation: tuple[np.ndarray, np.ndarray]
+        The states and amounts after them (new arrays).
+    """
+
+    next_states: np.ndarray = states.copy()
+    next_amounts: np.ndarray = amounts.astype(np.float64)
+    for code in np.unique(types).tolist():
+        rows: np.ndarray = types == code
+        next_states[rows], next_amounts[rows] = ENTITY_BEHAVIORS[ENTITY_CODES[code]].advance(
+            states=states[rows], amounts=amounts[rows], transitions=transitions[rows]
+        )
+    return next_states, next_amounts
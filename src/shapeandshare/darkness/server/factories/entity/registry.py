@@ -0,0 +1,102 @@
+from enum import Enum
+from typing import Any, ClassVar
+
+import numpy as np
+
+from ....sdk.contracts.dtos.entities.entity import Entity
+from ....sdk.contracts.dtos.entities.fauna.fish import EntityFish
+from ....sdk.contracts.dtos.entities.flora.grass import EntityGrass
+from ....sdk.contracts.dtos.entities.flora.tree import EntityTree
+from ....sdk.contracts.dtos.entities.funga.fungi import EntityFungi
+from ....sdk.contracts.types.entity import EntityType
+
+
+class EntityBehavior:
+    """
+    Lifecycle of an entity type, applied to the rows of that type of a chunk's entity arrays (see `lifecycle.py`),
+    the compact holders of the entities' state.
+
+    Every state transitions at `mutation_rate` per tick. The default lifecycle is a cycle through `Meta`, the last
+    state returning to the first and adding to the amount (while below `max_amount`). Types with another
+    lifecycle override `advance`.
+    """
+
+    entity_type: ClassVar[EntityType] = EntityType.UNKNOWN
+    Meta: ClassVar[type[Enum]]
+    max_amount: ClassVar[float]
+    mutation_rate: ClassVar[float]
+
+    @classmethod
+    def advance(cls, states: np.ndarray, amounts: np.ndarray, transitions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Advances entities of this type by a number of transitions each, at once.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            Lifecycle states.
+        amounts: np.ndarray
+            Amounts.
+        transitions: np.ndarray
+            The number of transitions of each entity (0 leaves it as is).
+
+        Returns
+        -------
+        generation: tuple[np.ndarray, np.ndarray]
+            The states and amounts after them (new arrays).
+        """
+
+        # the state moves on by that many (modulo the number of states), and the amount grows by the laps completed
+        count: int = len(cls.Meta)
+        advanced: np.ndarray = states + transitions
+        headroom: np.ndarray = np.clip(np.ceil(cls.max_amount - amounts), 0, None)
+        return advanced % count, amounts + np.minimum(advanced // count, headroom)
+
+
+# Behavior of each entity type, extended with `register`
+ENTITY_BEHAVIORS: dict[EntityType, type[EntityBehavior]] = {}
+
+
+def register(behavior: type[EntityBehavior]) -> type[EntityBehavior]:
+    ENTITY_BEHAVIORS[behavior.entity_type] = behavior
+    return behavior
+
+
+def _default(model: type[Entity], field: str) -> Any:
+    # a field default of an sdk entity model
+    return model.model_fields[field].default
+
+
+# The built in types, with their lifecycles as defined by the sdk models
+
+
+@register
+class FishBehavior(EntityBehavior):
+    entity_type = EntityType.FISH
+    Meta = EntityFish.Meta
+    max_amount = _default(model=EntityFish, field="max_amount")
+    mutation_rate = _default(model=EntityFish, field="mutation_rate")
+
+
+@register
+class GrassBehavior(EntityBehavior):
+    entity_type = EntityType.GRASS
+    Meta = EntityGrass.Meta
+    max_amount = _default(model=EntityGrass, field="max_amount")
+    mutation_rate = _default(model=EntityGrass, field="mutation_rate")
+
+
+@register
+class TreeBehavior(EntityBehavior):
+    entity_type = EntityType.TREE
+    Meta = EntityTree.Meta
+    max_amount = _default(model=EntityTree, field="max_amount")
+    mutation_rate = _default(model=EntityTree, field="mutation_rate")
+
+
+@register
+class FungiBehavior(EntityBehavior):
+    entity_type = EntityType.FUNGI
+    Meta = EntityFungi.Meta
+    max_amount = _default(model=EntityFungi, field="max_amount")
+    mutation_rate = _default(model=EntityFungi, field="mutation_rate")
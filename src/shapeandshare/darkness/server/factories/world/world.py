@@ -1,10 +1,9 @@
-import uuid
-
 from pydantic import BaseModel
 
 from ....sdk.contracts.dtos.tiles.address import Address
 from ....sdk.contracts.dtos.tiles.world import World
 from ...clients.dao import DaoClient
+from ...services.rng import active_rng
 
 
 class WorldFactory(BaseModel):
@@ -16,7 +15,7 @@ class WorldFactory(BaseModel):
     async def create(self, name: str | None = None) -> str:
         if name is None:
             name = "darkness"
-        world: World = World(id=str(uuid.uuid4()), name=name)
+        world: World = World(id=active_rng().new_id(), name=name)
         address_world: Address = Address.model_validate({"world_id": world.id})
 
         await self.daoclient.post(address=address_world, document=world)
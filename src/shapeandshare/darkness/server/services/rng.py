@@ -0,0 +1,114 @@
+import hashlib
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import numpy as np
+from typing_extensions import AsyncIterator
+
+
+class SimulationRng:
+    """
+    Random source of a single simulation stream (a world or a chunk).
+
+    Uniform draws are taken from a NumPy `Generator` a batch at a time, so a pass drawing once per tile (or
+    entity) costs one vectorized call per `batch_size` draws.
+
+    Attributes
+    ----------
+    generator: np.random.Generator
+        The underlying generator (for callers drawing whole arrays).
+    batch_size: int
+        Number of uniform draws made per refill.
+    seeded: bool
+        Whether the stream derives from a simulation seed, its ids (see `new_id`) are then drawn from it too.
+    """
+
+    def __init__(self, generator: np.random.Generator, batch_size: int = 4096, seeded: bool = False) -> None:
+        self.generator: np.random.Generator = generator
+        self.batch_size: int = batch_size
+        self.seeded: bool = seeded
+        self._batch: list[float] = []
+
+    def random(self) -> float:
+        # a uniform draw in [0, 1)
+        if len(self._batch) == 0:
+            # reversed, so draws are popped in generator order
+            self._batch = self.generator.random(self.batch_size)[::-1].tolist()
+        return self._batch.pop()
+
+    def random_batch(self, size: int) -> np.ndarray:
+        # `size` uniform draws in [0, 1), as one array
+        return self.generator.random(size)
+
+    def new_id(self) -> str:
+        # a random (version 4) uuid, drawn from the stream when seeded, so seeded runs create the same documents
+        if not self.seeded:
+            return str(uuid.uuid4())
+        return str(uuid.UUID(bytes=self.generator.bytes(16), version=4))
+
+
+class SimulationRngService:
+    """
+    Hands out a random stream per world and per chunk, and a root stream (for what is created outside any world).
+
+    With a seed, every stream is derived from it and its key (world and chunk id) alone, so a run is
+    reproducible regardless of the order streams are first used in. The ids of created documents are drawn from
+    the streams as well, so the keys themselves repeat from run to run. Without one, streams are freshly seeded.
+
+    Attributes
+    ----------
+    seed: int | None
+        The base seed.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed: int | None = seed
+        self._streams: dict[tuple[str, ...], SimulationRng] = {}
+
+    @staticmethod
+    def _spawn_key(key: tuple[str, ...]) -> tuple[int, ...]:
+        # stable across processes (unlike `hash`)
+        return tuple(int.from_bytes(hashlib.sha256(part.encode("utf-8")).digest()[:8], "big") for part in key)
+
+    def stream(self, world_id: str | None = None, chunk_id: str | None = None) -> SimulationRng:
+        # the root stream when `world_id` is None
+        key: tuple[str, ...] = tuple(part for part in (world_id, chunk_id) if part is not None)
+        if key not in self._streams:
+            sequence: np.random.SeedSequence = (
+                np.random.SeedSequence(entropy=self.seed, spawn_key=SimulationRngService._spawn_key(key))
+                if self.seed is not None
+                else np.random.SeedSequence()
+            )
+            self._streams[key] = SimulationRng(generator=np.random.default_rng(sequence), seeded=self.seed is not None)
+        return self._streams[key]
+
+    def forget(self, world_id: str, chunk_id: str | None = None) -> None:
+        # drops the stream of a deleted world or chunk (a world drops its chunks' streams as well)
+        if chunk_id is not None:
+            self._streams.pop((world_id, chunk_id), None)
+            return
+        for key in [key for key in self._streams if key[:1] == (world_id,)]:
+            del self._streams[key]
+
+    @asynccontextmanager
+    async def scope(self, world_id: str | None = None, chunk_id: str | None = None) -> AsyncIterator[SimulationRng]:
+        # Draws within the scope (and any tasks it spawns) come from the stream of the world / chunk
+        rng: SimulationRng = self.stream(world_id=world_id, chunk_id=chunk_id)
+        token = scoped_rng.set(rng)
+        try:
+            yield rng
+        finally:
+            scoped_rng.reset(token)
+
+
+# Stream bound by `SimulationRngService.scope` (per quantum pass)
+scoped_rng: ContextVar[SimulationRng | None] = ContextVar("scoped_rng", default=None)
+
+# Unseeded stream for draws made outside of any scope
+default_rng: SimulationRng = SimulationRng(generator=np.random.default_rng())
+
+
+def active_rng() -> SimulationRng:
+    scoped: SimulationRng | None = scoped_rng.get()
+    return scoped if scoped is not None else default_rng
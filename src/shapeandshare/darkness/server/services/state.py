@@ -1,34 +1,42 @@
+import asyncio
 import logging
 
-from pydantic import BaseModel
-from pymongo.results import DeleteResult, UpdateResult
+from pydantic import BaseModel, Field
 
+from ...sdk.contracts.dtos.coordinate import Coordinate
 from ...sdk.contracts.dtos.entities.entity import Entity
 from ...sdk.contracts.dtos.sdk.requests.chunk.chunk import ChunkRequest
 from ...sdk.contracts.dtos.sdk.requests.chunk.create import ChunkCreateRequest
 from ...sdk.contracts.dtos.sdk.requests.chunk.delete import ChunkDeleteRequest
+from ...sdk.contracts.dtos.sdk.requests.chunk.fastforward import ChunkFastForwardRequest
 from ...sdk.contracts.dtos.sdk.requests.chunk.get import ChunkGetRequest
 from ...sdk.contracts.dtos.sdk.requests.chunk.patch import ChunkPatchRequest
 from ...sdk.contracts.dtos.sdk.requests.entity.delete import EntityDeleteRequest
 from ...sdk.contracts.dtos.sdk.requests.entity.entity import EntityRequest
 from ...sdk.contracts.dtos.sdk.requests.entity.patch import EntityPatchRequest
+from ...sdk.contracts.dtos.sdk.requests.tile.at import TileAtRequest
 from ...sdk.contracts.dtos.sdk.requests.tile.delete import TileDeleteRequest
 from ...sdk.contracts.dtos.sdk.requests.tile.get import TileGetRequest
 from ...sdk.contracts.dtos.sdk.requests.tile.patch import TilePatchRequest
+from ...sdk.contracts.dtos.sdk.requests.tile.window import TileWindowRequest
 from ...sdk.contracts.dtos.sdk.requests.world.create import WorldCreateRequest
 from ...sdk.contracts.dtos.sdk.requests.world.delete import WorldDeleteRequest
 from ...sdk.contracts.dtos.sdk.requests.world.get import WorldGetRequest
 from ...sdk.contracts.dtos.sdk.requests.world.patch import WorldPatchRequest
 from ...sdk.contracts.dtos.tiles.address import Address
 from ...sdk.contracts.dtos.tiles.chunk import Chunk
+from ...sdk.contracts.dtos.tiles.grid import Grid
 from ...sdk.contracts.dtos.tiles.tile import Tile
 from ...sdk.contracts.dtos.tiles.world import World
+from ...sdk.contracts.errors.server.dao.doesnotexist import DaoDoesNotExistError
 from ...sdk.contracts.types.connection import TileConnectionType
 from ...sdk.contracts.types.dao_document import DaoDocumentType
 from ..clients.dao import DaoClient
+from ..clients.grid import decode_grid, encode_grid, walk_layout
 from ..factories.chunk.flat import FlatChunkFactory
 from ..factories.entity.entity import EntityFactory
 from ..factories.world.world import WorldFactory
+from .rng import SimulationRngService
 
 logger = logging.getLogger()
 
@@ -41,35 +49,41 @@ class StateService(BaseModel):
     entity_factory: EntityFactory
     flatchunk_factory: FlatChunkFactory
 
+    # random streams of the simulation, per world (generation) and per chunk (quantum passes)
+    rng: SimulationRngService = Field(default_factory=SimulationRngService)
+
     class Config:
         arbitrary_types_allowed = True
 
     ### Worlds ##################################
 
-    async def worlds_get(self) -> list[World]:
-        return await self.daoclient.get_all(doc_type=DaoDocumentType.WORLD)
+    async def worlds_get(self, batch_size: int | None = None) -> list[World]:
+        # streamed a cursor batch at a time, only the validated worlds are held (no raw documents)
+        worlds: list[World] = []
+        async for batch in self.daoclient.iter_all(doc_type=DaoDocumentType.WORLD, batch_size=batch_size):
+            worlds.extend(batch)
+        return worlds
 
     ### World ##################################
 
     async def world_create(self, request: WorldCreateRequest) -> str:
         logger.debug("[StateService] creating world")
-        return await self.world_factory.create(name=request.name)
+        # worlds are created from the root stream (the world's own stream is keyed by its id)
+        async with self.rng.scope():
+            return await self.world_factory.create(name=request.name)
 
     async def world_lite_get(self, request: WorldGetRequest) -> World:
         return await self.daoclient.get(address=Address(world_id=request.id))
 
     async def world_get(self, request: WorldGetRequest) -> World:
-        # TODO: needs conversion to daoclient backend
-
-        # Build a complete World from Lite objects
+        # Build a complete World from Lite objects (decoded once, hydrated in place)
         world: World = await self.daoclient.get(address=Address(world_id=request.id))
 
-        partial_world = world.model_dump(exclude={"ids"})
-        world: World = World.model_validate(partial_world)
-
-        chunk_ids: set[str] = world.ids
-        for chunk_id in chunk_ids:
-            local_chunk: Chunk = await self.chunk_get(request=ChunkGetRequest(world_id=request.id, chunk_id=chunk_id))
+        chunk_ids: list[str] = list(world.ids)
+        local_chunks: list[Chunk] = await asyncio.gather(
+            *[self.chunk_get(request=ChunkGetRequest(world_id=request.id, chunk_id=chunk_id)) for chunk_id in chunk_ids]
+        )
+        for chunk_id, local_chunk in zip(chunk_ids, local_chunks):
             world.contents[chunk_id] = local_chunk
         return world
 
@@ -77,19 +91,19 @@ class StateService(BaseModel):
         logger.debug("[StateService] deleting world")
 
         if request.cascade:
-            world: World = await self.world_get(request=WorldGetRequest(id=request.id))
-            for chunk_id in world.ids:
-                await self.chunk_delete(
-                    request=ChunkDeleteRequest(world_id=request.id, chunk_id=chunk_id, cascade=request.cascade)
-                )
+            # children carry their parent ids, so each level is a single (indexed) delete
+            address_world: Address = Address(world_id=request.id)
+            for doc_type in (DaoDocumentType.ENTITY, DaoDocumentType.TILE, DaoDocumentType.CHUNK):
+                await self.daoclient.delete_scoped(address=address_world, doc_type=doc_type)
 
         # lastly delete the world
-        result: DeleteResult = await self.daoclient.delete(address=Address(world_id=request.id))
-        if result.deleted_count == 1:
+        deleted_count: int = await self.daoclient.delete(address=Address(world_id=request.id))
+        self.rng.forget(world_id=request.id)
+        if deleted_count == 1:
             return True
         return False
 
-    async def world_patch(self, request: WorldPatchRequest) -> UpdateResult:
+    async def world_patch(self, request: WorldPatchRequest) -> int:
         address_world: Address = Address.model_validate({"world_id": request.world_id})
         return await self.daoclient.patch(address=address_world, document=request.partial)
 
@@ -97,22 +111,36 @@ class StateService(BaseModel):
 
     async def chunk_create(self, request: ChunkCreateRequest) -> str:
         logger.debug("[StateService] creating chunk")
-        new_chunk: Chunk = await self.flatchunk_factory.create(
-            world_id=request.world_id, name=request.name, dimensions=request.dimensions, biome=request.biome
-        )
+        if request.bulk:
+            async with self.rng.scope(world_id=request.world_id):
+                new_chunk: Chunk = self.flatchunk_factory.build(
+                    world_id=request.world_id, name=request.name, dimensions=request.dimensions, biome=request.biome
+                )
+            await self.flatchunk_factory.commit(chunk=new_chunk)
+            return new_chunk.id
+
+        async with (
+            self.daoclient.cache_scope() as cache,
+            self.daoclient.write_behind() as buffer,
+            self.rng.scope(world_id=request.world_id),
+        ):
+            new_chunk: Chunk = await self.flatchunk_factory.create(
+                world_id=request.world_id, name=request.name, dimensions=request.dimensions, biome=request.biome
+            )
 
-        # Entity Factory Terrain Creation
-        address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": new_chunk.id})
-        await self.entity_factory.terrain_generate(address=address_chunk, chunk=new_chunk)
+            # Entity Factory Terrain Creation
+            address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": new_chunk.id})
+            await self.entity_factory.terrain_generate(address=address_chunk, chunk=new_chunk)
 
-        new_chunk: Chunk = await self.daoclient.get(address=address_chunk)
+            new_chunk: Chunk = await self.daoclient.get(address=address_chunk)
+        logger.debug("[StateService] chunk creation cache stats: %s, write stats: %s", cache.stats(), buffer.stats())
 
         # # Entity Factory Quantum
         # await self.entity_factory.quantum(address=address_chunk)
 
         return new_chunk.id
 
-    async def chunk_patch(self, request: ChunkPatchRequest) -> UpdateResult:
+    async def chunk_patch(self, request: ChunkPatchRequest) -> int:
         address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
         return await self.daoclient.patch(address=address_chunk, document=request.partial)
 
@@ -122,27 +150,17 @@ class StateService(BaseModel):
         address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
 
         if request.parent:
-            parent: World = await self.world_get(request=WorldGetRequest(world_id=request.world_id))
-            new_ids = [id for id in parent.ids if id != request.chunk_id]
-            await self.world_patch(request=WorldPatchRequest(world_id=request.world_id, partial={"ids": new_ids}))
+            address_world: Address = Address.model_validate({"world_id": request.world_id})
+            await self.daoclient.remove_from_set(address=address_world, field="ids", values=[request.chunk_id])
 
         if request.cascade:
-            chunk: Chunk = await self.chunk_get(
-                request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
-            )
-            for tile_id in chunk.ids:
-                await self.tile_delete(
-                    request=TileDeleteRequest(
-                        world_id=request.world_id,
-                        chunk_id=request.chunk_id,
-                        tile_id=tile_id,
-                        cascade=request.cascade,
-                        parent=False,
-                    )
-                )
+            # children carry their parent ids, so each level is a single (indexed) delete
+            for doc_type in (DaoDocumentType.ENTITY, DaoDocumentType.TILE):
+                await self.daoclient.delete_scoped(address=address_chunk, doc_type=doc_type)
 
         # lastly delete the chunk
         await self.daoclient.delete(address=address_chunk)
+        self.rng.forget(world_id=request.world_id, chunk_id=request.chunk_id)
 
         return True
 
@@ -155,33 +173,129 @@ class StateService(BaseModel):
         address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
         chunk: Chunk = await self.daoclient.get(address=address_chunk)
 
-        chunk_partial = chunk.model_dump(exclude={"tile_ids"})
-        chunk: Chunk = Chunk.model_validate(chunk_partial)
-
-        # re-hydrate the tiles
-        tile_ids: set[str] = chunk.ids
-        for tile_id in tile_ids:
-            tile: Tile = await self.tile_get(
-                request=TileGetRequest(world_id=request.world_id, chunk_id=chunk.id, tile_id=tile_id)
-            )
-
-            # Add finalized tile to chunk
+        # packed chunks hold their tiles and entities, so are complete in a single read
+        if chunk.grid is not None:
+            chunk.contents = decode_grid(grid=chunk.grid, world_id=request.world_id, chunk_id=chunk.id)
+            chunk.ids = set(chunk.contents.keys())
+            chunk.grid = None
+            return chunk
+
+        # re-hydrate the tiles and their entities, each with a single scoped query streamed into place
+        async for tiles in self.daoclient.iter_scoped(address=address_chunk, doc_type=DaoDocumentType.TILE):
+            for tile in tiles:
+                chunk.contents[tile.id] = tile
+
+        async for entities in self.daoclient.iter_scoped(address=address_chunk, doc_type=DaoDocumentType.ENTITY):
+            for entity in entities:
+                if entity.tile_id in chunk.contents:
+                    chunk.contents[entity.tile_id].contents[entity.id] = entity
+
+        # documents written before parent ids were stamped are only reachable by id
+        missing_tile_ids: list[str] = [tile_id for tile_id in chunk.ids if tile_id not in chunk.contents]
+        missing_tiles: list[Tile] = await asyncio.gather(
+            *[
+                self.tile_get(request=TileGetRequest(world_id=request.world_id, chunk_id=chunk.id, tile_id=tile_id))
+                for tile_id in missing_tile_ids
+            ]
+        )
+        for tile_id, tile in zip(missing_tile_ids, missing_tiles):
             chunk.contents[tile_id] = tile
 
         return chunk
 
+    async def chunk_pack(self, request: ChunkRequest) -> int:
+        # Migrates a chunk from the per-tile layout into its packed `Grid`, returning the number of tiles packed.
+        # Packed chunks are read (and written) whole, and are not visited by quantum passes until unpacked.
+        address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        chunk: Chunk = await self.chunk_get(
+            request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        )
+        if len(chunk.contents) == 0:
+            return 0
+
+        width, height, tile_ids = walk_layout(origin=chunk.origin, tiles=chunk.contents)
+        grid: Grid = encode_grid(width=width, height=height, tile_ids=tile_ids, tiles=chunk.contents)
+
+        # the grid is stored before the documents it replaces are removed
+        await self.daoclient.patch(address=address_chunk, document={"grid": grid.model_dump(mode="json"), "ids": []})
+        for doc_type in (DaoDocumentType.ENTITY, DaoDocumentType.TILE):
+            await self.daoclient.delete_scoped(address=address_chunk, doc_type=doc_type)
+        return len(tile_ids)
+
+    async def chunk_unpack(self, request: ChunkRequest) -> int:
+        # Migrates a packed chunk back to the per-tile layout, returning the number of tiles unpacked.
+        address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        chunk: Chunk = await self.daoclient.get(address=address_chunk)
+        if chunk.grid is None:
+            return 0
+
+        tiles: dict[str, Tile] = decode_grid(grid=chunk.grid, world_id=request.world_id, chunk_id=chunk.id)
+        documents: list[tuple[Address, Tile | Entity]] = []
+        for tile in tiles.values():
+            address_tile: Address = Address.model_validate({**address_chunk.model_dump(), "tile_id": tile.id})
+            for entity in tile.contents.values():
+                documents.append(
+                    (Address.model_validate({**address_tile.model_dump(), "entity_id": entity.id}), entity)
+                )
+            tile.contents = {}
+            documents.append((address_tile, tile))
+        await self.daoclient.post_multi(documents=documents)
+
+        await self.daoclient.patch(
+            address=address_chunk, document={"grid": None, "ids": list(tiles.keys()), "active": None}
+        )
+        return len(tiles)
+
+    # Each tick runs within its own dao cache scope, repeated reads within a pass never leave the process,
+    # and its own write-behind scope, patches are merged per document and flushed as one bulk write.
+    # Its random draws come from the chunk's own stream.
+
     async def chunk_quantum(self, request: ChunkRequest):
         address: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id)
-        await self.flatchunk_factory.quantum(address=address)
-        await self.entity_factory.quantum(address=address)
+        async with (
+            self.daoclient.cache_scope() as cache,
+            self.daoclient.write_behind() as buffer,
+            self.rng.scope(world_id=request.world_id, chunk_id=request.chunk_id),
+        ):
+            await self.flatchunk_factory.quantum(address=address)
+            await self.entity_factory.quantum(address=address)
+        logger.debug("[StateService] chunk quantum cache stats: %s, write stats: %s", cache.stats(), buffer.stats())
 
     async def chunk_quantum_tile(self, request: ChunkRequest):
         address: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id)
-        await self.flatchunk_factory.quantum(address=address)
+        async with (
+            self.daoclient.cache_scope() as cache,
+            self.daoclient.write_behind() as buffer,
+            self.rng.scope(world_id=request.world_id, chunk_id=request.chunk_id),
+        ):
+            await self.flatchunk_factory.quantum(address=address)
+        logger.debug(
+            "[StateService] chunk tile quantum cache stats: %s, write stats: %s", cache.stats(), buffer.stats()
+        )
 
     async def chunk_quantum_entity(self, request: ChunkRequest):
         address: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id)
-        await self.entity_factory.quantum(address=address)
+        async with (
+            self.daoclient.cache_scope() as cache,
+            self.daoclient.write_behind() as buffer,
+            self.rng.scope(world_id=request.world_id, chunk_id=request.chunk_id),
+        ):
+            await self.entity_factory.quantum(address=address)
+        logger.debug(
+            "[StateService] chunk entity quantum cache stats: %s, write stats: %s", cache.stats(), buffer.stats()
+        )
+
+    async def chunk_fast_forward(self, request: ChunkFastForwardRequest) -> int:
+        # Catches a chunk's entities up by many ticks at once (e.g. after downtime), returns the number changed
+        address: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id)
+        async with (
+            self.daoclient.cache_scope(),
+            self.daoclient.write_behind() as buffer,
+            self.rng.scope(world_id=request.world_id, chunk_id=request.chunk_id),
+        ):
+            changed: int = await self.entity_factory.fast_forward(address=address, ticks=request.ticks)
+        logger.debug("[StateService] chunk fast forward (%s ticks) write stats: %s", request.ticks, buffer.stats())
+        return changed
 
     ### Tile ##################################
 
@@ -195,29 +309,72 @@ class StateService(BaseModel):
         tile: Tile = await self.tile_lite_get(request=request)
 
         # re-hydrate the entities
-        entity_ids: set[str] = tile.ids
-        for entity_id in entity_ids:
-            entity_request: EntityRequest = EntityRequest.model_validate(
-                {
-                    "world_id": request.world_id,
-                    "chunk_id": request.chunk_id,
-                    "tile_id": request.tile_id,
-                    "entity_id": entity_id,
-                }
-            )
-
-            entity: Entity = await self.entity_get(request=entity_request)
+        entity_ids: list[str] = list(tile.ids)
+        entities: list[Entity] = await asyncio.gather(
+            *[
+                self.entity_get(
+                    request=EntityRequest(
+                        world_id=request.world_id,
+                        chunk_id=request.chunk_id,
+                        tile_id=request.tile_id,
+                        entity_id=entity_id,
+                    )
+                )
+                for entity_id in entity_ids
+            ]
+        )
 
-            # add finalized entity to tile
+        # add finalized entities to tile
+        for entity_id, entity in zip(entity_ids, entities):
             tile.contents[entity_id] = entity
 
         return tile
 
-    async def tile_patch(self, request: TilePatchRequest) -> UpdateResult:
+    async def tile_at_get(self, request: TileAtRequest) -> Tile:
+        # the tile (lite) at a chunk position, an indexed lookup
+        address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        try:
+            return await self.daoclient.get_at(address=address_chunk, coordinate=Coordinate(x=request.x, y=request.y))
+        except DaoDoesNotExistError as error:
+            # packed chunks have no tile documents, their tiles are positioned by the grid itself
+            tiles: list[Tile] = await self._packed_tiles(address=address_chunk)
+            for tile in tiles:
+                if tile.x == request.x and tile.y == request.y:
+                    return tile
+            raise error
+
+    async def tiles_window_get(self, request: TileWindowRequest) -> list[Tile]:
+        # the tiles (lite) of a chunk within the (inclusive) window, in row-major order
+        address_chunk: Address = Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        tiles: list[Tile] = await self.daoclient.get_window(address=address_chunk, window=request.window)
+        if len(tiles) == 0:
+            tiles = [
+                tile
+                for tile in await self._packed_tiles(address=address_chunk)
+                if request.window.min.x <= tile.x <= request.window.max.x
+                and request.window.min.y <= tile.y <= request.window.max.y
+            ]
+        return sorted(tiles, key=lambda tile: (tile.y, tile.x))
+
+    async def _packed_tiles(self, address: Address) -> list[Tile]:
+        chunk: Chunk = await self.daoclient.get(address=address)
+        if chunk.grid is None:
+            return []
+
+        tiles: dict[str, Tile] = decode_grid(grid=chunk.grid, world_id=chunk.world_id, chunk_id=chunk.id)
+        for tile in tiles.values():
+            tile.contents = {}
+        return list(tiles.values())
+
+    async def tile_patch(self, request: TilePatchRequest) -> int:
         address_tile: Address = Address.model_validate(
             {"world_id": request.world_id, "chunk_id": request.chunk_id, "tile_id": request.tile_id}
         )
-        return await self.daoclient.patch(address=address_tile, document=request.partial)
+        patched_count: int = await self.daoclient.patch(address=address_tile, document=request.partial)
+        await self.flatchunk_factory.touch(
+            address=Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        )
+        return patched_count
 
     async def tile_delete(self, request: TileDeleteRequest) -> bool:
         address_tile: Address = Address.model_validate(
@@ -226,36 +383,23 @@ class StateService(BaseModel):
 
         # update parent if flagged
         if request.parent:
-            parent: Chunk = await self.chunk_get(
-                request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
-            )
-            new_ids = [id for id in parent.ids if id != request.tile_id]
-            await self.chunk_patch(
-                request=ChunkPatchRequest(
-                    world_id=request.world_id, chunk_id=request.chunk_id, partial={"ids": new_ids}
-                )
+            address_chunk: Address = Address.model_validate(
+                {"world_id": request.world_id, "chunk_id": request.chunk_id}
             )
+            await self.daoclient.remove_from_set(address=address_chunk, field="ids", values=[request.tile_id])
 
         # cascade down if flagged
         if request.cascade:
             # 1. Remove all entities
             # 2. Unhook the neighbors
 
-            tile: Tile = await self.tile_get(
+            tile: Tile = await self.tile_lite_get(
                 request=TileGetRequest(world_id=request.world_id, chunk_id=request.chunk_id, tile_id=request.tile_id)
             )
 
             # 1. Remove all entities
-            for entity_id in tile.ids:
-                await self.entity_delete(
-                    request=EntityDeleteRequest(
-                        world_id=request.world_id,
-                        chunk_id=request.chunk_id,
-                        tile_id=request.tile_id,
-                        entity_id=entity_id,
-                        parent=False,  # Since are are removing the tile in this logic we don't need to update its parent
-                    )
-                )
+            # Since are are removing the tile in this logic we don't need to update its parent
+            await self.daoclient.delete_scoped(address=address_tile, doc_type=DaoDocumentType.ENTITY)
 
             # 2. Unhook the neighbors
             for conn_type, neighbor_id in tile.next.items():
@@ -282,6 +426,9 @@ class StateService(BaseModel):
 
         # 3. lastly delete the tile
         await self.daoclient.delete(address=address_tile)
+        await self.flatchunk_factory.touch(
+            address=Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        )
 
         return True
 
@@ -298,7 +445,7 @@ class StateService(BaseModel):
         )
         return await self.daoclient.get(address=address_entity)
 
-    async def entity_patch(self, request: EntityPatchRequest) -> UpdateResult:
+    async def entity_patch(self, request: EntityPatchRequest) -> int:
         address_entity: Address = Address.model_validate(
             {
                 "world_id": request.world_id,
@@ -321,20 +468,15 @@ class StateService(BaseModel):
 
         if request.parent:
             # remove self from containing tile
-            tile: Tile = await self.tile_get(
-                request=TileGetRequest(world_id=request.world_id, chunk_id=request.chunk_id, tile_id=request.tile_id)
-            )
-            new_ids: list[str] = [id for id in tile.ids if id != request.entity_id]
-            await self.tile_patch(
-                request=TilePatchRequest(
-                    world_id=request.world_id,
-                    chunk_id=request.chunk_id,
-                    tile_id=request.tile_id,
-                    partial={"ids": new_ids},
-                )
+            address_tile: Address = Address.model_validate(
+                {"world_id": request.world_id, "chunk_id": request.chunk_id, "tile_id": request.tile_id}
             )
+            await self.daoclient.remove_from_set(address=address_tile, field="ids", values=[request.entity_id])
 
         # Lastly delete the entity
         await self.daoclient.delete(address=address_entity)
+        await self.flatchunk_factory.touch(
+            address=Address.model_validate({"world_id": request.world_id, "chunk_id": request.chunk_id})
+        )
 
         return True
@@ -0,0 +1,55 @@
+import asyncio
+import itertools
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from shapeandshare.darkness.server.clients.dao import DaoClient
+from shapeandshare.darkness.server.clients.storage.abstract import AbstractStorage
+from shapeandshare.darkness.server.clients.storage.memory import MemoryStorage
+from shapeandshare.darkness.server.clients.storage.sqlite import SqliteStorage
+from shapeandshare.darkness.server.factories.chunk.flat import FlatChunkFactory
+from shapeandshare.darkness.server.factories.entity.entity import EntityFactory
+from shapeandshare.darkness.server.factories.world.world import WorldFactory
+from shapeandshare.darkness.server.services.rng import SimulationRngService
+from shapeandshare.darkness.server.services.state import StateService
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage_factory(request: pytest.FixtureRequest, tmp_path: Path) -> Callable[[], AbstractStorage]:
+    # a fresh store of each single node backend
+    if request.param == "memory":
+        return MemoryStorage
+    paths: Iterator[Path] = (tmp_path / f"darkness-{index}.db" for index in itertools.count())
+    return lambda: SqliteStorage(path=str(next(paths)))
+
+
+@pytest.fixture
+def storage(storage_factory: Callable[[], AbstractStorage]) -> AbstractStorage:
+    return storage_factory()
+
+
+def _state_service(storage: AbstractStorage, seed: int | None) -> StateService:
+    daoclient: DaoClient = DaoClient(storage=storage)
+    asyncio.run(daoclient.create_indexes())
+
+    entity_factory: EntityFactory = EntityFactory(daoclient=daoclient)
+    return StateService(
+        daoclient=daoclient,
+        entity_factory=entity_factory,
+        world_factory=WorldFactory(daoclient=daoclient),
+        flatchunk_factory=FlatChunkFactory(daoclient=daoclient, entity_factory=entity_factory),
+        rng=SimulationRngService(seed=seed),
+    )
+
+
+@pytest.fixture
+def state_service(storage: AbstractStorage) -> StateService:
+    return _state_service(storage=storage, seed=7)
+
+
+@pytest.fixture
+def state_service_factory(storage_factory: Callable[[], AbstractStorage]) -> Callable[[int | None], StateService]:
+    # a fresh service (over a fresh store) per call, with the given simulation seed
+    return lambda seed: _state_service(storage=storage_factory(), seed=seed)
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from shapeandshare.darkness.sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+from shapeandshare.darkness.sdk.contracts.types.dao_document import DaoDocumentType
+from shapeandshare.darkness.server.clients.storage.abstract import AbstractStorage, StorageWrite
+from shapeandshare.darkness.server.clients.storage.sqlite import SqliteStorage
+
+TILE: DaoDocumentType = DaoDocumentType.TILE
+
+
+def _documents() -> list[dict]:
+    return [
+        {"id": f"t{index}", "chunk_id": "c1" if index < 3 else "c2", "x": index, "ids": ["a"], "meta": {"depth": index}}
+        for index in range(5)
+    ]
+
+
+async def _find(storage: AbstractStorage, query: dict, projection: dict | None = None, batch_size: int | None = None):
+    return [
+        document
+        async for document in storage.find(doc_type=TILE, query=query, projection=projection, batch_size=batch_size)
+    ]
+
+
+async def _seeded(storage: AbstractStorage, indexed: bool = True) -> AbstractStorage:
+    if indexed:
+        await storage.create_index(doc_type=TILE, fields=["chunk_id", "x"])
+    assert await storage.insert_many(doc_type=TILE, documents=_documents()) == 5
+    return storage
+
+
+def test_find_conditions(storage: AbstractStorage):
+    async def run() -> dict[str, list[str]]:
+        await _seeded(storage=storage)
+        queries: dict[str, dict] = {
+            "equality": {"chunk_id": "c1"},
+            "in": {"id": {"$in": ["t4", "t1", "t9"]}},
+            "in_field": {"x": {"$in": [0, 3]}},
+            "range": {"chunk_id": "c1", "x": {"$gt": 0, "$lte": 2}},
+            "nested": {"meta.depth": {"$gte": 3}},
+            "missing": {"name": None},
+            "none": {"chunk_id": "c3"},
+        }
+        return {
+            label: sorted(document["id"] for document in await _find(storage=storage, query=query))
+            for label, query in queries.items()
+        }
+
+    found: dict[str, list[str]] = asyncio.run(run())
+    assert found["equality"] == ["t0", "t1", "t2"]
+    assert found["in"] == ["t1", "t4"]
+    assert found["in_field"] == ["t0", "t3"]
+    assert found["range"] == ["t1", "t2"]
+    assert found["nested"] == ["t3", "t4"]
+    assert found["missing"] == ["t0", "t1", "t2", "t3", "t4"]
+    assert found["none"] == []
+
+
+def test_find_unindexed(storage: AbstractStorage):
+    # without an index, every document is tested against the query
+    async def run() -> list[str]:
+        await _seeded(storage=storage, indexed=False)
+        return sorted(document["id"] for document in await _find(storage=storage, query={"chunk_id": "c2"}))
+
+    assert asyncio.run(run()) == ["t3", "t4"]
+
+
+def test_find_unsupported_operator(storage: AbstractStorage):
+    async def run() -> None:
+        await _seeded(storage=storage)
+        await _find(storage=storage, query={"x": {"$ne": 1}})
+
+    with pytest.raises(DaoUnknownError):
+        asyncio.run(run())
+
+
+def test_projection(storage: AbstractStorage):
+    async def run() -> tuple[dict | None, list[dict]]:
+        await _seeded(storage=storage)
+        single: dict | None = await storage.find_one(
+            doc_type=TILE, query={"id": "t2"}, projection={"_id": 0, "id": 1, "meta.depth": 1, "missing": 1}
+        )
+        return single, await _find(storage=storage, query={"chunk_id": "c2"}, projection={"x": 1})
+
+    single, many = asyncio.run(run())
+    assert single == {"id": "t2", "meta": {"depth": 2}}
+    assert sorted(document["x"] for document in many) == [3, 4]
+    assert all(document.keys() == {"x"} for document in many)
+
+
+def test_keyset_pagination(storage: AbstractStorage):
+    # paged reads return every matching document exactly once, for page sizes dividing the result or not
+    async def run() -> dict[int | None, list[str]]:
+        await _seeded(storage=storage)
+        return {
+            batch_size: [document["id"] for document in await _find(storage=storage, query={}, batch_size=batch_size)]
+            for batch_size in (None, 1, 2, 5, 10)
+        }
+
+    for ids in asyncio.run(run()).values():
+        assert sorted(ids) == ["t0", "t1", "t2", "t3", "t4"]
+        assert len(ids) == 5
+
+
+def test_update_operators(storage: AbstractStorage):
+    async def run() -> tuple[list[int], dict | None]:
+        await _seeded(storage=storage)
+        counts: list[int] = [
+            await storage.update_one(doc_type=TILE, query={"id": "t1"}, update={"$set": {"x": 10, "meta.depth": 7}}),
+            await storage.update_one(doc_type=TILE, query={"id": "t1"}, update={"$addToSet": {"ids": "b"}}),
+            await storage.update_one(
+                doc_type=TILE, query={"id": "t1"}, update={"$addToSet": {"ids": {"$each": ["a", "c", "c"]}}}
+            ),
+            await storage.update_one(doc_type=TILE, query={"id": "t1"}, update={"$pull": {"ids": "b"}}),
+            await storage.update_one(doc_type=TILE, query={"id": "t1"}, update={"$addToSet": {"tags": "new"}}),
+            await storage.update_one(doc_type=TILE, query={"id": "t9"}, update={"$set": {"x": 1}}),
+        ]
+        return counts, await storage.find_one(doc_type=TILE, query={"id": "t1"})
+
+    counts, document = asyncio.run(run())
+    assert counts == [1, 1, 1, 1, 1, 0]
+    assert document["x"] == 10
+    assert document["meta"] == {"depth": 7}
+    assert document["ids"] == ["a", "c"]
+    assert document["tags"] == ["new"]
+
+
+def test_update_pull_in_and_index(storage: AbstractStorage):
+    # updated fields are found through the index afterwards
+    async def run() -> tuple[dict | None, list[str], list[str]]:
+        await _seeded(storage=storage)
+        await storage.update_one(
+            doc_type=TILE, query={"id": "t0"}, update={"$addToSet": {"ids": {"$each": ["b", "c"]}}}
+        )
+        await storage.update_one(doc_type=TILE, query={"id": "t0"}, update={"$pull": {"ids": {"$in": ["a", "c"]}}})
+        await storage.update_one(doc_type=TILE, query={"id": "t0"}, update={"$set": {"chunk_id": "c2"}})
+        return (
+            await storage.find_one(doc_type=TILE, query={"id": "t0"}),
+            sorted(document["id"] for document in await _find(storage=storage, query={"chunk_id": "c2"})),
+            sorted(document["id"] for document in await _find(storage=storage, query={"chunk_id": "c1"})),
+        )
+
+    document, moved, remaining = asyncio.run(run())
+    assert document["ids"] == ["b"]
+    assert moved == ["t0", "t3", "t4"]
+    assert remaining == ["t1", "t2"]
+
+
+def test_upsert_and_bulk_write(storage: AbstractStorage):
+    async def run() -> tuple[int, list[dict]]:
+        await _seeded(storage=storage)
+        written: int = await storage.bulk_write(
+            doc_type=TILE,
+            operations=[
+                StorageWrite(query={"id": "t0"}, update={"$set": {"x": 20}}),
+                StorageWrite(query={"id": "t5", "chunk_id": "c3"}, update={"$set": {"x": 5}}, upsert=True),
+                StorageWrite(query={"id": "t6"}, update={"$set": {"x": 6}}),
+                StorageWrite(query={"id": "t1"}, replacement={"id": "t1", "chunk_id": "c3"}),
+            ],
+        )
+        return written, await _find(storage=storage, query={"id": {"$in": ["t0", "t1", "t5", "t6"]}})
+
+    written, documents = asyncio.run(run())
+    assert written == 3
+    by_id: dict[str, dict] = {document["id"]: document for document in documents}
+    assert by_id.keys() == {"t0", "t1", "t5"}
+    assert by_id["t0"]["x"] == 20
+    assert by_id["t1"] == {"id": "t1", "chunk_id": "c3"}
+    assert by_id["t5"] == {"id": "t5", "chunk_id": "c3", "x": 5}
+
+
+def test_delete(storage: AbstractStorage):
+    async def run() -> tuple[int, int, list[str]]:
+        await _seeded(storage=storage)
+        one: int = await storage.delete_one(doc_type=TILE, query={"chunk_id": "c2"})
+        many: int = await storage.delete_many(doc_type=TILE, query={"id": {"$in": ["t0", "t1", "t9"]}})
+        return one, many, sorted(document["id"] for document in await _find(storage=storage, query={}))
+
+    one, many, remaining = asyncio.run(run())
+    assert one == 1
+    assert many == 2
+    assert len(remaining) == 2
+    assert "t2" in remaining
+
+
+def test_sqlite_close_releases_worker(tmp_path: Path):
+    # closing stops the worker thread, the store opens again on its next use
+    async def run() -> tuple[int, int, dict | None]:
+        storage: SqliteStorage = await _seeded(storage=SqliteStorage(path=str(tmp_path / "close.db")))
+        running: int = threading.active_count()
+        await storage.close()
+        closed: int = threading.active_count()
+        document: dict | None = await storage.find_one(doc_type=TILE, query={"id": "t0"})
+        await storage.close()
+        return running, closed, document
+
+    running, closed, document = asyncio.run(run())
+    assert closed == running - 1
+    assert document["id"] == "t0"
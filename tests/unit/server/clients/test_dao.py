@@ -0,0 +1,35 @@
+import asyncio
+
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.address import Address
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.tile import Tile
+from shapeandshare.darkness.sdk.contracts.types.dao_document import DaoDocumentType
+from shapeandshare.darkness.sdk.contracts.types.tile import TileType
+from shapeandshare.darkness.server.clients.buffer import DaoWriteBuffer
+from shapeandshare.darkness.server.clients.dao import DaoClient
+from shapeandshare.darkness.server.clients.storage.abstract import AbstractStorage
+
+
+def test_delete_scoped_discards_pending_patches(storage: AbstractStorage):
+    # patches buffered for the deleted documents are dropped, those of other scopes are kept
+    async def run() -> tuple[dict, int, Tile]:
+        daoclient: DaoClient = DaoClient(storage=storage)
+        addresses: list[Address] = []
+        for chunk_id, tile_id in (("c1", "t1"), ("c1", "t2"), ("c2", "t3")):
+            address: Address = Address(world_id="w", chunk_id=chunk_id, tile_id=tile_id)
+            await daoclient.post(address=address, document=Tile(id=tile_id, world_id="w", chunk_id=chunk_id))
+            addresses.append(address)
+
+        buffer: DaoWriteBuffer
+        async with daoclient.write_behind() as buffer:
+            for address in addresses:
+                await daoclient.patch(address=address, document={"tile_type": TileType.GRASS})
+            deleted: int = await daoclient.delete_scoped(
+                address=Address(world_id="w", chunk_id="c1"), doc_type=DaoDocumentType.TILE
+            )
+            pending: dict = buffer.stats()
+        return pending, deleted, await daoclient.get(address=addresses[2])
+
+    pending, deleted, kept = asyncio.run(run())
+    assert deleted == 2
+    assert pending["pending"] == 1
+    assert kept.tile_type == TileType.GRASS
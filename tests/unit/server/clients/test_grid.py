@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.partial import TilePartial
+from shapeandshare.darkness.sdk.contracts.errors.server.dao.unknown import DaoUnknownError
+from shapeandshare.darkness.server.clients.grid import grid_neighbors, pack_mask, unpack_mask, walk_layout
+
+
+def _tiles(width: int, height: int) -> dict[str, TilePartial]:
+    tile_ids: list[str] = [f"t{index}" for index in range(width * height)]
+    return {
+        tile_id: TilePartial(
+            id=tile_id, next=grid_neighbors(tile_ids=tile_ids, width=width, height=height, index=index)
+        )
+        for index, tile_id in enumerate(tile_ids)
+    }
+
+
+def test_walk_layout():
+    assert walk_layout(origin="t0", tiles=_tiles(width=3, height=2)) == (3, 2, ["t0", "t1", "t2", "t3", "t4", "t5"])
+
+
+def test_walk_layout_missing_tile():
+    # a neighbor still pointing at a deleted tile
+    tiles: dict[str, TilePartial] = _tiles(width=3, height=2)
+    del tiles["t4"]
+    with pytest.raises(DaoUnknownError):
+        walk_layout(origin="t0", tiles=tiles)
+
+
+def test_pack_mask():
+    rng: np.random.Generator = np.random.default_rng(seed=3)
+    for shape in ((1, 1), (3, 5), (17, 9)):
+        mask: np.ndarray = rng.random(shape) < 0.3
+        assert (unpack_mask(packed=pack_mask(mask=mask), shape=shape) == mask).all()
+
+    # unset trailing cells take no space
+    assert pack_mask(mask=np.zeros((40, 40), dtype=bool)) == ""
+    assert not unpack_mask(packed="", shape=(40, 40)).any()
+    with pytest.raises(DaoUnknownError):
+        unpack_mask(packed=pack_mask(mask=np.ones((4, 4), dtype=bool)), shape=(1, 4))
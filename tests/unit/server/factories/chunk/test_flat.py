@@ -0,0 +1,239 @@
+import asyncio
+
+import numpy as np
+
+from shapeandshare.darkness import ChunkCreateRequest, WorldCreateRequest
+from shapeandshare.darkness.sdk.contracts.dtos.coordinate import Coordinate
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.address import Address
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.chunk import Chunk
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.tile import Tile
+from shapeandshare.darkness.sdk.contracts.dtos.window import Window
+from shapeandshare.darkness.sdk.contracts.types.tile import TileType
+from shapeandshare.darkness.server.clients.dao import DaoClient
+from shapeandshare.darkness.server.clients.grid import TILE_CODES, grid_neighbors, pack_mask, unpack_mask
+from shapeandshare.darkness.server.clients.storage.memory import MemoryStorage
+from shapeandshare.darkness.server.factories.chunk.automaton import (
+    FOREST_BY_GRASS,
+    GRASS_BY_FOREST,
+    GRASS_BY_WATER,
+    LIQUID_REACH,
+    eligible,
+    tile_generation,
+)
+from shapeandshare.darkness.server.factories.chunk.flat import FlatChunkFactory
+from shapeandshare.darkness.server.factories.chunk.terrain import distance_field
+from shapeandshare.darkness.server.factories.entity.entity import EntityFactory
+from shapeandshare.darkness.server.services.state import StateService
+
+OCEAN, WATER, DIRT, GRASS, FOREST, ROCK, SHORE = (
+    TileType.OCEAN,
+    TileType.WATER,
+    TileType.DIRT,
+    TileType.GRASS,
+    TileType.FOREST,
+    TileType.ROCK,
+    TileType.SHORE,
+)
+
+
+def _window(min_x: int, min_y: int, max_x: int, max_y: int) -> Window:
+    return Window(min=Coordinate(x=min_x, y=min_y), max=Coordinate(x=max_x, y=max_y))
+
+
+def test_windows_per_component():
+    # two far apart groups are kept as separate windows, not one box spanning the region
+    mask: np.ndarray = np.zeros((8, 8), dtype=bool)
+    mask[0, 0] = True
+    mask[0, 1] = True
+    mask[6:8, 7] = True
+    region: Window = _window(min_x=3, min_y=5, max_x=10, max_y=12)
+
+    windows: list[Window] = FlatChunkFactory._windows(mask=mask, region=region)
+    assert sorted(windows, key=lambda window: (window.min.y, window.min.x)) == [
+        _window(min_x=3, min_y=5, max_x=4, max_y=5),
+        _window(min_x=10, min_y=11, max_x=10, max_y=12),
+    ]
+
+
+def test_windows_empty():
+    region: Window = _window(min_x=1, min_y=1, max_x=4, max_y=4)
+    assert FlatChunkFactory._windows(mask=np.zeros((4, 4), dtype=bool), region=region) == []
+
+
+def _overlap(first: Window, second: Window) -> bool:
+    return (
+        first.min.x <= second.max.x
+        and second.min.x <= first.max.x
+        and first.min.y <= second.max.y
+        and second.min.y <= first.max.y
+    )
+
+
+def _contains(outer: Window, inner: Window) -> bool:
+    return (
+        outer.min.x <= inner.min.x
+        and outer.min.y <= inner.min.y
+        and inner.max.x <= outer.max.x
+        and inner.max.y <= outer.max.y
+    )
+
+
+def test_merge_windows():
+    # scattered windows are merged down to a capped number of disjoint windows covering all of them
+    rng: np.random.Generator = np.random.default_rng(seed=5)
+    windows: list[Window] = []
+    for x, y in rng.integers(1, 200, size=(300, 2)).tolist():
+        windows.append(_window(min_x=x, min_y=y, max_x=x + int(rng.integers(0, 6)), max_y=y + int(rng.integers(0, 6))))
+
+    for limit in (1, 4, 16, 1000):
+        merged: list[Window] = FlatChunkFactory._merge(windows=windows, limit=limit)
+        assert len(merged) <= limit
+        assert all(any(_contains(outer, window) for outer in merged) for window in windows)
+        assert not any(_overlap(first, second) for index, first in enumerate(merged) for second in merged[index + 1 :])
+
+    # apart windows are kept, overlapping ones joined
+    assert FlatChunkFactory._merge(
+        windows=[
+            _window(min_x=1, min_y=1, max_x=2, max_y=2),
+            _window(min_x=8, min_y=8, max_x=9, max_y=9),
+            _window(min_x=2, min_y=2, max_x=3, max_y=3),
+        ],
+        limit=16,
+    ) == [_window(min_x=8, min_y=8, max_x=9, max_y=9), _window(min_x=1, min_y=1, max_x=3, max_y=3)]
+
+
+class WindowRecordingChunkFactory(FlatChunkFactory):
+    # records the regions a tick reads by position
+    regions: list[Window] = []
+
+    async def _read_region(self, address: Address, region: Window) -> list[Tile] | None:
+        self.regions.append(region)
+        return await super()._read_region(address=address, region=region)
+
+
+def test_tick_reads_active_windows(state_service: StateService):
+    # a tick reads the neighborhoods of its active tiles only, not the box spanning all of them
+    async def run() -> tuple[list[Window], Chunk, Chunk]:
+        world_id: str = await state_service.world_create(request=WorldCreateRequest(name="test"))
+        chunk_id: str = await state_service.chunk_create(
+            request=ChunkCreateRequest(world_id=world_id, dimensions=(48, 40), biome=TileType.DIRT)
+        )
+        address: Address = Address(world_id=world_id, chunk_id=chunk_id)
+
+        mask: np.ndarray = np.zeros((40, 48), dtype=bool)
+        mask[4, 4] = True
+        mask[35, 40] = True
+        await state_service.daoclient.patch(address=address, document={"active": pack_mask(mask=mask)})
+
+        factory: WindowRecordingChunkFactory = WindowRecordingChunkFactory(
+            daoclient=state_service.daoclient, entity_factory=state_service.entity_factory
+        )
+        before: Chunk = await state_service.daoclient.get(address=address)
+        assert await factory.tick(address=address, chunk=before)
+        return factory.regions, before, await state_service.daoclient.get(address=address)
+
+    regions, before, after = asyncio.run(run())
+    assert sorted(regions, key=lambda window: (window.min.y, window.min.x)) == [
+        _window(min_x=5 - LIQUID_REACH, min_y=5 - LIQUID_REACH, max_x=5 + LIQUID_REACH, max_y=5 + LIQUID_REACH),
+        _window(min_x=41 - LIQUID_REACH, min_y=36 - LIQUID_REACH, max_x=41 + LIQUID_REACH, max_y=36 + LIQUID_REACH),
+    ]
+    # the next active tiles lie within the windows read
+    active: np.ndarray = unpack_mask(packed=after.active, shape=(40, 48))
+    within: np.ndarray = np.zeros(active.shape, dtype=bool)
+    for region in regions:
+        within[region.min.y - 1 : region.max.y, region.min.x - 1 : region.max.x] = True
+    assert (active <= within).all()
+    assert len(after.active) < len(pack_mask(mask=np.ones((40, 48), dtype=bool)))
+
+
+class RecordingChunkFactory(FlatChunkFactory):
+    # records each per-tile mutation the rules ask for instead of drawing for it
+    decisions: dict[str, tuple[float, TileType]] = {}
+
+    async def mutate_tile(self, address: Address, mutate: float, tile_type: TileType) -> None:
+        self.decisions[address.tile_id] = (mutate, tile_type)
+
+
+async def _per_tile_decisions(types: np.ndarray, populated: np.ndarray) -> dict[str, tuple[float, TileType]]:
+    height, width = types.shape
+    tile_ids: list[str] = [f"t{index}" for index in range(width * height)]
+    daoclient: DaoClient = DaoClient(storage=MemoryStorage())
+    factory: RecordingChunkFactory = RecordingChunkFactory(
+        daoclient=daoclient, entity_factory=EntityFactory(daoclient=daoclient)
+    )
+
+    addresses: list[Address] = [Address(world_id="w", chunk_id="c", tile_id=tile_id) for tile_id in tile_ids]
+    await daoclient.post_multi(
+        documents=[
+            (
+                address,
+                Tile(
+                    id=address.tile_id,
+                    world_id="w",
+                    chunk_id="c",
+                    tile_type=TILE_CODES[types.flat[index]],
+                    next=grid_neighbors(tile_ids=tile_ids, width=width, height=height, index=index),
+                    ids={"e"} if populated.flat[index] else set(),
+                ),
+            )
+            for index, address in enumerate(addresses)
+        ]
+    )
+    for address in addresses:
+        await factory.tile_grow(address=address)
+        await factory.tile_senescence(address=address)
+    return factory.decisions
+
+
+def test_tile_generation_matches_tile_rules():
+    # the grid rules mark exactly the tiles the per tile rules (`tile_grow`, `tile_senescence`) would mutate
+    rng: np.random.Generator = np.random.default_rng(seed=21)
+    codes: np.ndarray = np.array(
+        [TILE_CODES.index(tile_type) for tile_type in (OCEAN, WATER, DIRT, GRASS, FOREST, ROCK, SHORE)], dtype=np.uint8
+    )
+    for _ in range(5):
+        types: np.ndarray = rng.choice(codes, size=(9, 11))
+        populated: np.ndarray = rng.random(types.shape) < 0.6
+        decisions: dict[str, tuple[float, TileType]] = asyncio.run(
+            _per_tile_decisions(types=types, populated=populated)
+        )
+
+        expected: dict[str, tuple[float, TileType]] = {}
+        for index in np.flatnonzero(eligible(types=types, populated=populated)):
+            tile_type: TileType = TILE_CODES[types.flat[index]]
+            if tile_type == DIRT:
+                near_water: bool = (distance_field(sources=types == TILE_CODES.index(WATER))).flat[index] == 1
+                expected[f"t{index}"] = (GRASS_BY_WATER if near_water else GRASS_BY_FOREST, GRASS)
+            elif tile_type == GRASS and not populated.flat[index]:
+                expected[f"t{index}"] = (1, DIRT)
+            elif tile_type == GRASS:
+                expected[f"t{index}"] = (FOREST_BY_GRASS, FOREST)
+            else:
+                expected[f"t{index}"] = (1, GRASS)
+
+        # (a barren grass tile is first rolled for forest growth, senescence is then certain)
+        assert decisions == expected
+
+
+def test_tile_generation_order_independent():
+    # every tile reads the previous generation only, so mirroring the grid mirrors the result
+    class Always:
+        @staticmethod
+        def random(shape: tuple[int, int]) -> np.ndarray:
+            return np.zeros(shape)
+
+    rng: np.random.Generator = np.random.default_rng(seed=4)
+    codes: np.ndarray = np.array(
+        [TILE_CODES.index(tile_type) for tile_type in (OCEAN, WATER, DIRT, GRASS, FOREST)], dtype=np.uint8
+    )
+    types: np.ndarray = rng.choice(codes, size=(12, 12))
+    populated: np.ndarray = rng.random(types.shape) < 0.5
+
+    generated: np.ndarray = tile_generation(types=types, populated=populated, rng=Always())
+    for flip in (np.fliplr, np.flipud, np.transpose):
+        assert (tile_generation(types=flip(types), populated=flip(populated), rng=Always()) == flip(generated)).all()
+    # growth does not cascade within a generation
+    assert (
+        (generated == TILE_CODES.index(GRASS)) & (types == TILE_CODES.index(DIRT))
+        <= eligible(types=types, populated=populated)
+    ).all()
@@ -0,0 +1,77 @@
+import numpy as np
+
+from shapeandshare.darkness.sdk.contracts.types.tile import TileType
+from shapeandshare.darkness.server.clients.grid import TILE_CODES
+from shapeandshare.darkness.server.factories.chunk.terrain import (
+    UNREACHABLE,
+    distance_field,
+    enclosed,
+    generate_terrain,
+    label_components,
+)
+
+OCEAN: int = TILE_CODES.index(TileType.OCEAN)
+WATER: int = TILE_CODES.index(TileType.WATER)
+SHORE: int = TILE_CODES.index(TileType.SHORE)
+DIRT: int = TILE_CODES.index(TileType.DIRT)
+ROCK: int = TILE_CODES.index(TileType.ROCK)
+
+
+def test_generate_terrain():
+    blank: np.ndarray = np.full((24, 32), OCEAN, dtype=np.uint8)
+    generated: np.ndarray = generate_terrain(types=blank, biome=TileType.GRASS, rng=np.random.default_rng(seed=42))
+
+    assert generated.shape == (24, 32)
+    assert generated.dtype == np.uint8
+    assert (blank == OCEAN).all()
+    assert set(np.unique(generated).tolist()) <= {OCEAN, WATER, SHORE, ROCK, TILE_CODES.index(TileType.GRASS)}
+    assert (generated < len(TILE_CODES)).all()
+
+    # seeded generation is reproducible
+    again: np.ndarray = generate_terrain(types=blank, biome=TileType.GRASS, rng=np.random.default_rng(seed=42))
+    assert (again == generated).all()
+
+
+def test_generate_terrain_brackish():
+    # an inland ocean body becomes water, one reaching the edge stays ocean (and erodes its neighbors to shore)
+    types: np.ndarray = np.full((7, 7), DIRT, dtype=np.uint8)
+    types[2:4, 2:4] = OCEAN
+    types[5:7, 6] = OCEAN
+
+    generated: np.ndarray = generate_terrain(
+        types=types, biome=TileType.DIRT, rng=np.random.default_rng(seed=0), mutate=0, rock=0
+    )
+    assert (generated[2:4, 2:4] == WATER).all()
+    assert (generated[5:7, 6] == OCEAN).all()
+    assert generated[4, 6] == SHORE
+    assert (generated[5:7, 5] == SHORE).all()
+    assert generated[1, 2] == DIRT
+    assert (generated == OCEAN).sum() == 2
+
+
+def test_enclosed():
+    mask: np.ndarray = np.zeros((5, 6), dtype=bool)
+    mask[2, 2:4] = True
+    mask[0:2, 5] = True
+    mask[4, 0] = True
+
+    labels, count = label_components(mask=mask)
+    assert count == 3
+    assert (labels[mask] > 0).all()
+    assert (labels[~mask] == 0).all()
+
+    inland: np.ndarray = enclosed(mask=mask)
+    assert inland.sum() == 2
+    assert inland[2, 2:4].all()
+
+
+def test_distance_field():
+    sources: np.ndarray = np.zeros((3, 5), dtype=bool)
+    sources[1, 0] = True
+
+    distances: np.ndarray = distance_field(sources=sources)
+    assert distances[1].tolist() == [0, 1, 2, 3, 4]
+    assert distances[0, 4] == 5
+
+    limited: np.ndarray = distance_field(sources=sources, limit=2)
+    assert limited[1].tolist() == [0, 1, 2, UNREACHABLE, UNREACHABLE]
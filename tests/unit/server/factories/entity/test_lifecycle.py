@@ -0,0 +1,143 @@
+import numpy as np
+
+from shapeandshare.darkness.sdk.contracts.dtos.entities.partial import EntityPartial
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.address import Address
+from shapeandshare.darkness.sdk.contracts.types.entity import EntityType
+from shapeandshare.darkness.server.clients.grid import ENTITY_CODES
+from shapeandshare.darkness.server.factories.entity.lifecycle import (
+    MUTATION_RATES,
+    UNSCHEDULED,
+    EntityArrays,
+    advance,
+    next_due,
+    rolled,
+    sample_transitions,
+    transition,
+)
+
+TYPES: list[EntityType] = [EntityType.GRASS, EntityType.TREE, EntityType.FISH, EntityType.FUNGI]
+
+
+def _types(count: int, rng: np.random.Generator) -> np.ndarray:
+    # random type codes of the registered entity types
+    codes: np.ndarray = np.array([ENTITY_CODES.index(entity_type) for entity_type in TYPES], dtype=np.int64)
+    return rng.choice(codes, size=count)
+
+
+def test_entity_arrays():
+    # rows are ordered by id, entities without a registered behavior are left out
+    arrays: EntityArrays = EntityArrays(
+        entities=[
+            EntityPartial(id="b", tile_id="t1", entity_type=EntityType.TREE, state=2, amount=3.0, due=9),
+            EntityPartial(id="a", tile_id="t0", entity_type=EntityType.GRASS),
+            EntityPartial(id="c", tile_id="t0", entity_type=EntityType.UNKNOWN),
+        ]
+    )
+    assert arrays.ids == ["a", "b"]
+    assert arrays.tile_ids == ["t0", "t1"]
+    assert arrays.types.tolist() == [ENTITY_CODES.index(EntityType.GRASS), ENTITY_CODES.index(EntityType.TREE)]
+    assert arrays.dues.tolist() == [UNSCHEDULED, 9]
+
+    # only the changed fields of the changed rows are patched
+    patches: list[tuple[Address, dict]] = arrays.patches(
+        address=Address(world_id="w", chunk_id="c"),
+        states=np.array([0, 3]),
+        amounts=np.array([0.0, 3.0]),
+        dues=np.array([UNSCHEDULED, 9]),
+    )
+    assert len(patches) == 1
+    assert patches[0][0].entity_id == "b"
+    assert patches[0][0].tile_id == "t1"
+    assert patches[0][1] == {"state": 3}
+
+
+def test_empty_entity_arrays():
+    arrays: EntityArrays = EntityArrays(entities=[])
+    rng: np.random.Generator = np.random.default_rng(seed=1)
+    assert len(arrays) == 0
+
+    states, amounts = advance(
+        types=arrays.types, states=arrays.states, amounts=arrays.amounts, transitions=np.zeros(0, dtype=np.int64)
+    )
+    assert states.shape == (0,)
+    assert amounts.shape == (0,)
+
+    transitions, dues = sample_transitions(types=arrays.types, ticks=10, rng=rng, dues=arrays.dues, tick=5)
+    assert transitions.shape == (0,)
+    assert dues.shape == (0,)
+    assert next_due(tick=5, types=arrays.types, rng=rng).shape == (0,)
+    assert arrays.patches(address=Address(world_id="w", chunk_id="c"), states=states, amounts=amounts) == []
+
+
+def test_advance_matches_single_steps():
+    # advancing by n transitions at once is n single transitions, headroom (`max_amount`) included
+    rng: np.random.Generator = np.random.default_rng(seed=11)
+    count: int = 2000
+    types: np.ndarray = _types(count=count, rng=rng)
+    states: np.ndarray = rng.integers(0, 4, size=count)
+    amounts: np.ndarray = rng.choice([0.0, 0.5, 3.0, 14.5, 15.0, 16.0, 17.0], size=count)
+    transitions: np.ndarray = rng.integers(0, 80, size=count)
+
+    stepped_states, stepped_amounts = states, amounts
+    for step in range(int(transitions.max())):
+        stepped_states, stepped_amounts = transition(
+            types=types, states=stepped_states, amounts=stepped_amounts, mask=transitions > step
+        )
+
+    advanced_states, advanced_amounts = advance(types=types, states=states, amounts=amounts, transitions=transitions)
+    assert (advanced_states == stepped_states).all()
+    assert np.allclose(advanced_amounts, stepped_amounts)
+    # growth stops once at `max_amount`, amounts already there do not grow
+    assert (advanced_amounts[amounts >= 16.0] == amounts[amounts >= 16.0]).all()
+    assert (advanced_amounts < np.maximum(amounts, 16.0) + 1).all()
+
+
+def test_sample_transitions_matches_single_steps():
+    # sampled transition counts over n ticks are distributed as n rolled ticks (binomial n, rate)
+    rng: np.random.Generator = np.random.default_rng(seed=3)
+    count: int = 20000
+    ticks: int = 50
+    types: np.ndarray = _types(count=count, rng=rng)
+
+    stepped: np.ndarray = np.zeros(count, dtype=np.int64)
+    for _ in range(ticks):
+        stepped += rolled(types=types, draws=rng.random(count))
+    sampled, dues = sample_transitions(types=types, ticks=ticks, rng=rng)
+
+    rate: float = float(MUTATION_RATES[types].mean())
+    assert dues is None
+    for transitions in (stepped, sampled):
+        assert abs(transitions.mean() - ticks * rate) < 0.02
+        assert abs(transitions.var() - ticks * rate * (1 - rate)) < 0.03
+    assert abs(stepped.mean() - sampled.mean()) < 0.03
+
+
+def test_sample_transitions_single_tick():
+    rng: np.random.Generator = np.random.default_rng(seed=5)
+    types: np.ndarray = _types(count=50000, rng=rng)
+    transitions, _ = sample_transitions(types=types, ticks=1, rng=rng)
+    assert set(transitions.tolist()) <= {0, 1}
+    assert abs(transitions.mean() - MUTATION_RATES[types].mean()) < 0.003
+
+
+def test_sample_transitions_scheduled():
+    # entities due within the window transition at least once, those due after keep their schedule
+    rng: np.random.Generator = np.random.default_rng(seed=7)
+    types: np.ndarray = _types(count=6, rng=rng)
+    dues: np.ndarray = np.array([UNSCHEDULED, 11, 15, 16, 40, UNSCHEDULED], dtype=np.int64)
+
+    transitions, next_dues = sample_transitions(types=types, ticks=5, rng=rng, dues=dues, tick=10)
+    assert (transitions[1:3] >= 1).all()
+    assert (transitions[3:5] == 0).all()
+    assert next_dues[3:5].tolist() == [16, 40]
+    assert (next_dues[[0, 1, 2, 5]] > 15).all()
+
+
+def test_next_due():
+    # transitions are geometric, always after the tick of the draw, a mean 1 / rate ticks on
+    rng: np.random.Generator = np.random.default_rng(seed=9)
+    types: np.ndarray = _types(count=50000, rng=rng)
+    dues: np.ndarray = next_due(tick=100, types=types, rng=rng)
+    assert dues.dtype == np.int64
+    assert (dues > 100).all()
+    assert abs((dues - 100).mean() - (1 / MUTATION_RATES[types]).mean()) < 3
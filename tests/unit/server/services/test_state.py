@@ -0,0 +1,201 @@
+import asyncio
+from typing import Callable
+
+from shapeandshare.darkness import (
+    ChunkCreateRequest,
+    ChunkDeleteRequest,
+    ChunkGetRequest,
+    ChunkRequest,
+    TileDeleteRequest,
+    TileType,
+    WorldCreateRequest,
+    WorldGetRequest,
+)
+from shapeandshare.darkness.sdk.contracts.dtos.entities.entity import Entity
+from shapeandshare.darkness.sdk.contracts.dtos.sdk.requests.chunk.fastforward import ChunkFastForwardRequest
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.address import Address
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.chunk import Chunk
+from shapeandshare.darkness.sdk.contracts.dtos.tiles.tile import Tile
+from shapeandshare.darkness.sdk.contracts.types.dao_document import DaoDocumentType
+from shapeandshare.darkness.server.clients.storage.abstract import AbstractStorage, StorageWrite
+from shapeandshare.darkness.server.services.state import StateService
+
+
+async def _create_chunk(state_service: StateService, dimensions: tuple[int, int], biome: TileType) -> ChunkRequest:
+    world_id: str = await state_service.world_create(request=WorldCreateRequest(name="test"))
+    chunk_id: str = await state_service.chunk_create(
+        request=ChunkCreateRequest(world_id=world_id, dimensions=dimensions, biome=biome)
+    )
+    return ChunkRequest(world_id=world_id, chunk_id=chunk_id)
+
+
+def test_chunk_quantum_after_tile_delete(state_service: StateService):
+    # neighbors of a tile deleted without cascading still point at it, the chunk is then ticked tile by tile
+    async def run() -> Chunk:
+        request: ChunkRequest = await _create_chunk(state_service=state_service, dimensions=(6, 6), biome=TileType.DIRT)
+        chunk: Chunk = await state_service.chunk_lite_get(
+            request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        )
+        deleted: str = sorted(tile_id for tile_id in chunk.ids if tile_id != chunk.origin)[0]
+        await state_service.tile_delete(
+            request=TileDeleteRequest(
+                world_id=request.world_id, chunk_id=request.chunk_id, tile_id=deleted, cascade=False, parent=True
+            )
+        )
+
+        for _ in range(3):
+            await state_service.chunk_quantum(request=request)
+        return await state_service.chunk_get(
+            request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        )
+
+    chunk: Chunk = asyncio.run(run())
+    assert len(chunk.contents) == 35
+
+
+def test_chunk_pack_round_trip(state_service: StateService):
+    # names, rbacs and event schedules survive packing and unpacking
+    async def run() -> tuple[Chunk, Chunk]:
+        request: ChunkRequest = await _create_chunk(
+            state_service=state_service, dimensions=(4, 3), biome=TileType.GRASS
+        )
+        get_request: ChunkGetRequest = ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        await state_service.chunk_quantum(request=request)
+
+        chunk: Chunk = await state_service.chunk_get(request=get_request)
+        tile: Tile = chunk.contents[chunk.origin]
+        address_tile: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id, tile_id=tile.id)
+        await state_service.daoclient.patch(address=address_tile, document={"name": "harbor", "rbac": {"a": 1}})
+        for entity_id in tile.ids:
+            await state_service.daoclient.patch(
+                address=Address.model_validate({**address_tile.model_dump(), "entity_id": entity_id}),
+                document={"name": "first", "rbac": {"b": 2}},
+            )
+
+        before: Chunk = await state_service.chunk_get(request=get_request)
+        assert await state_service.chunk_pack(request=request) == 12
+        assert await state_service.chunk_unpack(request=request) == 12
+        return before, await state_service.chunk_get(request=get_request)
+
+    before, after = asyncio.run(run())
+    assert after.contents.keys() == before.contents.keys()
+    for tile_id, tile in before.contents.items():
+        assert after.contents[tile_id].model_dump() == tile.model_dump()
+    assert before.contents[before.origin].name == "harbor"
+    assert any(entity.due is not None for tile in before.contents.values() for entity in tile.contents.values())
+
+
+def test_chunk_fast_forward(state_service: StateService):
+    # the chunk's clock moves past the window, and every entity is scheduled after it
+    async def run() -> tuple[list[int], Chunk]:
+        request: ChunkRequest = await _create_chunk(
+            state_service=state_service, dimensions=(8, 8), biome=TileType.GRASS
+        )
+        changed: list[int] = []
+        for ticks in (1, 500):
+            changed.append(
+                await state_service.chunk_fast_forward(
+                    request=ChunkFastForwardRequest(world_id=request.world_id, chunk_id=request.chunk_id, ticks=ticks)
+                )
+            )
+        return changed, await state_service.chunk_get(
+            request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        )
+
+    changed, chunk = asyncio.run(run())
+    entities: list[Entity] = [entity for tile in chunk.contents.values() for entity in tile.contents.values()]
+    assert chunk.tick == 501
+    assert len(entities) > 0
+    # the first pass schedules every entity
+    assert changed[0] == len(entities)
+    assert all(entity.due is not None and entity.due > 501 for entity in entities)
+    assert any(entity.state != 0 or entity.amount != 0 for entity in entities)
+
+
+def test_chunk_fast_forward_without_entities(state_service: StateService):
+    async def run() -> tuple[int, Chunk]:
+        request: ChunkRequest = await _create_chunk(state_service=state_service, dimensions=(4, 4), biome=TileType.DIRT)
+        address: Address = Address(world_id=request.world_id, chunk_id=request.chunk_id)
+        await state_service.daoclient.delete_scoped(address=address, doc_type=DaoDocumentType.ENTITY)
+        changed: int = await state_service.chunk_fast_forward(
+            request=ChunkFastForwardRequest(world_id=request.world_id, chunk_id=request.chunk_id, ticks=10)
+        )
+        return changed, await state_service.chunk_lite_get(
+            request=ChunkGetRequest(world_id=request.world_id, chunk_id=request.chunk_id)
+        )
+
+    changed, chunk = asyncio.run(run())
+    assert changed == 0
+    assert chunk.tick == 10
+
+
+async def _strip_parents(storage: AbstractStorage) -> None:
+    # rewrites every document as written before parent ids (and tile positions) were stamped
+    for doc_type, fields in (
+        (DaoDocumentType.CHUNK, ["world_id"]),
+        (DaoDocumentType.TILE, ["world_id", "chunk_id", "x", "y"]),
+        (DaoDocumentType.ENTITY, ["world_id", "chunk_id", "tile_id"]),
+    ):
+        documents: list[dict] = [document async for document in storage.find(doc_type=doc_type, query={})]
+        await storage.bulk_write(
+            doc_type=doc_type,
+            operations=[
+                StorageWrite(
+                    query={"id": document["id"]},
+                    replacement={key: value for key, value in document.items() if key not in fields and key != "_id"},
+                )
+                for document in documents
+            ],
+        )
+
+
+def test_backfill_parents(state_service: StateService):
+    # documents of the earlier layout are stamped, then simulated and cascade deleted like any other
+    async def run() -> tuple[int, int, int, int, int]:
+        request: ChunkRequest = await _create_chunk(
+            state_service=state_service, dimensions=(4, 4), biome=TileType.GRASS
+        )
+        storage: AbstractStorage = state_service.daoclient.storage
+        await _strip_parents(storage=storage)
+
+        stamped: int = await state_service.daoclient.backfill_parents()
+        restamped: int = await state_service.daoclient.backfill_parents()
+
+        for _ in range(50):
+            await state_service.chunk_quantum(request=request)
+        scheduled: int = len(
+            [document async for document in storage.find(doc_type=DaoDocumentType.ENTITY, query={"due": {"$gt": 0}})]
+        )
+
+        await state_service.chunk_delete(
+            request=ChunkDeleteRequest(world_id=request.world_id, chunk_id=request.chunk_id, cascade=True, parent=True)
+        )
+        remaining: list[int] = [
+            len([document async for document in storage.find(doc_type=doc_type, query={})])
+            for doc_type in (DaoDocumentType.TILE, DaoDocumentType.ENTITY)
+        ]
+        return stamped, restamped, scheduled, *remaining
+
+    stamped, restamped, scheduled, tiles, entities = asyncio.run(run())
+    assert stamped > 1 + 16
+    assert restamped == 0
+    assert scheduled > 0
+    assert tiles == 0
+    assert entities == 0
+
+
+def test_seeded_runs_repeat(state_service_factory: Callable[[int | None], StateService]):
+    # the same requests under the same seed create (and simulate) the very same world
+    async def run(state_service: StateService) -> dict:
+        world_id: str = await state_service.world_create(request=WorldCreateRequest(name="test"))
+        for bulk in (False, True):
+            chunk_id: str = await state_service.chunk_create(
+                request=ChunkCreateRequest(world_id=world_id, dimensions=(16, 16), biome=TileType.GRASS, bulk=bulk)
+            )
+            for _ in range(5):
+                await state_service.chunk_quantum(request=ChunkRequest(world_id=world_id, chunk_id=chunk_id))
+        return (await state_service.world_get(request=WorldGetRequest(id=world_id))).model_dump(mode="json")
+
+    first: dict = asyncio.run(run(state_service=state_service_factory(42)))
+    assert asyncio.run(run(state_service=state_service_factory(42))) == first
+    assert asyncio.run(run(state_service=state_service_factory(43))) != first